@@ -0,0 +1,57 @@
+"""Shared fixtures for the voyager test suite."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from voyager.llm import RECURSION_GUARD_VAR, LLMResult
+
+# Bundled schemas and prompts live under the repo's .claude directory
+PLUGIN_ROOT = Path(__file__).resolve().parents[2] / ".claude"
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run against an empty project in tmp_path, outside any internal LLM call."""
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+    monkeypatch.setenv("CLAUDE_PLUGIN_ROOT", str(PLUGIN_ROOT))
+    monkeypatch.delenv(RECURSION_GUARD_VAR, raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def fake_agent() -> Callable[[Path, dict[str, Any] | Callable[[str], dict[str, Any]]], MagicMock]:
+    """Build call_claude stand-ins that write a JSON file like the agent would.
+
+    The factory takes the file to write and either its content or a function
+    that derives the content from the prompt.
+    """
+
+    def make(path: Path, data: dict[str, Any] | Callable[[str], dict[str, Any]]) -> MagicMock:
+        def call(prompt: str, **_kwargs: Any) -> LLMResult:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(data(prompt) if callable(data) else data), encoding="utf-8")
+            return LLMResult(success=True, files=[str(path)])
+
+        return MagicMock(side_effect=call)
+
+    return make
+
+
+@pytest.fixture
+def make_skill() -> Callable[..., Path]:
+    """Build skill directories containing a minimal SKILL.md."""
+
+    def make(root: Path, name: str, description: str = "Helps with things") -> Path:
+        skill = root / name
+        skill.mkdir(parents=True)
+        (skill / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {description}\n---\nBody\n", encoding="utf-8")
+        return skill
+
+    return make
@@ -0,0 +1,87 @@
+"""Tests for voyager.retrieval.analyzer module."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from voyager.llm import RECURSION_GUARD_VAR, LLMResult
+from voyager.retrieval.analyzer import analyze_skill, analyze_skills_batch
+
+
+class TestAnalyzeSkillsBatch:
+    """Tests for analyze_skills_batch function."""
+
+    def test_preserves_input_order_and_skips_failures(self, tmp_path: Path, make_skill: Callable[..., Path]) -> None:
+        """Should return successful results in input order and report failures."""
+        paths = [make_skill(tmp_path, "b"), tmp_path / "missing", make_skill(tmp_path, "a")]
+        reported: dict[str, bool] = {}
+
+        results = analyze_skills_batch(
+            paths,
+            skip_llm=True,
+            on_result=lambda path, error: reported.__setitem__(path.name, error is None),
+        )
+
+        assert [m.skill_id for m in results] == ["b", "a"]
+        assert reported == {"a": True, "b": True, "missing": False}
+
+    def test_accepts_generator(self, tmp_path: Path, make_skill: Callable[..., Path]) -> None:
+        """Should analyze skills from a lazy iterable such as iter_skills."""
+        paths = [make_skill(tmp_path, "a"), make_skill(tmp_path, "b")]
+
+        results = analyze_skills_batch((p for p in paths), skip_llm=True)
+
+        assert [m.skill_id for m in results] == ["a", "b"]
+
+    def test_empty_input(self) -> None:
+        """Should return an empty list when there is nothing to analyze."""
+        assert analyze_skills_batch(iter([]), skip_llm=True) == []
+
+    def test_restores_recursion_guard(self, tmp_path: Path, make_skill: Callable[..., Path]) -> None:
+        """Should leave the recursion guard as it found it."""
+        env = os.environ.copy()
+        env.pop(RECURSION_GUARD_VAR, None)
+        with patch.dict(os.environ, env, clear=True):
+            analyze_skills_batch([make_skill(tmp_path, "a")], skip_llm=True)
+
+            assert RECURSION_GUARD_VAR not in os.environ
+
+
+class TestAnalysisCache:
+    """Tests for the on-disk analysis cache."""
+
+    def test_unchanged_skill_skips_llm(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, make_skill: Callable[..., Path]
+    ) -> None:
+        """Should call the LLM once per SKILL.md content."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        skill = make_skill(tmp_path, "docx")
+        result = LLMResult(success=True, output='{"purpose": "Edit docs", "example_queries": ["edit a docx"]}')
+
+        with patch("voyager.retrieval.analyzer.call_claude", return_value=result) as mock_call:
+            first = analyze_skill(skill)
+            second = analyze_skill(skill)
+
+        assert mock_call.call_count == 1
+        assert first.purpose == second.purpose == "Edit docs"
+        assert second.example_queries == ["edit a docx"]
+
+    def test_failed_llm_call_is_not_cached(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, make_skill: Callable[..., Path]
+    ) -> None:
+        """Should retry the LLM when the previous call failed."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        skill = make_skill(tmp_path, "docx")
+
+        with patch(
+            "voyager.retrieval.analyzer.call_claude", return_value=LLMResult(success=False, error="x")
+        ) as mock_call:
+            analyze_skill(skill)
+            analyze_skill(skill)
+
+        assert mock_call.call_count == 2
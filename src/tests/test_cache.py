@@ -0,0 +1,57 @@
+"""Tests for voyager.cache module."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from voyager.cache import MtimeCache
+from voyager.io import write_json
+
+
+def _loader(calls: list[Path]):
+    def load(path: Path) -> dict:
+        calls.append(path)
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    return load
+
+
+class TestMtimeCache:
+    """Tests for MtimeCache."""
+
+    def test_reuses_value_until_file_changes(self, tmp_path: Path) -> None:
+        """Should load once per on-disk version of the file."""
+        path = tmp_path / "state.json"
+        write_json(path, {"v": 1})
+        calls: list[Path] = []
+        cache = MtimeCache(_loader(calls), lambda: path)
+
+        assert cache.get() == {"v": 1}
+        assert cache.get(path) == {"v": 1}
+        assert len(calls) == 1
+
+        write_json(path, {"v": 2})
+
+        assert cache.get() == {"v": 2}
+        assert len(calls) == 2
+
+    def test_returns_independent_copies(self, tmp_path: Path) -> None:
+        """Should not let callers mutate the cached value."""
+        path = tmp_path / "state.json"
+        write_json(path, {"items": [1]})
+        cache = MtimeCache(_loader([]), lambda: path)
+
+        cache.get()["items"].append(2)
+
+        assert cache.get() == {"items": [1]}
+
+    def test_missing_file_is_not_cached(self, tmp_path: Path) -> None:
+        """Should call the loader every time while the file doesn't exist."""
+        calls: list[Path] = []
+        cache = MtimeCache(lambda p: calls.append(p) or {}, lambda: tmp_path / "missing.json")
+
+        cache.get()
+        cache.get()
+
+        assert len(calls) == 2
@@ -0,0 +1,43 @@
+"""Tests for voyager.retrieval.discovery module."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from voyager.retrieval.discovery import discover_all_skills, discover_skills_roots
+
+
+class TestDiscoverAllSkills:
+    """Tests for discover_all_skills function."""
+
+    def test_finds_nested_skills_and_skips_vendor_dirs(self, tmp_path: Path, make_skill: Callable[..., Path]) -> None:
+        """Should find skills at any depth but not inside vendor, build or hidden dirs."""
+        make_skill(tmp_path, "docx")
+        make_skill(tmp_path / "group", "pdf")
+        make_skill(tmp_path / "node_modules", "pkg")
+        make_skill(tmp_path / ".git", "hooks")
+        make_skill(tmp_path / ".cache", "old")
+        make_skill(tmp_path / "dist", "copy")
+
+        skills = discover_all_skills(roots=[tmp_path])
+
+        assert {s.name for s in skills} == {"docx", "pdf"}
+
+
+class TestDiscoverSkillsRoots:
+    """Tests for discover_skills_roots function."""
+
+    def test_returns_existing_dirs_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should keep existing candidates in order without duplicates."""
+        monkeypatch.setenv("CLAUDE_SKILLS_PATH", str(tmp_path))
+        (tmp_path / "file.txt").write_text("x", encoding="utf-8")
+
+        roots = discover_skills_roots(extra_paths=[tmp_path, tmp_path / "missing", tmp_path / "file.txt"])
+
+        assert roots.count(tmp_path) == 1
+        assert roots[0] == tmp_path
+        assert tmp_path / "missing" not in roots
+        assert tmp_path / "file.txt" not in roots
@@ -0,0 +1,43 @@
+"""Tests for voyager.fastjson module."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from voyager import fastjson
+
+DATA = {"name": "brain", "items": [1, 2.5, {"é": "ü"}], "empty": {}, "none": None, "flag": True}
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(fastjson, "orjson", None)
+
+
+@pytest.mark.usefixtures("backend")
+class TestFastJson:
+    """Tests that both backends produce the stdlib format."""
+
+    def test_dumps_indented_matches_json(self) -> None:
+        assert fastjson.dumps_indented(DATA) == json.dumps(DATA, indent=2, ensure_ascii=False)
+
+    def test_dumps_compact_matches_json(self) -> None:
+        assert fastjson.dumps_compact(DATA) == json.dumps(DATA, separators=(",", ":"), ensure_ascii=False)
+
+    def test_dumps_indented_capped(self) -> None:
+        full = json.dumps(DATA, indent=2, ensure_ascii=False)
+
+        assert fastjson.dumps_indented_capped(DATA, 10) == (full[:10], True)
+        assert fastjson.dumps_indented_capped(DATA, len(full)) == (full, False)
+
+    def test_loads_accepts_bytes(self) -> None:
+        assert fastjson.loads(fastjson.dumps_bytes(DATA)) == DATA
+
+    def test_loads_rejects_invalid_json(self) -> None:
+        with pytest.raises(ValueError):
+            fastjson.loads(b"not json")
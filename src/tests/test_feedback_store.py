@@ -0,0 +1,308 @@
+"""Tests for voyager.refinement.store module."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from voyager.refinement.store import OPTIMIZE_INTERVAL_SECONDS, FeedbackStore, SessionSummary, ToolExecution
+
+
+def _execution(skill: str | None = "docx", *, success: bool = True) -> ToolExecution:
+    return ToolExecution(
+        session_id="s1",
+        tool_name="Bash",
+        tool_input={"command": "ls"},
+        tool_response=None,
+        success=success,
+        error_message=None if success else "boom",
+        duration_ms=None,
+        skill_used=skill,
+        timestamp="2025-01-01T00:00:00+00:00",
+    )
+
+
+class TestSchema:
+    """Tests for schema creation and migration."""
+
+    def test_new_database_has_no_autoincrement(self, tmp_path: Path) -> None:
+        """Should create tool_executions with a plain rowid alias."""
+        db_path = tmp_path / "feedback.db"
+        FeedbackStore(db_path)
+
+        conn = sqlite3.connect(db_path)
+        (sql,) = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'tool_executions'").fetchone()
+        conn.close()
+
+        assert "AUTOINCREMENT" not in sql.upper()
+
+    def test_migrates_autoincrement_table(self, tmp_path: Path) -> None:
+        """Should rebuild a legacy AUTOINCREMENT table and keep its rows."""
+        db_path = tmp_path / "feedback.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE tool_executions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                tool_name TEXT NOT NULL,
+                tool_input TEXT,
+                tool_response TEXT,
+                success BOOLEAN NOT NULL,
+                error_message TEXT,
+                duration_ms INTEGER,
+                skill_used TEXT,
+                timestamp TEXT NOT NULL
+            )
+        """)
+        conn.execute(
+            "INSERT INTO tool_executions (session_id, tool_name, success, skill_used, timestamp) "
+            "VALUES ('s1', 'Bash', 1, 'docx', 't')"
+        )
+        conn.commit()
+        conn.close()
+
+        store = FeedbackStore(db_path)
+
+        conn = sqlite3.connect(db_path)
+        (sql,) = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'tool_executions'").fetchone()
+        conn.close()
+        assert "AUTOINCREMENT" not in sql.upper()
+        assert store.get_skill_stats()["docx"]["total"] == 1
+
+
+class TestConnection:
+    """Tests for per-connection settings."""
+
+    def test_uses_wal_with_normal_sync(self, tmp_path: Path) -> None:
+        """Should open connections in WAL mode with synchronous=NORMAL."""
+        store = FeedbackStore(tmp_path / "feedback.db")
+        conn = store._get_connection()
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        finally:
+            conn.close()
+
+
+class TestSessionSummaries:
+    """Tests for session summary persistence."""
+
+    def test_upsert_updates_existing_row(self, tmp_path: Path) -> None:
+        """Should update a session summary in place on conflict."""
+        store = FeedbackStore(tmp_path / "feedback.db")
+        for prompt in ("first", "second"):
+            store.log_session_summary(
+                SessionSummary(
+                    session_id="s1",
+                    prompt=prompt,
+                    tools_used=["Bash"],
+                    skills_detected=[],
+                    total_tool_calls=1,
+                    successful_calls=1,
+                    failed_calls=0,
+                    task_completed=True,
+                    completion_feedback=None,
+                    timestamp="t",
+                )
+            )
+
+        sessions = store.get_recent_sessions()
+        assert len(sessions) == 1
+        assert sessions[0]["prompt"] == "second"
+
+
+class TestStats:
+    """Tests for aggregate statistics."""
+
+    def test_skill_stats(self, tmp_path: Path) -> None:
+        """Should aggregate totals and success rate per skill."""
+        store = FeedbackStore(tmp_path / "feedback.db")
+        store.log_tool_execution(_execution())
+        store.log_tool_execution(_execution(success=False))
+        store.log_tool_execution(_execution(skill=None))
+
+        stats = store.get_skill_stats()
+
+        assert stats == {"docx": {"total": 2, "successful": 1, "failed": 1, "success_rate": 0.5}}
+
+    def test_maintain_runs_once_per_interval(self, tmp_path: Path) -> None:
+        """Should record the last run on disk so fresh stores skip maintenance."""
+        store = FeedbackStore(tmp_path / "feedback.db")
+        store.log_tool_execution(_execution())
+
+        assert store.maintain() is True
+        assert FeedbackStore(tmp_path / "feedback.db").maintain() is False
+        assert store.maintain(force=True) is True
+
+        stamp = store.maintenance_stamp_path
+        old = stamp.stat().st_mtime - OPTIMIZE_INTERVAL_SECONDS
+        os.utime(stamp, (old, old))
+        assert FeedbackStore(tmp_path / "feedback.db").maintain() is True
+        assert store.get_total_counts()["total_executions"] == 1
+
+    def test_all_stats_matches_individual_queries(self, tmp_path: Path) -> None:
+        """Should return the same aggregates as the single-purpose methods."""
+        store = FeedbackStore(tmp_path / "feedback.db")
+        store.log_tool_execution(_execution())
+        store.log_tool_execution(_execution(success=False))
+        store.log_tool_execution(_execution(skill=None))
+
+        all_stats = store.get_all_stats()
+
+        assert all_stats["skills"] == store.get_skill_stats()
+        assert all_stats["tools"] == store.get_tool_usage_stats()
+        assert all_stats["errors"] == [{"error": "boom", "count": 1, "tool": "Bash", "skill": "docx"}]
+
+    def test_top_errors_per_skill_matches_common_errors(self, tmp_path: Path) -> None:
+        """Should return each skill's errors as get_common_errors does."""
+        store = FeedbackStore(tmp_path / "feedback.db")
+        for skill in ("docx", "docx", "pdf"):
+            store.log_tool_execution(_execution(skill=skill, success=False))
+        store.log_tool_execution(_execution(skill=None, success=False))
+        store.log_tool_execution(_execution(skill="xlsx"))
+
+        top_errors = store.get_top_errors_per_skill(limit_per_skill=3)
+
+        assert top_errors == {
+            "docx": store.get_common_errors("docx", limit=3),
+            "pdf": store.get_common_errors("pdf", limit=3),
+        }
+        assert top_errors["docx"][0]["count"] == 2
+
+
+class TestHasExecutions:
+    """Tests for the read-only has_executions probe."""
+
+    def test_missing_and_empty_databases(self, tmp_path: Path) -> None:
+        """Should report no executions for missing, uninitialized, and empty databases."""
+        db_path = tmp_path / "feedback.db"
+        assert FeedbackStore.has_executions(db_path) is False
+
+        sqlite3.connect(db_path).close()
+        assert FeedbackStore.has_executions(db_path) is False
+
+        store = FeedbackStore(db_path)
+        assert FeedbackStore.has_executions(db_path) is False
+
+        store.log_tool_execution(_execution())
+        assert FeedbackStore.has_executions(db_path) is True
+
+    def test_does_not_initialize_schema(self, tmp_path: Path) -> None:
+        """Should leave an uninitialized database untouched."""
+        db_path = tmp_path / "feedback.db"
+        sqlite3.connect(db_path).close()
+
+        FeedbackStore.has_executions(db_path)
+
+        conn = sqlite3.connect(db_path)
+        tables = conn.execute("SELECT name FROM sqlite_master").fetchall()
+        conn.close()
+        assert tables == []
+
+
+class TestBulkLogging:
+    """Tests for log_tool_executions."""
+
+    def test_logs_all_rows(self, tmp_path: Path) -> None:
+        """Should insert every execution and return the row count."""
+        store = FeedbackStore(tmp_path / "feedback.db")
+
+        count = store.log_tool_executions([_execution(), _execution(success=False), _execution(skill=None)])
+
+        assert count == 3
+        assert store.get_total_counts()["total_executions"] == 3
+        assert store.get_session_executions("s1")[1].error_message == "boom"
+
+    def test_empty_input_is_noop(self, tmp_path: Path) -> None:
+        """Should return 0 without touching the database."""
+        store = FeedbackStore(tmp_path / "feedback.db")
+
+        assert store.log_tool_executions([]) == 0
+
+
+class TestArchive:
+    """Tests for the optional Parquet cold archive."""
+
+    def test_archive_moves_old_rows(self, tmp_path: Path) -> None:
+        """Should move old rows to Parquet and keep combined stats intact."""
+        pytest.importorskip("duckdb")
+        pytest.importorskip("pyarrow")
+
+        store = FeedbackStore(tmp_path / "feedback.db")
+        old = _execution()
+        old.timestamp = "2024-01-01T00:00:00+00:00"
+        store.log_tool_executions([old, _execution(success=False)])
+
+        archived = store.archive("2024-06-01T00:00:00+00:00")
+
+        assert archived == 1
+        assert store.get_total_counts()["total_executions"] == 1
+        assert list(store.archive_dir.glob("feedback-*.parquet"))
+        combined = store.get_skill_stats_with_archive()
+        assert combined["docx"]["total"] == 2
+        assert combined["docx"]["successful"] == 1
+
+    def test_archives_with_all_null_columns_combine(self, tmp_path: Path) -> None:
+        """Should read archives together when an earlier batch has no skills or errors."""
+        pytest.importorskip("duckdb")
+        pytest.importorskip("pyarrow")
+
+        store = FeedbackStore(tmp_path / "feedback.db")
+        unattributed = _execution(skill=None)
+        unattributed.timestamp = "2024-01-01T00:00:00+00:00"
+        store.log_tool_execution(unattributed)
+        assert store.archive("2024-02-01T00:00:00+00:00") == 1
+
+        failed = _execution(success=False)
+        failed.timestamp = "2024-03-01T00:00:00+00:00"
+        store.log_tool_execution(failed)
+        assert store.archive("2024-04-01T00:00:00+00:00") == 1
+
+        assert len(list(store.archive_dir.glob("feedback-*.parquet"))) == 2
+        assert store.get_skill_stats_with_archive() == {
+            "docx": {"total": 1, "successful": 0, "failed": 1, "success_rate": 0.0}
+        }
+
+    def test_failed_commit_removes_archive_file(self, tmp_path: Path) -> None:
+        """Should not leave a Parquet file behind for rows that stay live."""
+        pytest.importorskip("duckdb")
+        pytest.importorskip("pyarrow")
+
+        store = FeedbackStore(tmp_path / "feedback.db")
+        old = _execution()
+        old.timestamp = "2024-01-01T00:00:00+00:00"
+        store.log_tool_execution(old)
+
+        class FailingCommit:
+            def __init__(self, conn: sqlite3.Connection) -> None:
+                self._conn = conn
+
+            def __getattr__(self, name: str):
+                return getattr(self._conn, name)
+
+            def commit(self) -> None:
+                raise sqlite3.OperationalError("disk I/O error")
+
+        connect = store._get_connection
+        with (
+            patch.object(store, "_get_connection", lambda: FailingCommit(connect())),
+            pytest.raises(sqlite3.OperationalError),
+        ):
+            store.archive("2024-06-01T00:00:00+00:00")
+
+        assert store.get_total_counts()["total_executions"] == 1
+        assert list(store.archive_dir.iterdir()) == []
+
+    def test_archive_without_matching_rows(self, tmp_path: Path) -> None:
+        """Should archive nothing when no rows are old enough."""
+        pytest.importorskip("pyarrow")
+
+        store = FeedbackStore(tmp_path / "feedback.db")
+        store.log_tool_execution(_execution())
+
+        assert store.archive("2000-01-01T00:00:00+00:00") == 0
+        assert not store.archive_dir.exists()
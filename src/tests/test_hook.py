@@ -0,0 +1,34 @@
+"""Tests for voyager.cli.hook module."""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import typer
+
+from voyager.cli import hook
+from voyager.config import get_feedback_db_path
+from voyager.refinement.store import FeedbackStore
+
+
+class TestPostToolUse:
+    """Tests for the per-tool-use feedback hook."""
+
+    def test_logs_without_maintenance(self, project_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should log the execution without running optimize or a WAL checkpoint."""
+        payload = {"session_id": "s1", "tool_name": "Bash", "tool_input": {"command": "ls"}}
+        monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(payload)))
+
+        with (
+            patch("voyager.refinement.detector.SkillDetector", side_effect=RuntimeError),
+            patch.object(FeedbackStore, "maintain") as maintain,
+            pytest.raises(typer.Exit),
+        ):
+            hook.post_tool_use()
+
+        maintain.assert_not_called()
+        assert FeedbackStore(get_feedback_db_path()).get_total_counts()["total_executions"] == 1
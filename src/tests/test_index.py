@@ -0,0 +1,187 @@
+"""Tests for voyager.retrieval.index module."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import types
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from voyager.retrieval import index as index_module
+from voyager.retrieval.index import SkillIndex
+
+
+@pytest.fixture
+def simple_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, make_skill: Callable[..., Path]) -> SkillIndex:
+    monkeypatch.setattr(index_module, "RAGATOUILLE_AVAILABLE", False)
+    skills = tmp_path / "skills"
+    make_skill(skills, "docx", "Edit Word documents")
+    make_skill(skills, "pdf", "Fill PDF forms and edit pages")
+    make_skill(skills, "xlsx", "Build spreadsheets")
+
+    index = SkillIndex(index_path=tmp_path / "index")
+    assert index.build(skill_roots=[skills], skip_llm=True) == 3
+    return index
+
+
+class TestSimpleSearch:
+    """Tests for the simple text index."""
+
+    def test_ranks_by_term_and_phrase_matches(self, simple_index: SkillIndex) -> None:
+        """Should rank exact phrase matches above partial term matches."""
+        results = simple_index.search("pdf forms", k=5)
+
+        assert [r.skill_id for r in results][0] == "pdf"
+        assert results[0].score == 4.0
+
+    def test_matches_substrings(self, simple_index: SkillIndex) -> None:
+        """Should keep substring semantics (e.g. 'spread' matches 'spreadsheets')."""
+        results = simple_index.search("spread", k=5)
+
+        assert [r.skill_id for r in results] == ["xlsx"]
+
+    def test_omits_zero_scores(self, simple_index: SkillIndex) -> None:
+        """Should not return skills that match nothing."""
+        assert simple_index.search("kubernetes", k=5) == []
+
+    def test_reuses_parsed_index_between_searches(self, simple_index: SkillIndex) -> None:
+        """Should parse the index file once until it changes on disk."""
+        simple_index.search("pdf", k=5)
+        corpus = simple_index._load_simple_corpus()
+
+        simple_index.search("docx", k=5)
+
+        assert simple_index._load_simple_corpus() is corpus
+
+    def test_repeat_query_hits_result_cache(self, simple_index: SkillIndex) -> None:
+        """Should answer a repeated (stripped) query without searching again."""
+        first = simple_index.search("pdf forms", k=5)
+
+        with patch.object(simple_index, "_search_simple") as search:
+            second = simple_index.search("  pdf forms ", k=5)
+
+        search.assert_not_called()
+        assert second == first
+        assert second[0] is not first[0]
+
+    def test_result_cache_keys_on_searched_query(self, simple_index: SkillIndex) -> None:
+        """Should search again for a query that differs in case, and search the stripped text."""
+        simple_index.search("pdf forms", k=5)
+
+        with patch.object(simple_index, "_search_simple", return_value=[]) as search:
+            simple_index.search(" PDF forms ", k=5)
+
+        search.assert_called_once_with("PDF forms", 5)
+
+    def test_result_cache_invalidated_by_rebuild(self, simple_index: SkillIndex) -> None:
+        """Should search again once the index files change on disk."""
+        simple_index.search("pdf", k=5)
+        mtime = simple_index._metadata_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(simple_index._metadata_path, ns=(mtime, mtime))
+
+        with patch.object(simple_index, "_search_simple", return_value=[]) as search:
+            assert simple_index.search("pdf", k=5) == []
+
+        search.assert_called_once()
+
+    def test_reads_legacy_documents_layout(self, simple_index: SkillIndex) -> None:
+        """Should still search an index written with the older documents dict."""
+        simple_index._simple_index_path.write_text(
+            json.dumps({"documents": {"pdf": "Skill: pdf\nFill PDF forms"}, "metadata": {}}),
+            encoding="utf-8",
+        )
+
+        assert [r.skill_id for r in simple_index.search("pdf forms", k=5)] == ["pdf"]
+
+
+class TestDiskQueryCache:
+    """Tests for the on-disk result cache shared across SkillIndex instances."""
+
+    def test_fresh_instance_reuses_cached_results(self, simple_index: SkillIndex) -> None:
+        """Should answer a repeat query from disk without loading or searching the index."""
+        first = SkillIndex(index_path=simple_index.index_path, disk_cache=True).search("pdf forms", k=5)
+
+        again = SkillIndex(index_path=simple_index.index_path, disk_cache=True)
+        with patch.object(again, "_search_simple") as search:
+            second = again.search("pdf forms ", k=5)
+
+        search.assert_not_called()
+        assert again._metadata is None
+        assert second == first
+
+    def test_disabled_by_default(self, simple_index: SkillIndex) -> None:
+        """Should not read or write the cache unless enabled."""
+        simple_index.search("pdf", k=5)
+
+        assert not (simple_index.index_path / "query_cache").exists()
+
+    def test_expired_entry_is_ignored(self, simple_index: SkillIndex, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should search again once the cached entry is older than the TTL."""
+        SkillIndex(index_path=simple_index.index_path, disk_cache=True).search("pdf", k=5)
+        monkeypatch.setattr(index_module, "QUERY_DISK_CACHE_TTL_SECONDS", -1)
+
+        again = SkillIndex(index_path=simple_index.index_path, disk_cache=True)
+        with patch.object(again, "_search_simple", return_value=[]) as search:
+            assert again.search("pdf", k=5) == []
+
+        search.assert_called_once()
+
+    def test_evicts_least_recently_used(self, simple_index: SkillIndex, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should keep at most the configured number of entries."""
+        monkeypatch.setattr(index_module, "QUERY_DISK_CACHE_MAX_ENTRIES", 2)
+        index = SkillIndex(index_path=simple_index.index_path, disk_cache=True)
+        for query in ("pdf", "docx", "xlsx"):
+            index.search(query, k=5)
+
+        assert len(list((simple_index.index_path / "query_cache").glob("*.json"))) == 2
+
+
+class TestColbertLoading:
+    """Tests for the per-process ColBERT model cache."""
+
+    def test_from_index_called_once_per_dir(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should reuse the loaded model for repeated loads of the same index."""
+        model = MagicMock()
+        fake = types.SimpleNamespace(RAGPretrainedModel=model)
+        monkeypatch.setitem(sys.modules, "ragatouille", fake)
+        index_module._load_rag.cache_clear()
+
+        try:
+            first = index_module._load_rag("/idx/a")
+            second = index_module._load_rag("/idx/a")
+            index_module._load_rag("/idx/b")
+        finally:
+            index_module._load_rag.cache_clear()
+
+        assert first is second
+        assert model.from_index.call_count == 2
+
+
+class TestColbertBuild:
+    """Tests for building the ColBERT index."""
+
+    def test_passes_embed_batch_size(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, make_skill: Callable[..., Path]
+    ) -> None:
+        """Should encode documents in batches of the requested size, shortest first."""
+        model = MagicMock()
+        monkeypatch.setitem(sys.modules, "ragatouille", types.SimpleNamespace(RAGPretrainedModel=model))
+        monkeypatch.setattr(index_module, "RAGATOUILLE_AVAILABLE", True)
+        skills = tmp_path / "skills"
+        make_skill(skills, "docx", "Edit Word documents and track changes in long reports")
+        make_skill(skills, "pdf", "Fill PDF forms")
+
+        index = SkillIndex(index_path=tmp_path / "index")
+        try:
+            assert index.build(skill_roots=[skills], skip_llm=True, embed_batch_size=64) == 2
+        finally:
+            index_module._load_rag.cache_clear()
+
+        kwargs = model.from_pretrained.return_value.index.call_args.kwargs
+        assert kwargs["bsize"] == 64
+        assert kwargs["document_ids"] == ["pdf", "docx"]
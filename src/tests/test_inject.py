@@ -0,0 +1,78 @@
+"""Tests for voyager.scripts.brain.inject module."""
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from voyager.scripts.brain import inject
+
+
+class TestSnapshotCache:
+    """Tests for the SessionStart snapshot cache."""
+
+    @pytest.fixture(autouse=True)
+    def _project_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        # inject_from_stdin creates the state dir before snapshotting
+        (tmp_path / ".claude" / "voyager").mkdir(parents=True)
+
+    def test_reuses_snapshot_for_unchanged_repo(self, tmp_path: Path) -> None:
+        """Should snapshot once for back-to-back calls on the same repo."""
+        with patch.object(inject, "snapshot_to_json", return_value={"root": "x"}) as snap:
+            first = inject._get_snapshot_cached(str(tmp_path))
+            second = inject._get_snapshot_cached(str(tmp_path))
+
+        assert snap.call_count == 1
+        assert first == second == {"root": "x"}
+
+    def test_expired_cache_is_refreshed(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should take a new snapshot once the TTL has passed."""
+        monkeypatch.setattr(inject, "SNAPSHOT_CACHE_TTL_SECONDS", -1)
+        with patch.object(inject, "snapshot_to_json", return_value={"root": "x"}) as snap:
+            inject._get_snapshot_cached(str(tmp_path))
+            inject._get_snapshot_cached(str(tmp_path))
+
+        assert snap.call_count == 2
+
+
+class TestBuildContext:
+    """Tests for build_context."""
+
+    def test_omits_snapshot_section_when_none(self) -> None:
+        """Should leave out the repo snapshot section for --no-snapshot."""
+        context = inject.build_context("# Brain", None, None)
+
+        assert "## Repo Snapshot" not in context
+        assert "# Brain" in context
+
+
+class TestHookIO:
+    """Tests for hook stdin/stdout handling."""
+
+    def test_reads_bytes_from_stdin(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should parse hook input from the binary stdin buffer."""
+        stdin = io.TextIOWrapper(io.BytesIO('{"cwd": "/tmp/é"}'.encode()))
+        monkeypatch.setattr(sys, "stdin", stdin)
+
+        assert inject._read_hook_input() == {"cwd": "/tmp/é"}
+
+    @pytest.mark.parametrize("raw", [b"", b"not json", b"[1, 2]"])
+    def test_invalid_input_is_empty(self, raw: bytes, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should fall back to an empty dict for empty, invalid, or non-object input."""
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(raw)))
+
+        assert inject._read_hook_input() == {}
+
+    def test_output_round_trips(self, capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+        """Should write one JSON line to stdout."""
+        inject.write_hook_output({"suppressOutput": True, "text": "é"})
+
+        out = capsysbinary.readouterr().out
+        assert out.endswith(b"\n")
+        assert json.loads(out) == {"suppressOutput": True, "text": "é"}
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 from voyager.io import (
@@ -11,7 +12,9 @@ from voyager.io import (
     read_file,
     read_json,
     read_jsonl,
+    read_static_file,
     safe_unlink,
+    tail_jsonl,
     write_file,
     write_json,
     write_jsonl,
@@ -99,6 +102,13 @@ class TestReadJson:
         assert read_json(file) is None
         assert read_json(file, default={"fallback": True}) == {"fallback": True}
 
+    def test_returns_default_for_invalid_utf8(self, tmp_path: Path) -> None:
+        """Should return default instead of raising on undecodable bytes."""
+        file = tmp_path / "binary.json"
+        file.write_bytes(b'{"key": "\xff"}')
+
+        assert read_json(file, default={}) == {}
+
 
 class TestWriteFile:
     """Tests for write_file function."""
@@ -139,6 +149,18 @@ class TestWriteFile:
 
         assert file.read_text(encoding="utf-8") == "new content"
 
+    def test_skips_unchanged_content(self, tmp_path: Path) -> None:
+        """Should leave a file that already holds the content untouched."""
+        file = tmp_path / "same.txt"
+        write_file(file, "same content")
+        os.utime(file, ns=(0, 0))
+
+        assert write_file(file, "same content") is True
+        assert file.stat().st_mtime_ns == 0
+
+        assert write_file(file, "same content", force=True) is True
+        assert file.stat().st_mtime_ns != 0
+
     def test_no_temp_file_left_behind(self, tmp_path: Path) -> None:
         """Should not leave temp files after successful write."""
         file = tmp_path / "clean.txt"
@@ -200,6 +222,24 @@ class TestWriteJson:
         assert "🚀" in content
 
 
+class TestReadStaticFile:
+    """Tests for read_static_file function."""
+
+    def test_reads_each_path_once(self, tmp_path: Path) -> None:
+        file = tmp_path / "prompt.md"
+        file.write_text("v1", encoding="utf-8")
+        read_static_file.cache_clear()
+
+        assert read_static_file(str(file)) == "v1"
+        file.write_text("v2", encoding="utf-8")
+        assert read_static_file(str(file)) == "v1"
+
+        read_static_file.cache_clear()
+
+    def test_missing_file_returns_none(self, tmp_path: Path) -> None:
+        assert read_static_file(str(tmp_path / "missing.md")) is None
+
+
 class TestReadJsonl:
     """Tests for read_jsonl function."""
 
@@ -232,6 +272,16 @@ class TestReadJsonl:
 
         assert result.items == [{"a": 1}, {"b": 2}]
 
+    def test_counts_blank_lines_and_invalid_utf8(self, tmp_path: Path) -> None:
+        file = tmp_path / "data.jsonl"
+        file.write_bytes(b'{"a": 1}\n\n"\xff"\n[1]\n')
+
+        result = read_jsonl(file)
+
+        assert result.items == [{"a": 1}, [1]]
+        assert result.total_lines == 4
+        assert result.invalid_lines == 1
+
     def test_missing_file_returns_default(self, tmp_path: Path) -> None:
         file = tmp_path / "missing.jsonl"
 
@@ -240,6 +290,52 @@ class TestReadJsonl:
         assert result.items == [{"fallback": True}]
 
 
+class TestTailJsonl:
+    """Tests for tail_jsonl function."""
+
+    def test_parses_only_trailing_lines(self, tmp_path: Path) -> None:
+        file = tmp_path / "data.jsonl"
+        file.write_text("".join(f'{{"n": {i}}}\n' for i in range(10)) + "\n", encoding="utf-8")
+
+        result = tail_jsonl(file, 3)
+
+        assert result.items == [{"n": 7}, {"n": 8}, {"n": 9}]
+        assert result.total_lines == 11
+        assert result.invalid_lines == 0
+
+    def test_counts_invalid_lines_in_tail(self, tmp_path: Path) -> None:
+        file = tmp_path / "data.jsonl"
+        file.write_text('not-json\n{"a": 1}\nnot-json\n{"b": "é"}\n', encoding="utf-8")
+
+        result = tail_jsonl(file, 2)
+
+        assert result.items == [{"b": "é"}]
+        assert result.invalid_lines == 1
+
+    def test_line_with_two_objects_is_invalid(self, tmp_path: Path) -> None:
+        file = tmp_path / "data.jsonl"
+        file.write_text('{"a": 1}, {"b": 2}\n{"c": 3}\n', encoding="utf-8")
+
+        result = tail_jsonl(file, 5)
+
+        assert result.items == [{"c": 3}]
+        assert result.invalid_lines == 1
+
+    def test_match_filters_before_parsing(self, tmp_path: Path) -> None:
+        file = tmp_path / "data.jsonl"
+        file.write_text('{"type": "user"}\n{"type": "tool"}\n{"type": "user", "n": 2}\n{"type": "tool"}\n')
+
+        result = tail_jsonl(file, 1, match=lambda line: b'"user"' in line)
+
+        assert result.items == [{"type": "user", "n": 2}]
+        assert result.total_lines == 4
+
+    def test_missing_file_returns_default(self, tmp_path: Path) -> None:
+        result = tail_jsonl(tmp_path / "missing.jsonl", 5, default=[{"fallback": True}])
+
+        assert result.items == [{"fallback": True}]
+
+
 class TestWriteJsonl:
     """Tests for write_jsonl function."""
 
@@ -250,6 +346,12 @@ class TestWriteJsonl:
         assert ok is True
         assert file.read_text(encoding="utf-8") == '{"a": 1}\n{"b": 2}\n'
 
+    def test_creates_parent_directories(self, tmp_path: Path) -> None:
+        file = tmp_path / "nested" / "dir" / "out.jsonl"
+
+        assert write_jsonl(file, [{"a": 1}], append=True) is True
+        assert file.read_text(encoding="utf-8") == '{"a": 1}\n'
+
     def test_append_mode(self, tmp_path: Path) -> None:
         file = tmp_path / "out.jsonl"
         write_jsonl(file, [{"a": 1}])
@@ -266,6 +368,15 @@ class TestWriteJsonl:
         assert ok is False
         assert not file.exists()
 
+    def test_unserializable_append_leaves_file_intact(self, tmp_path: Path) -> None:
+        file = tmp_path / "out.jsonl"
+        write_jsonl(file, [{"a": 1}])
+
+        ok = write_jsonl(file, [{"b": 2}, {"bad": {1, 2, 3}}], append=True)
+
+        assert ok is False
+        assert file.read_text(encoding="utf-8") == '{"a": 1}\n'
+
 
 class TestSafeUnlink:
     """Tests for safe_unlink function."""
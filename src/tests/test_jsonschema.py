@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
+
+from voyager.io import read_json
 from voyager.jsonschema import validate, validate_hook_context
 
 
@@ -82,6 +86,34 @@ class TestValidate:
         valid, errors = validate({}, schema_file)
         assert valid is False
 
+    def test_reuses_schema_file_until_it_changes(self, tmp_path: Path) -> None:
+        """Should parse a schema file once, and again after it is rewritten."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text('{"type": "object", "required": ["id"]}', encoding="utf-8")
+
+        with patch("voyager.jsonschema.read_json", wraps=read_json) as load:
+            assert validate({"id": 1}, schema_file)[0] is True
+            assert validate({}, str(schema_file))[0] is False
+            assert load.call_count == 1
+
+            schema_file.write_text('{"type": "object", "required": ["name"]}', encoding="utf-8")
+            assert validate({"id": 1}, schema_file)[0] is False
+            assert load.call_count == 2
+
+    def test_fast_path_keeps_error_messages(self, tmp_path: Path) -> None:
+        """Should report the same jsonschema messages when jsonschema-rs accepts first."""
+        pytest.importorskip("jsonschema_rs")
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text('{"type": "array", "items": {"type": "integer"}}', encoding="utf-8")
+
+        with patch("jsonschema.Draft202012Validator") as full:
+            assert validate([1, 2, 3], schema_file) == (True, [])
+        full.assert_not_called()
+
+        valid, errors = validate([1, 2, "x"], schema_file)
+        assert valid is False
+        assert errors == ["[2]: 'x' is not of type 'integer'"]
+
     def test_missing_schema_file(self, tmp_path: Path) -> None:
         """Should handle missing schema file gracefully."""
         schema_file = tmp_path / "nonexistent.json"
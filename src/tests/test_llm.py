@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from voyager.llm import (
@@ -70,7 +73,7 @@ class TestCallClaude:
             return
             yield  # Make this a generator
 
-        with patch("voyager.llm.query", mock_query):
+        with patch("claude_agent_sdk.query", mock_query):
             call_claude("test prompt")
 
         assert "1" in captured_env
@@ -83,7 +86,7 @@ class TestCallClaude:
             return
             yield
 
-        with patch("voyager.llm.query", mock_query):
+        with patch("claude_agent_sdk.query", mock_query):
             call_claude("test prompt")
 
         assert os.environ.get(RECURSION_GUARD_VAR) == original
@@ -97,7 +100,7 @@ class TestCallClaude:
             await anyio.sleep(100)
             yield
 
-        with patch("voyager.llm.query", slow_query):
+        with patch("claude_agent_sdk.query", slow_query):
             result = call_claude("test prompt", timeout_seconds=1)
 
         assert result.success is False
@@ -110,7 +113,7 @@ class TestCallClaude:
             raise RuntimeError("Test error")
             yield
 
-        with patch("voyager.llm.query", failing_query):
+        with patch("claude_agent_sdk.query", failing_query):
             result = call_claude("test prompt")
 
         assert result.success is False
@@ -139,9 +142,29 @@ class TestCallClaude:
             yield assistant_msg
             yield result_msg
 
-        with patch("voyager.llm.query", mock_query):
+        with patch("claude_agent_sdk.query", mock_query):
             result = call_claude("test prompt")
 
         assert result.success is True
         assert result.output == "Done!"
         assert "/tmp/test.txt" in result.files
+
+
+class TestLazyImports:
+    """Tests that the CLI stays cheap to import."""
+
+    def test_cli_import_skips_heavy_dependencies(self) -> None:
+        """Should not import the agent SDK or jsonschema until they are used."""
+        code = (
+            "import sys, voyager.cli; "
+            "print(','.join(m for m in ('claude_agent_sdk', 'jsonschema') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parents[1],
+        )
+
+        assert result.stdout.strip() == ""
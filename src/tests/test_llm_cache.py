@@ -0,0 +1,64 @@
+"""Tests for voyager.llm_cache module."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from voyager.config import get_llm_cache_dir
+from voyager.llm_cache import llm_cache_key, load_cached_output, store_cached_output
+
+
+@pytest.fixture(autouse=True)
+def _project_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+
+
+class TestLLMCacheKey:
+    """Tests for llm_cache_key."""
+
+    def test_same_inputs_same_key(self) -> None:
+        """Should be deterministic for equal inputs."""
+        assert llm_cache_key("curriculum", {"a": 1, "b": [2]}) == llm_cache_key("curriculum", {"a": 1, "b": [2]})
+
+    def test_kind_and_inputs_change_key(self) -> None:
+        """Should differ across output kinds and input values."""
+        key = llm_cache_key("curriculum", {"a": 1})
+
+        assert key != llm_cache_key("skill_proposals", {"a": 1})
+        assert key != llm_cache_key("curriculum", {"a": 2})
+
+
+class TestCachedOutput:
+    """Tests for load_cached_output and store_cached_output."""
+
+    def test_round_trip(self) -> None:
+        """Should return what was stored under the key."""
+        key = llm_cache_key("curriculum", {"a": 1})
+        assert load_cached_output(key) is None
+
+        assert store_cached_output(key, {"tracks": []})
+
+        assert load_cached_output(key) == {"tracks": []}
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        """Should ignore entries older than the TTL."""
+        key = llm_cache_key("curriculum", {"a": 1})
+        store_cached_output(key, {"tracks": []})
+
+        assert load_cached_output(key, ttl_seconds=-1) is None
+
+    def test_store_prunes_expired_entries(self) -> None:
+        """Should delete entries older than the TTL when storing a new one."""
+        old_key = llm_cache_key("curriculum", {"a": 1})
+        store_cached_output(old_key, {"tracks": []})
+        old_path = get_llm_cache_dir() / f"{old_key}.json"
+        os.utime(old_path, (0, 0))
+
+        new_key = llm_cache_key("curriculum", {"a": 2})
+        store_cached_output(new_key, {"tracks": []})
+
+        assert not old_path.exists()
+        assert load_cached_output(new_key) == {"tracks": []}
@@ -0,0 +1,58 @@
+"""Tests for voyager.scripts.curriculum.plan module."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from voyager.brain.store import create_empty_brain, save_brain
+from voyager.config import get_brain_json_path, get_curriculum_json_path
+from voyager.scripts.curriculum import plan
+
+VALID_CURRICULUM = {"version": 1, "goal": "Ship it", "tracks": [], "metadata": {}}
+
+
+@pytest.fixture
+def snapshot(project_dir: Path) -> Path:
+    # The brain's timestamp is part of the cache key, so it must not change between runs
+    save_brain(create_empty_brain(), get_brain_json_path())
+    path = project_dir / "snapshot.json"
+    path.write_text('{"root": "."}', encoding="utf-8")
+    return path
+
+
+class TestLLMCache:
+    """Tests for reusing a curriculum generated from the same inputs."""
+
+    def test_repeat_run_skips_llm(self, snapshot: Path, fake_agent: Callable[..., MagicMock]) -> None:
+        """Should reuse the previous curriculum instead of calling the LLM again."""
+        agent = fake_agent(get_curriculum_json_path(), VALID_CURRICULUM)
+        with patch.object(plan, "call_claude", agent):
+            plan.main(snapshot_path=snapshot)
+            plan.main(snapshot_path=snapshot)
+
+        agent.assert_called_once()
+        saved = json.loads(get_curriculum_json_path().read_text(encoding="utf-8"))
+        assert saved["goal"] == "Ship it"
+
+    def test_no_cache_calls_llm(self, snapshot: Path, fake_agent: Callable[..., MagicMock]) -> None:
+        """Should call the LLM on every run with --no-cache."""
+        agent = fake_agent(get_curriculum_json_path(), VALID_CURRICULUM)
+        with patch.object(plan, "call_claude", agent):
+            plan.main(snapshot_path=snapshot)
+            plan.main(snapshot_path=snapshot, no_cache=True)
+
+        assert agent.call_count == 2
+
+    def test_invalid_curriculum_is_not_reused(self, snapshot: Path, fake_agent: Callable[..., MagicMock]) -> None:
+        """Should call the LLM again when the previous output failed validation."""
+        agent = fake_agent(get_curriculum_json_path(), {**VALID_CURRICULUM, "version": 2})
+        with patch.object(plan, "call_claude", agent):
+            plan.main(snapshot_path=snapshot)
+            plan.main(snapshot_path=snapshot)
+
+        assert agent.call_count == 2
@@ -0,0 +1,58 @@
+"""Tests for voyager.scripts.factory.propose module."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from voyager.brain.store import create_empty_brain, save_brain
+from voyager.config import get_brain_json_path, get_curriculum_json_path
+from voyager.curriculum.store import create_empty_curriculum, save_curriculum
+from voyager.scripts.factory import propose
+
+VALID_PROPOSALS = {"version": 1, "proposals": [], "metadata": {}}
+
+
+@pytest.fixture
+def output(project_dir: Path) -> Path:
+    # Brain and curriculum timestamps are part of the cache key, so they must not change between runs
+    save_brain(create_empty_brain(), get_brain_json_path())
+    save_curriculum(create_empty_curriculum(), get_curriculum_json_path())
+    return project_dir / "proposals.json"
+
+
+class TestLLMCache:
+    """Tests for reusing proposals generated from the same inputs."""
+
+    def test_repeat_run_skips_llm(self, output: Path, fake_agent: Callable[..., MagicMock]) -> None:
+        """Should reuse the previous proposals instead of calling the LLM again."""
+        agent = fake_agent(output, VALID_PROPOSALS)
+        with patch.object(propose, "call_claude", agent):
+            propose.main(output=output)
+            output.unlink()
+            propose.main(output=output)
+
+        agent.assert_called_once()
+        assert json.loads(output.read_text(encoding="utf-8")) == VALID_PROPOSALS
+
+    def test_no_cache_calls_llm(self, output: Path, fake_agent: Callable[..., MagicMock]) -> None:
+        """Should call the LLM on every run with --no-cache."""
+        agent = fake_agent(output, VALID_PROPOSALS)
+        with patch.object(propose, "call_claude", agent):
+            propose.main(output=output)
+            propose.main(output=output, no_cache=True)
+
+        assert agent.call_count == 2
+
+    def test_invalid_proposals_are_not_reused(self, output: Path, fake_agent: Callable[..., MagicMock]) -> None:
+        """Should call the LLM again when the previous output failed validation."""
+        agent = fake_agent(output, {"proposals": []})
+        with patch.object(propose, "call_claude", agent):
+            propose.main(output=output)
+            propose.main(output=output)
+
+        assert agent.call_count == 2
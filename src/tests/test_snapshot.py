@@ -2,9 +2,28 @@
 
 from __future__ import annotations
 
+import shutil
+import subprocess
 from pathlib import Path
+from unittest.mock import patch
 
-from voyager.repo.snapshot import snapshot_to_json
+import pytest
+
+from voyager.repo.snapshot import (
+    FD_MAX_RESULTS,
+    MAX_HINT_FILE_BYTES,
+    TREE_MAX_LINES,
+    _build_tree_from_file_list,
+    _extract_run_hints,
+    _fd_snapshot,
+    _get_directory_summary,
+    _get_top_level_entries,
+    _Gitignore,
+    _has_git_dir,
+    _parse_status_v2,
+    repo_fingerprint,
+    snapshot_to_json,
+)
 
 
 class TestSnapshotGitignore:
@@ -36,6 +55,47 @@ class TestSnapshotGitignore:
         assert "kept_dir" in directory_summary
         assert "ignored_dir" not in directory_summary
 
+    def test_skips_dependency_dirs_without_gitignore(self, tmp_path: Path) -> None:
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").write_text("x", encoding="utf-8")
+        (tmp_path / "src" / "__pycache__").mkdir(parents=True)
+        (tmp_path / "src" / "__pycache__" / "a.pyc").write_text("x", encoding="utf-8")
+        (tmp_path / "src" / "a.py").write_text("x", encoding="utf-8")
+
+        files = snapshot_to_json(tmp_path)["files"]
+
+        assert "node_modules" not in {e["name"] for e in files["top_level"]}
+        assert "node_modules" not in files["directory_summary"]
+        assert files["directory_summary"]["src"] == 1
+
+
+class TestGitignoreMatcher:
+    def test_last_matching_rule_wins(self, tmp_path: Path) -> None:
+        (tmp_path / ".gitignore").write_text("*.log\n!keep.log\nlogs/\n/build/*.o\n", encoding="utf-8")
+        ignore = _Gitignore.from_root(tmp_path)
+
+        assert ignore.is_ignored("src/debug.log", is_dir=False)
+        assert not ignore.is_ignored("src/keep.log", is_dir=False)
+        assert ignore.is_ignored("a/logs", is_dir=True)
+        assert not ignore.is_ignored("a/logs", is_dir=False)
+        assert ignore.is_ignored("build/main.o", is_dir=False)
+        assert not ignore.is_ignored("src/main.o", is_dir=False)
+
+    def test_reuses_parsed_gitignore_until_it_changes(self, tmp_path: Path) -> None:
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("*.log\n", encoding="utf-8")
+
+        first = _Gitignore.from_root(tmp_path)
+        assert first.is_ignored("a.log", is_dir=False)
+        again = _Gitignore.from_root(tmp_path)
+        assert again._matchers is first._matchers
+        assert again._cache == {}
+
+        gitignore.write_text("*.log\n*.tmp\n", encoding="utf-8")
+        second = _Gitignore.from_root(tmp_path)
+        assert second._matchers is not first._matchers
+        assert second.is_ignored("a.tmp", is_dir=False)
+
 
 class TestSnapshotBounds:
     def test_directory_summary_caps_at_1000(self, tmp_path: Path) -> None:
@@ -47,3 +107,144 @@ class TestSnapshotBounds:
         directory_summary = snapshot["files"]["directory_summary"]
 
         assert directory_summary["big"] == 1000
+
+    def test_directory_summary_same_with_threads(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        for name in ("a", "b", "c"):
+            (tmp_path / name / "sub").mkdir(parents=True)
+            (tmp_path / name / "sub" / "f.txt").write_text("x", encoding="utf-8")
+        monkeypatch.setattr("voyager.repo.snapshot.os.cpu_count", lambda: 8)
+
+        monkeypatch.setenv("VOYAGER_SNAPSHOT_WORKERS", "1")
+        serial = _get_directory_summary(tmp_path)
+        monkeypatch.setenv("VOYAGER_SNAPSHOT_WORKERS", "4")
+        threaded = _get_directory_summary(tmp_path)
+
+        assert threaded == serial == {"a": 2, "b": 2, "c": 2}
+
+
+class TestGitDetection:
+    def test_skips_git_outside_repository(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("x", encoding="utf-8")
+        with (
+            patch("voyager.repo.snapshot._has_git_dir", return_value=False),
+            patch("voyager.repo.snapshot._run_git") as run_git,
+        ):
+            snapshot = snapshot_to_json(tmp_path)
+
+        run_git.assert_not_called()
+        assert "git" not in snapshot
+
+    def test_detects_git_in_parent(self, tmp_path: Path) -> None:
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "sub").mkdir()
+
+        assert _has_git_dir(tmp_path / "sub")
+
+
+class TestRepoFingerprint:
+    def test_none_outside_repository(self, tmp_path: Path) -> None:
+        with patch("voyager.repo.snapshot._has_git_dir", return_value=False):
+            assert repo_fingerprint(tmp_path) is None
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_changes_with_working_tree(self, tmp_path: Path) -> None:
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        (tmp_path / "README.md").write_text("# Demo\n", encoding="utf-8")
+
+        first = repo_fingerprint(tmp_path)
+        assert first is not None
+        assert repo_fingerprint(tmp_path) == first
+
+        (tmp_path / "new.py").write_text("x = 1\n", encoding="utf-8")
+        assert repo_fingerprint(tmp_path) != first
+
+
+class TestParseStatusV2:
+    def test_parses_branch_and_entries(self) -> None:
+        output = "\n".join(
+            [
+                "# branch.oid 0123abcd",
+                "# branch.head main",
+                "1 .M N... 100644 100644 100644 aaa bbb src/app.py",
+                "1 A. N... 000000 100644 100644 000 ccc new file.txt",
+                "2 R. N... 100644 100644 100644 ddd ddd R100 new.py\told.py",
+                "u UU N... 100644 100644 100644 100644 e1 e2 e3 conflict.py",
+            ]
+        )
+
+        branch, status = _parse_status_v2(output)
+
+        assert branch == "main"
+        assert status == [" M src/app.py", "A  new file.txt", "R  old.py -> new.py", "UU conflict.py"]
+
+    def test_detached_head(self) -> None:
+        branch, status = _parse_status_v2("# branch.oid abc\n# branch.head (detached)")
+
+        assert branch == "HEAD"
+        assert status == []
+
+
+class TestRunHints:
+    def test_dedupes_and_respects_byte_budget(self, tmp_path: Path) -> None:
+        filler = "x" * 100 + "\n"
+        late = filler * (MAX_HINT_FILE_BYTES // len(filler) + 1) + "npm run late\n"
+        (tmp_path / "README.md").write_text(
+            "## Installation\nuv sync\nuv sync\nplain text\n" + late,
+            encoding="utf-8",
+        )
+
+        assert _extract_run_hints(tmp_path) == ["## Installation", "uv sync"]
+
+
+class TestFdListing:
+    def test_single_listing_feeds_all_views(self, tmp_path: Path) -> None:
+        # Files only, as `fd --type f` prints them (no directory lines to classify)
+        fd_output = "src/a.py\nsrc/pkg/b.py\nREADME.md\n.github/ci.yml\n"
+        with (
+            patch("voyager.repo.snapshot._find_fd_binary", return_value="fd"),
+            patch("voyager.repo.snapshot._run_cmd", return_value=fd_output) as run_cmd,
+        ):
+            listing = _fd_snapshot(tmp_path)
+
+        assert run_cmd.call_count == 1
+        cmd = run_cmd.call_args.args[0]
+        assert cmd[cmd.index("--type") + 1] == "f"
+        assert "d" not in cmd
+        assert listing is not None
+        assert _get_top_level_entries(tmp_path, listing) == [
+            {"name": "README.md", "type": "file"},
+            {"name": "src", "type": "dir"},
+        ]
+        assert _get_directory_summary(tmp_path, listing) == {"src": 2}
+
+    def test_truncation_counts_files_only(self, tmp_path: Path) -> None:
+        fd_output = "\n".join(f"pkg/f{i}.py" for i in range(FD_MAX_RESULTS - 1))
+        with (
+            patch("voyager.repo.snapshot._find_fd_binary", return_value="fd"),
+            patch("voyager.repo.snapshot._run_cmd", return_value=fd_output),
+        ):
+            listing = _fd_snapshot(tmp_path)
+
+        assert listing is not None
+        assert not listing.truncated
+        assert listing.top_dirs == {"pkg"}
+
+
+class TestTreeView:
+    def _fake_tree(self, tmp_path: Path, body: str) -> str:
+        script = tmp_path / "fake-tree"
+        script.write_text(f"#!/bin/sh\n{body}\n", encoding="utf-8")
+        script.chmod(0o755)
+        return str(script)
+
+    def test_output_is_bounded(self, tmp_path: Path) -> None:
+        files = [f"dir/file{i}.txt" for i in range(2000)]
+        with patch("voyager.repo.snapshot._find_tree_binary", return_value=self._fake_tree(tmp_path, "cat")):
+            tree = _build_tree_from_file_list(tmp_path, files)
+
+        assert tree is not None
+        assert tree.splitlines() == files[:TREE_MAX_LINES]
+
+    def test_failed_command_returns_none(self, tmp_path: Path) -> None:
+        with patch("voyager.repo.snapshot._find_tree_binary", return_value=self._fake_tree(tmp_path, "exit 1")):
+            assert _build_tree_from_file_list(tmp_path, ["a.txt"]) is None
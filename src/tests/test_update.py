@@ -0,0 +1,111 @@
+"""Tests for voyager.scripts.brain.update module."""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from voyager.config import get_brain_json_path
+from voyager.llm import LLMResult
+from voyager.scripts.brain import update
+
+
+@pytest.fixture
+def transcript(project_dir: Path) -> Path:
+    path = project_dir / "transcript.jsonl"
+    path.write_text('{"type": "user", "message": "hello"}\n', encoding="utf-8")
+    return path
+
+
+def _signals(signals_from_prompt: bool) -> Callable[[str], dict]:
+    """Return brain.json content whose signals do or don't match the prompt."""
+
+    def brain(prompt: str) -> dict:
+        if not signals_from_prompt:
+            return {"signals": {"last_session_id": "other", "last_updated_at": "2000-01-01T00:00:00+00:00"}}
+        return {
+            "signals": {
+                "last_session_id": re.search(r"- Session ID: (.+)", prompt).group(1),
+                "last_updated_at": re.search(r"- Current timestamp: (.+)", prompt).group(1),
+            }
+        }
+
+    return brain
+
+
+class TestLLMUpdate:
+    """Tests for the LLM success path."""
+
+    def test_skips_resave_when_agent_wrote_signals(
+        self, transcript: Path, fake_agent: Callable[..., MagicMock]
+    ) -> None:
+        """Should not rewrite brain.json when the agent already set the signals."""
+        with (
+            patch.object(update, "call_claude", fake_agent(get_brain_json_path(), _signals(signals_from_prompt=True))),
+            patch.object(update, "save_brain") as save,
+        ):
+            update.main(transcript=transcript, session_id="s1")
+
+        save.assert_not_called()
+
+    def test_resaves_when_signals_differ(self, transcript: Path, fake_agent: Callable[..., MagicMock]) -> None:
+        """Should patch and save the signals when the agent left them stale."""
+        with (
+            patch.object(update, "call_claude", fake_agent(get_brain_json_path(), _signals(signals_from_prompt=False))),
+            patch.object(update, "save_brain") as save,
+        ):
+            update.main(transcript=transcript, session_id="s1")
+
+        save.assert_called_once()
+        assert save.call_args.args[0]["signals"]["last_session_id"] == "s1"
+
+
+class TestMinimalUpdate:
+    """Tests for the no-transcript path."""
+
+    def test_saves_signals_without_revalidating(self, transcript: Path) -> None:
+        """Should write the new signals without re-running schema validation."""
+        transcript.write_text("", encoding="utf-8")
+
+        with patch("voyager.brain.store.validate") as validate:
+            update.main(transcript=transcript, session_id="s1")
+
+        validate.assert_not_called()
+        saved = json.loads(get_brain_json_path().read_text(encoding="utf-8"))
+        assert saved["signals"]["last_session_id"] == "s1"
+
+    def test_keeps_other_signal_fields(self, transcript: Path) -> None:
+        """Should only overwrite the session and timestamp signals."""
+        transcript.write_text("", encoding="utf-8")
+        brain = update.load_brain()
+        brain["signals"]["update_count"] = "3"
+        update.save_brain(brain, get_brain_json_path(), validate_schema=False)
+
+        update.main(transcript=transcript, session_id="s1")
+
+        signals = json.loads(get_brain_json_path().read_text(encoding="utf-8"))["signals"]
+        assert signals["update_count"] == "3"
+        assert signals["last_session_id"] == "s1"
+
+
+class TestFailedUpdate:
+    """Tests for the LLM failure path."""
+
+    def test_prepends_bounded_failure_note(self, transcript: Path) -> None:
+        """Should record the failure first and keep at most 10 recent changes."""
+        brain_path = get_brain_json_path()
+        brain = update.load_brain()
+        brain["progress"]["recent_changes"] = [f"change {i}" for i in range(10)]
+        update.save_brain(brain, brain_path)
+
+        with patch.object(update, "call_claude", return_value=LLMResult(success=False, error="boom")):
+            update.main(transcript=transcript, session_id="s1")
+
+        recent = json.loads(brain_path.read_text(encoding="utf-8"))["progress"]["recent_changes"]
+        assert recent[0] == "[s1] Brain update failed: boom"
+        assert recent[1:] == [f"change {i}" for i in range(9)]
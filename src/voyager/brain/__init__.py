@@ -4,6 +4,7 @@ from voyager.brain.render import render_brain_md
 from voyager.brain.store import (
     create_empty_brain,
     load_brain,
+    load_brain_cached,
     save_brain,
     save_episode,
     save_last_update,
@@ -12,6 +13,7 @@ from voyager.brain.store import (
 __all__ = [
     "create_empty_brain",
     "load_brain",
+    "load_brain_cached",
     "render_brain_md",
     "save_brain",
     "save_episode",
@@ -10,6 +10,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from voyager.cache import MtimeCache
 from voyager.config import (
     get_brain_json_path,
     get_episodes_dir,
@@ -99,6 +100,21 @@ def load_brain(path: Path | str | None = None) -> dict[str, Any]:
     return data
 
 
+_brain_cache: MtimeCache[dict[str, Any]] = MtimeCache(load_brain, get_brain_json_path)
+
+
+def load_brain_cached(path: Path | str | None = None) -> dict[str, Any]:
+    """Load brain.json like load_brain, reusing the result until the file changes.
+
+    Args:
+        path: Path to brain.json. Defaults to project brain path.
+
+    Returns:
+        Brain dict (a private copy the caller may modify).
+    """
+    return _brain_cache.get(path)
+
+
 def save_brain(
     brain: dict[str, Any],
     path: Path | str | None = None,
@@ -0,0 +1,60 @@
+"""In-process caches for read-mostly state files.
+
+Loaders such as load_brain parse and schema-validate a JSON file on every
+call. When several commands run in one Python process (a batch driver, or
+library use), MtimeCache reuses the loaded value until the file changes.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable
+from pathlib import Path
+
+
+class MtimeCache[T]:
+    """Memoize a path-based loader until the file changes on disk.
+
+    The cache key is the file's (inode, mtime_ns, size). Voyager writes state
+    files atomically (temp file + rename), so every save also changes the
+    inode. Callers get a deep copy and may mutate it freely. Missing files are
+    never cached.
+    """
+
+    def __init__(self, loader: Callable[[Path], T], default_path: Callable[[], Path]):
+        """Initialize the cache.
+
+        Args:
+            loader: Function that loads the value from a path.
+            default_path: Returns the path to use when get() is called without one.
+        """
+        self._loader = loader
+        self._default_path = default_path
+        self._entries: dict[Path, tuple[tuple[int, int, int], T]] = {}
+
+    def get(self, path: Path | str | None = None) -> T:
+        """Return the loaded value for path, reloading only if the file changed.
+
+        Args:
+            path: File to load. Defaults to default_path().
+
+        Returns:
+            A copy of the loaded value.
+        """
+        path = Path(path) if path is not None else self._default_path()
+        try:
+            st = path.stat()
+        except OSError:
+            self._entries.pop(path, None)
+            return self._loader(path)
+
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        entry = self._entries.get(path)
+        if entry is None or entry[0] != stamp:
+            entry = (stamp, self._loader(path))
+            self._entries[path] = entry
+        return copy.deepcopy(entry[1])
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        self._entries.clear()
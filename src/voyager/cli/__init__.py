@@ -26,6 +26,9 @@ app = typer.Typer(
     name="voyager",
     help="Voyager: Meta-skills for Coding Agents",
     no_args_is_help=True,
+    # Older Typer releases default to True; rendering locals would dump whole
+    # brain/curriculum dicts to stderr on a crash
+    pretty_exceptions_show_locals=False,
 )
 
 app.add_typer(brain.app)
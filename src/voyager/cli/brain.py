@@ -66,6 +66,10 @@ def inject(
         Path | None,
         typer.Option("--repo", "-r", help="Repo path for snapshot generation"),
     ] = None,
+    no_snapshot: Annotated[
+        bool,
+        typer.Option("--no-snapshot", help="Skip the repo snapshot section entirely"),
+    ] = False,
 ) -> None:
     """Inject brain context at SessionStart."""
     inject_main(
@@ -73,4 +77,5 @@ def inject(
         brain_path=brain_path,
         snapshot_path=snapshot_path,
         repo_path=repo_path,
+        no_snapshot=no_snapshot,
     )
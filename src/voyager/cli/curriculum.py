@@ -36,6 +36,10 @@ def plan(
         bool,
         typer.Option("--skip-llm", help="Skip LLM call, just render existing"),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Always call the LLM, even if inputs are unchanged"),
+    ] = False,
 ) -> None:
     """Generate a curriculum from brain state and repo snapshot."""
     plan_main(
@@ -44,4 +48,5 @@ def plan(
         output=output,
         dry_run=dry_run,
         skip_llm=skip_llm,
+        no_cache=no_cache,
     )
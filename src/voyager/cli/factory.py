@@ -42,6 +42,10 @@ def propose(
         bool,
         typer.Option("--skip-llm", help="Skip LLM call, use existing proposals"),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Always call the LLM, even if inputs are unchanged"),
+    ] = False,
 ) -> None:
     """Propose new skills from observed patterns."""
     propose_main(
@@ -51,6 +55,7 @@ def propose(
         output=output,
         dry_run=dry_run,
         skip_llm=skip_llm,
+        no_cache=no_cache,
     )
 
 
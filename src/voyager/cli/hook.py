@@ -16,7 +16,7 @@ from pathlib import Path
 import typer
 
 from voyager.llm import is_internal_call
-from voyager.scripts.brain.inject import inject_from_stdin
+from voyager.scripts.brain.inject import inject_from_stdin, write_hook_output
 from voyager.scripts.brain.update import main as brain_update_main
 
 app = typer.Typer(
@@ -40,7 +40,7 @@ def session_start() -> None:
 
     try:
         output = inject_from_stdin()
-        typer.echo(json.dumps(output))
+        write_hook_output(output)
     except Exception as e:
         print(f"session-start error: {e}", file=sys.stderr)
         fallback = {
@@ -189,6 +189,7 @@ def post_tool_use() -> None:
 
     # Try to detect which skill is being used (best-effort, no LLM)
     skill_used = None
+    detector = None
     try:
         from voyager.refinement.detector import SkillDetector
 
@@ -203,7 +204,8 @@ def post_tool_use() -> None:
 
         from voyager.refinement.store import FeedbackStore, ToolExecution
 
-        store = FeedbackStore()
+        # Reuse the detector's store so the schema is only initialized once per hook
+        store = detector.store if detector is not None else FeedbackStore()
         store.log_tool_execution(
             ToolExecution(
                 session_id=session_id,
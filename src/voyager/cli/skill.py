@@ -37,6 +37,10 @@ def index(
         bool,
         typer.Option("--verbose", "-v", help="Print verbose output"),
     ] = False,
+    embed_batch_size: Annotated[
+        int | None,
+        typer.Option("--embed-batch-size", min=1, help="Documents per ColBERT encoder batch"),
+    ] = None,
 ) -> None:
     """Build or update the skill search index."""
     index_main(
@@ -45,6 +49,7 @@ def index(
         rebuild=rebuild,
         skip_llm=skip_llm,
         verbose=verbose,
+        embed_batch_size=embed_batch_size,
     )
 
 
@@ -66,9 +71,17 @@ def find(
         bool,
         typer.Option("--json", help="Output results as JSON"),
     ] = False,
+    persist: Annotated[
+        bool,
+        typer.Option("--persist", help="Keep the index loaded and read one query per line from stdin"),
+    ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Always search the index, ignoring cached results"),
+    ] = False,
 ) -> None:
     """Search for relevant skills."""
-    if not query:
+    if not query and not persist:
         typer.echo("Error: Missing query argument")
         raise typer.Exit(1)
 
@@ -77,4 +90,6 @@ def find(
         top_k=top_k,
         index_path=index,
         json_output=json_output,
+        persist=persist,
+        no_cache=no_cache,
     )
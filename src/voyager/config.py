@@ -4,6 +4,7 @@ Provides canonical paths for:
 - Project state (brain, curriculum, episodes)
 - Skill locations (plugin, local, generated)
 - Index and feedback storage
+- Skill analysis cache
 """
 
 import os
@@ -67,6 +68,21 @@ def get_feedback_db_path() -> Path:
     return get_voyager_state_dir() / "feedback.db"
 
 
+def get_snapshot_cache_path() -> Path:
+    """Get the path to the cached repo snapshot used at SessionStart."""
+    return get_voyager_state_dir() / "snapshot_cache.json"
+
+
+def get_plan_snapshot_cache_path() -> Path:
+    """Get the path to the repo snapshot reused by curriculum planning."""
+    return get_voyager_state_dir() / "plan_snapshot_cache.json"
+
+
+def get_llm_cache_dir() -> Path:
+    """Get the directory of cached LLM outputs keyed by their inputs."""
+    return get_voyager_state_dir() / "llm_cache"
+
+
 def get_generated_skills_dir() -> Path:
     """Get the generated skills directory."""
     return get_project_dir() / ".claude" / "skills" / "generated"
@@ -98,6 +114,16 @@ def get_skill_index_dir() -> Path:
     return Path.home() / ".skill-index"
 
 
+def get_skill_analysis_cache_dir() -> Path:
+    """Get the directory caching LLM skill analysis results.
+
+    Uses XDG_CACHE_HOME if set, otherwise ~/.cache/voyager/skill_analysis/
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "voyager" / "skill_analysis"
+
+
 def ensure_voyager_dirs() -> None:
     """Ensure all Voyager directories exist."""
     dirs = [
@@ -8,6 +8,7 @@ from voyager.curriculum.store import (
     create_empty_curriculum,
     get_curriculum_schema_path,
     load_curriculum,
+    load_curriculum_cached,
     save_curriculum,
     save_last_update,
 )
@@ -16,6 +17,7 @@ __all__ = [
     "create_empty_curriculum",
     "get_curriculum_schema_path",
     "load_curriculum",
+    "load_curriculum_cached",
     "render_curriculum_md",
     "save_curriculum",
     "save_last_update",
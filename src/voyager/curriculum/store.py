@@ -10,6 +10,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from voyager.cache import MtimeCache
 from voyager.config import (
     get_curriculum_json_path,
     get_plugin_root,
@@ -82,6 +83,21 @@ def load_curriculum(path: Path | str | None = None) -> dict[str, Any]:
     return data
 
 
+_curriculum_cache: MtimeCache[dict[str, Any]] = MtimeCache(load_curriculum, get_curriculum_json_path)
+
+
+def load_curriculum_cached(path: Path | str | None = None) -> dict[str, Any]:
+    """Load curriculum.json like load_curriculum, reusing the result until the file changes.
+
+    Args:
+        path: Path to curriculum.json. Defaults to project curriculum path.
+
+    Returns:
+        Curriculum dict (a private copy the caller may modify).
+    """
+    return _curriculum_cache.get(path)
+
+
 def save_curriculum(
     curriculum: dict[str, Any],
     path: Path | str | None = None,
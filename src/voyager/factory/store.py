@@ -10,6 +10,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from voyager.cache import MtimeCache
 from voyager.config import (
     get_generated_skills_dir,
     get_generated_skills_index_path,
@@ -70,6 +71,9 @@ def load_skills_index(path: Path | str | None = None) -> dict[str, Any]:
     return data
 
 
+_skills_index_cache: MtimeCache[dict[str, Any]] = MtimeCache(load_skills_index, get_generated_skills_index_path)
+
+
 def save_skills_index(
     index: dict[str, Any],
     path: Path | str | None = None,
@@ -147,7 +151,8 @@ def get_existing_skill_names() -> set[str]:
     Returns:
         Set of skill names.
     """
-    index = load_skills_index()
+    # Reuses the parsed index until it changes on disk
+    index = _skills_index_cache.get()
     return {s["name"] for s in index.get("skills", [])}
 
 
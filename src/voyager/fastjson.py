@@ -0,0 +1,116 @@
+"""JSON encode/decode helpers that use orjson when it is installed.
+
+orjson (pip install voyager[speedups]) is several times faster than the
+stdlib json module and works on bytes directly. Without it, these helpers
+fall back to json with the same output format.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_INDENTED_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def dumps_indented(data: Any) -> str:
+    """Serialize data as human-readable JSON (2-space indent, UTF-8 kept as-is).
+
+    Args:
+        data: JSON-serializable data.
+
+    Returns:
+        JSON string.
+
+    Raises:
+        TypeError: If data is not JSON-serializable.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def dumps_indented_capped(data: Any, max_chars: int) -> tuple[str, bool]:
+    """Serialize data like dumps_indented, keeping at most max_chars characters.
+
+    Without orjson, the stdlib encoder is driven incrementally and stops once
+    the budget is exceeded, so a large document is never fully serialized.
+
+    Args:
+        data: JSON-serializable data.
+        max_chars: Maximum length of the returned text.
+
+    Returns:
+        Tuple of (possibly truncated JSON text, whether it was truncated).
+
+    Raises:
+        TypeError: If data is not JSON-serializable.
+    """
+    if orjson is not None:
+        text = dumps_indented(data)
+        return text[:max_chars], len(text) > max_chars
+
+    chunks: list[str] = []
+    size = 0
+    for chunk in _INDENTED_ENCODER.iterencode(data):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > max_chars:
+            return "".join(chunks)[:max_chars], True
+    return "".join(chunks), False
+
+
+def dumps_compact(data: Any) -> str:
+    """Serialize data as compact JSON without whitespace.
+
+    Args:
+        data: JSON-serializable data.
+
+    Returns:
+        JSON string.
+
+    Raises:
+        TypeError: If data is not JSON-serializable.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def dumps_bytes(data: Any) -> bytes:
+    """Serialize data as compact UTF-8 encoded JSON.
+
+    Args:
+        data: JSON-serializable data.
+
+    Returns:
+        JSON bytes.
+
+    Raises:
+        TypeError: If data is not JSON-serializable.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON from a string or UTF-8 bytes.
+
+    Args:
+        data: JSON document.
+
+    Returns:
+        Parsed data.
+
+    Raises:
+        ValueError: If data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -9,13 +9,20 @@ from __future__ import annotations
 
 import contextlib
 import dataclasses
+import functools
 import json
 import os
 import tempfile
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
+from voyager.fastjson import dumps_indented, loads
+
+# Reused for JSONL lines; json.dumps builds a new encoder per call when given options
+_LINE_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 
 def ensure_parent_dir(path: Path | str) -> Path:
     """Ensure the parent directory of a path exists.
@@ -47,6 +54,22 @@ def read_file(path: Path | str, default: str | None = None) -> str | None:
         return default
 
 
+@functools.lru_cache(maxsize=16)
+def read_static_file(path: str) -> str | None:
+    """Read a file that doesn't change while the process runs, once per path.
+
+    Intended for bundled assets such as prompt templates. Results (including
+    a missing file) are cached for the life of the process.
+
+    Args:
+        path: Path to the file, as a string so it can be used as a cache key.
+
+    Returns:
+        File contents as string, or None if file is missing/unreadable.
+    """
+    return read_file(path)
+
+
 def read_json(path: Path | str, default: Any = None) -> Any:
     """Read and parse a JSON file, returning default on any error.
 
@@ -57,37 +80,39 @@ def read_json(path: Path | str, default: Any = None) -> Any:
     Returns:
         Parsed JSON data, or default on any error.
     """
-    content = read_file(path)
-    if content is None:
+    try:
+        # Parse the raw bytes: orjson (when installed) skips a separate decode step
+        content = Path(path).read_bytes()
+    except (FileNotFoundError, PermissionError, OSError):
         return default
     try:
-        return json.loads(content)
+        return loads(content)
     except (json.JSONDecodeError, ValueError):
         return default
 
 
-def write_file(path: Path | str, content: str) -> bool:
+def write_file(path: Path | str, content: str, *, force: bool = False) -> bool:
     """Write content to a file atomically.
 
     Uses write-to-temp + rename pattern to ensure the file is never
-    left in a partial/corrupt state.
+    left in a partial/corrupt state. If the file already holds exactly
+    this content, it is left alone (mtime included).
 
     Args:
         path: Destination file path.
         content: String content to write.
+        force: Rewrite even if the content is unchanged, e.g. when the
+            file's mtime is used as a timestamp.
 
     Returns:
         True if write succeeded, False otherwise.
     """
     path = Path(path)
+    if not force and _has_content(path, content):
+        return True
     try:
-        ensure_parent_dir(path)
         # Create temp file in same directory for atomic rename
-        fd, tmp_path = tempfile.mkstemp(
-            suffix=".tmp",
-            prefix=path.name + ".",
-            dir=path.parent,
-        )
+        fd, tmp_path = _mkstemp_beside(path)
         try:
             with os.fdopen(fd, "w", encoding="utf-8") as f:
                 f.write(content)
@@ -103,10 +128,36 @@ def write_file(path: Path | str, content: str) -> bool:
         return False
 
 
+def _mkstemp_beside(path: Path) -> tuple[int, str]:
+    """Create a temp file in path's directory, creating the directory only if missing.
+
+    The directory usually exists, so it is created on FileNotFoundError
+    rather than with a mkdir call before every write.
+    """
+    try:
+        return tempfile.mkstemp(suffix=".tmp", prefix=path.name + ".", dir=path.parent)
+    except FileNotFoundError:
+        ensure_parent_dir(path)
+        return tempfile.mkstemp(suffix=".tmp", prefix=path.name + ".", dir=path.parent)
+
+
+def _has_content(path: Path, content: str) -> bool:
+    """Return True if path is a file holding exactly content (UTF-8)."""
+    data = content.encode("utf-8")
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
 def write_json(
     path: Path | str,
     data: Any,
     indent: int = 2,
+    *,
+    force: bool = False,
 ) -> bool:
     """Write data as JSON to a file atomically.
 
@@ -114,16 +165,18 @@ def write_json(
         path: Destination file path.
         data: Data to serialize as JSON.
         indent: JSON indentation level (default 2).
+        force: Rewrite even if the file already holds the same JSON.
 
     Returns:
         True if write succeeded, False otherwise.
     """
     try:
-        content = json.dumps(data, indent=indent, ensure_ascii=False)
+        # The default indent goes through the orjson fast path when available
+        content = dumps_indented(data) if indent == 2 else json.dumps(data, indent=indent, ensure_ascii=False)
         # Add trailing newline for POSIX compliance
         if not content.endswith("\n"):
             content += "\n"
-        return write_file(path, content)
+        return write_file(path, content, force=force)
     except (TypeError, ValueError):
         # JSON serialization failed
         return False
@@ -158,26 +211,77 @@ def read_jsonl(
     """
     path = Path(path)
 
-    items: list[Any] = []
+    try:
+        lines = path.read_bytes().splitlines()
+    except (FileNotFoundError, PermissionError, OSError):
+        return JsonlReadResult(items=default or [], total_lines=0, invalid_lines=0)
+
+    if max_lines is None:
+        items, invalid_lines = _parse_jsonl_lines([line for line in lines if line.strip()])
+        return JsonlReadResult(items=items, total_lines=len(lines), invalid_lines=invalid_lines)
+
+    items = []
     total_lines = 0
     invalid_lines = 0
+    for line in lines:
+        total_lines += 1
+        if not line.strip():
+            continue
+        try:
+            items.append(loads(line))
+        except (json.JSONDecodeError, ValueError):
+            invalid_lines += 1
+            continue
+        if len(items) >= max_lines:
+            break
+
+    return JsonlReadResult(
+        items=items,
+        total_lines=total_lines,
+        invalid_lines=invalid_lines,
+    )
+
+
+def tail_jsonl(
+    path: Path | str,
+    max_lines: int,
+    *,
+    default: list[Any] | None = None,
+    match: Callable[[bytes], object] | None = None,
+) -> JsonlReadResult:
+    """Read and parse only the last lines of a JSON Lines (JSONL) file.
+
+    Streams the file keeping a bounded window of raw lines, so only the tail
+    is decoded and parsed. Never raises. Invalid JSON lines in the tail are
+    skipped and counted.
+
+    Args:
+        path: Path to the JSONL file.
+        max_lines: Number of trailing non-blank lines to parse.
+        default: Default items to return if file is missing/unreadable.
+        match: Optional predicate on the raw line bytes (e.g. a compiled
+            bytes regex's ``search``); lines it rejects are skipped without
+            being decoded and don't count toward max_lines.
+
+    Returns:
+        JsonlReadResult with the parsed tail items; total_lines counts every
+        line in the file.
+    """
+    path = Path(path)
+
+    tail: deque[bytes] = deque(maxlen=max_lines)
+    total_lines = 0
 
     try:
-        with path.open("r", encoding="utf-8") as f:
+        with path.open("rb") as f:
             for line in f:
                 total_lines += 1
-                if not line.strip():
-                    continue
-                try:
-                    items.append(json.loads(line))
-                except (json.JSONDecodeError, ValueError):
-                    invalid_lines += 1
-                    continue
-                if max_lines is not None and len(items) >= max_lines:
-                    break
+                if not line.isspace() and (match is None or match(line)):
+                    tail.append(line)
     except (FileNotFoundError, PermissionError, OSError):
         return JsonlReadResult(items=default or [], total_lines=0, invalid_lines=0)
 
+    items, invalid_lines = _parse_jsonl_lines(list(tail))
     return JsonlReadResult(
         items=items,
         total_lines=total_lines,
@@ -185,11 +289,40 @@ def read_jsonl(
     )
 
 
+def _parse_jsonl_lines(lines: list[bytes]) -> tuple[list[Any], int]:
+    """Parse raw JSONL lines, returning (items, invalid line count).
+
+    When every line looks like a single object, they are parsed as one JSON
+    array in a single C-level call. If that fails or yields a different
+    number of items, lines are parsed one by one so that only the invalid
+    ones are dropped.
+    """
+    stripped = [line.strip() for line in lines]
+    if stripped and all(line[:1] == b"{" and line[-1:] == b"}" for line in stripped):
+        try:
+            items = loads(b"[" + b",".join(stripped) + b"]")
+        except (json.JSONDecodeError, ValueError):
+            pass
+        else:
+            if len(items) == len(stripped) and all(isinstance(item, dict) for item in items):
+                return items, 0
+
+    items = []
+    invalid_lines = 0
+    for line in stripped:
+        try:
+            items.append(loads(line))
+        except (json.JSONDecodeError, ValueError):
+            invalid_lines += 1
+    return items, invalid_lines
+
+
 def write_jsonl(
     path: Path | str,
     items: Iterable[Any],
     *,
     append: bool = False,
+    force: bool = False,
 ) -> bool:
     """Write items to a JSONL file.
 
@@ -198,29 +331,31 @@ def write_jsonl(
         items: Iterable of JSON-serializable items.
         append: If True, append to the file (not atomic). If False, replace
             the file atomically.
+        force: Rewrite even if the file already holds the same lines.
 
     Returns:
         True if write succeeded, False otherwise.
     """
     path = Path(path)
+
+    # Serialize everything before touching the file, so a bad item never
+    # leaves a truncated or partially appended file behind
     try:
-        ensure_parent_dir(path)
-    except (OSError, PermissionError):
+        content = "".join([_LINE_ENCODER.encode(item) + "\n" for item in items])
+    except (TypeError, ValueError):
         return False
+    if not (append or force) and _has_content(path, content):
+        return True
 
     mode = "a" if append else "w"
-
     try:
-        with path.open(mode, encoding="utf-8") as f:
-            for item in items:
-                try:
-                    line = json.dumps(item, ensure_ascii=False)
-                    f.write(line + "\n")
-                except (TypeError, ValueError):
-                    # Clean up partial file on error (only for non-append mode)
-                    if not append:
-                        safe_unlink(path)
-                    return False
+        try:
+            f = path.open(mode, encoding="utf-8")
+        except FileNotFoundError:
+            ensure_parent_dir(path)
+            f = path.open(mode, encoding="utf-8")
+        with f:
+            f.write(content)
         return True
     except (OSError, PermissionError):
         return False
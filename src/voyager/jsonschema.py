@@ -2,20 +2,79 @@
 
 Provides schema validation with a safe API that never raises exceptions
 in normal operation - returns validation results instead.
+
+When jsonschema-rs is installed (pip install voyager[speedups]), schema
+files are also compiled with it and valid data is accepted without going
+through the pure-Python validator. Invalid data is still reported by
+jsonschema, so error messages are the same with or without it.
 """
 
 from __future__ import annotations
 
+import importlib.util
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
-
-from jsonschema import Draft202012Validator, ValidationError
+from typing import TYPE_CHECKING, Any
 
 from voyager.io import read_json
 from voyager.logging import get_logger
 
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator, ValidationError
+
 _logger = get_logger("jsonschema")
 
+# Checked without importing; the module is loaded when a schema file is compiled
+JSONSCHEMA_RS_AVAILABLE = importlib.util.find_spec("jsonschema_rs") is not None
+
+
+class _SchemaValidator:
+    """A Draft 2020-12 validator, optionally backed by jsonschema-rs."""
+
+    def __init__(self, schema: dict[str, Any], *, fast: bool = False):
+        """Compile a schema.
+
+        Args:
+            schema: Parsed JSON Schema.
+            fast: Also compile it with jsonschema-rs, if installed. Worth it
+                only for validators that are reused across calls.
+        """
+        self._schema = schema
+        self._full: Draft202012Validator | None = None
+        self._fast = _compile_fast(schema) if fast and JSONSCHEMA_RS_AVAILABLE else None
+
+    def iter_errors(self, data: Any) -> Iterator[ValidationError]:
+        """Yield jsonschema errors for data (none if it is valid)."""
+        if self._fast is not None:
+            try:
+                if self._fast.is_valid(data):
+                    return iter(())
+            except ValueError:
+                # Not representable for jsonschema-rs (e.g. non-str keys)
+                pass
+        if self._full is None:
+            # Imported on first use: jsonschema is slow to import and many CLI
+            # runs never validate anything
+            from jsonschema import Draft202012Validator
+
+            self._full = Draft202012Validator(self._schema)
+        return self._full.iter_errors(data)
+
+
+def _compile_fast(schema: dict[str, Any]) -> Any | None:
+    """Compile schema with jsonschema-rs, or return None if it can't be."""
+    try:
+        import jsonschema_rs
+
+        return jsonschema_rs.Draft202012Validator(schema)
+    except Exception as e:
+        _logger.debug("jsonschema-rs could not compile schema: %s", e)
+        return None
+
+
+# Validators for schema files, keyed by path: ((inode, mtime_ns, size), validator)
+_validators: dict[Path, tuple[tuple[int, int, int], _SchemaValidator]] = {}
+
 
 def validate(data: Any, schema: dict[str, Any] | Path | str) -> tuple[bool, list[str]]:
     """Validate data against a JSON Schema.
@@ -29,14 +88,13 @@ def validate(data: Any, schema: dict[str, Any] | Path | str) -> tuple[bool, list
         Never raises - returns (False, [error]) on any failure.
     """
     try:
-        # Load schema if it's a path
         if isinstance(schema, (Path, str)):
-            loaded = read_json(schema)
-            if loaded is None:
+            validator = _load_validator(Path(schema))
+            if validator is None:
                 return False, [f"Could not load schema from {schema}"]
-            schema = loaded
+        else:
+            validator = _SchemaValidator(schema)
 
-        validator = Draft202012Validator(schema)
         errors = list(validator.iter_errors(data))
 
         if errors:
@@ -54,6 +112,32 @@ def validate(data: Any, schema: dict[str, Any] | Path | str) -> tuple[bool, list
         return False, [msg]
 
 
+def _load_validator(path: Path) -> _SchemaValidator | None:
+    """Return a validator for a schema file, reused until the file changes.
+
+    Keyed like MtimeCache by (inode, mtime_ns, size); missing or invalid
+    schema files are never cached.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        _validators.pop(path, None)
+        return None
+
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    entry = _validators.get(path)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+
+    loaded = read_json(path)
+    if loaded is None:
+        return None
+
+    validator = _SchemaValidator(loaded, fast=True)
+    _validators[path] = (stamp, validator)
+    return validator
+
+
 def _format_error(error: ValidationError) -> str:
     """Format a validation error as a readable string."""
     parts = []
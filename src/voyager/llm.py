@@ -17,10 +17,6 @@ import os
 from dataclasses import dataclass, field
 from pathlib import Path
 
-import anyio
-from claude_agent_sdk import ClaudeAgentOptions, query
-from claude_agent_sdk.types import AssistantMessage, ResultMessage, ToolUseBlock
-
 from voyager.logging import get_logger
 
 _logger = get_logger("llm")
@@ -75,6 +71,11 @@ async def _run_agent(
     Returns:
         Tuple of (output_text, list_of_files_written).
     """
+    # The SDK takes most of a second to import; CLIs that exit early
+    # (recursion guard, cache hits) never pay for it
+    from claude_agent_sdk import ClaudeAgentOptions, query
+    from claude_agent_sdk.types import AssistantMessage, ResultMessage, ToolUseBlock
+
     options = ClaudeAgentOptions(
         cwd=str(cwd) if cwd else None,
         system_prompt=system_prompt,
@@ -131,6 +132,7 @@ def call_claude(
     os.environ[RECURSION_GUARD_VAR] = "1"
 
     try:
+        import anyio
 
         async def _with_timeout() -> tuple[str, list[str]]:
             with anyio.fail_after(timeout_seconds):
@@ -0,0 +1,102 @@
+"""Exact-match cache for LLM-generated state files.
+
+curriculum plan and skill propose ask the agent to write a JSON file from
+a set of inputs (brain, snapshot, curriculum, ...). When a later run sees
+exactly the same inputs, the previous output is reused and the LLM call
+is skipped.
+
+Entries live in .claude/voyager/llm_cache/<key>.json and expire after
+a TTL, so a re-run eventually gets a fresh answer even for unchanged inputs.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from voyager.config import get_llm_cache_dir
+from voyager.fastjson import dumps_compact
+from voyager.io import read_json, write_json
+from voyager.logging import get_logger
+
+_logger = get_logger("llm_cache")
+
+# How long a cached output may be reused (24 hours)
+DEFAULT_LLM_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def llm_cache_key(kind: str, inputs: dict[str, Any]) -> str:
+    """Compute a cache key from everything that shapes an LLM output.
+
+    Args:
+        kind: Output kind (e.g. "curriculum"), so different commands never collide.
+        inputs: JSON-serializable inputs; volatile values such as the current
+            timestamp must be left out or nothing will ever match.
+
+    Returns:
+        Hex digest identifying the inputs.
+    """
+    payload = dumps_compact({"kind": kind, "inputs": inputs})
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_cached_output(key: str, *, ttl_seconds: float = DEFAULT_LLM_CACHE_TTL_SECONDS) -> Any | None:
+    """Return the cached output for key if present and not expired.
+
+    Args:
+        key: Key from llm_cache_key().
+        ttl_seconds: Maximum age of a reusable entry.
+
+    Returns:
+        The cached JSON data, or None on a miss.
+    """
+    path = get_llm_cache_dir() / f"{key}.json"
+    try:
+        age = time.time() - path.stat().st_mtime
+    except OSError:
+        return None
+    if age > ttl_seconds:
+        return None
+    data = read_json(path)
+    if data is not None:
+        _logger.debug("LLM cache hit for %s", key)
+    return data
+
+
+def store_cached_output(key: str, data: Any, *, ttl_seconds: float = DEFAULT_LLM_CACHE_TTL_SECONDS) -> bool:
+    """Cache an LLM output under key, dropping entries that have expired.
+
+    Keys hash volatile inputs such as the brain, so most entries are never
+    hit again; pruning on store keeps the directory from growing without bound.
+
+    Args:
+        key: Key from llm_cache_key().
+        data: JSON-serializable output to cache.
+        ttl_seconds: Entries older than this are deleted.
+
+    Returns:
+        True if the entry was written.
+    """
+    cache_dir = get_llm_cache_dir()
+    _prune_expired(cache_dir, ttl_seconds)
+    # The file mtime is the entry's age, so refresh it even for identical output
+    return write_json(cache_dir / f"{key}.json", data, force=True)
+
+
+def _prune_expired(cache_dir: Path, ttl_seconds: float) -> None:
+    """Delete cache entries older than ttl_seconds."""
+    cutoff = time.time() - ttl_seconds
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                with contextlib.suppress(OSError):
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+    except OSError:
+        return
@@ -2,6 +2,11 @@
 
 Provides consistent stderr logging that keeps stdout clean for hook
 responses. Designed for minimal noise by default (WARNING level).
+
+Pass values as %-style arguments (``logger.debug("Loaded %d skills", n)``)
+rather than pre-formatting them, so disabled levels cost only the level
+check. Arguments that are expensive to compute should be guarded with
+``logger.isEnabledFor(logging.DEBUG)``.
 """
 
 from __future__ import annotations
@@ -6,8 +6,13 @@ with zero-config defaults. Default location: ./.claude/voyager/feedback.db
 
 from __future__ import annotations
 
+import contextlib
+import importlib.util
 import json
+import os
 import sqlite3
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -18,6 +23,54 @@ from voyager.logging import get_logger
 
 _logger = get_logger("refinement.store")
 
+# Optional columnar cold archive (pip install voyager[archive])
+ARCHIVE_AVAILABLE = importlib.util.find_spec("duckdb") is not None and importlib.util.find_spec("pyarrow") is not None
+ARCHIVE_DIR_NAME = "feedback-archive"
+
+# WAL maintenance: checkpoint every N pages, run maintain() at most every N seconds
+WAL_AUTOCHECKPOINT_PAGES = 1000
+OPTIMIZE_INTERVAL_SECONDS = 900
+MAINTENANCE_STAMP_SUFFIX = "-maintained"
+
+_TOOL_EXECUTIONS_COLUMNS = (
+    "id, session_id, tool_name, tool_input, tool_response, success, error_message, duration_ms, skill_used, timestamp"
+)
+_INSERT_TOOL_EXECUTION_SQL = """
+    INSERT INTO tool_executions
+    (session_id, tool_name, tool_input, tool_response, success,
+     error_message, duration_ms, skill_used, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_TOOL_EXECUTIONS_DDL = """
+    CREATE TABLE {table} (
+        id INTEGER PRIMARY KEY,
+        session_id TEXT NOT NULL,
+        tool_name TEXT NOT NULL,
+        tool_input TEXT,
+        tool_response TEXT,
+        success BOOLEAN NOT NULL,
+        error_message TEXT,
+        duration_ms INTEGER,
+        skill_used TEXT,
+        timestamp TEXT NOT NULL
+    )
+"""
+
+# Arrow types for archived tool_executions, mirroring _TOOL_EXECUTIONS_DDL.
+# Declared up front because pyarrow infers an all-NULL column as `null`.
+_ARCHIVE_COLUMN_TYPES = (
+    ("id", "int64"),
+    ("session_id", "string"),
+    ("tool_name", "string"),
+    ("tool_input", "string"),
+    ("tool_response", "string"),
+    ("success", "bool_"),
+    ("error_message", "string"),
+    ("duration_ms", "int64"),
+    ("skill_used", "string"),
+    ("timestamp", "string"),
+)
+
 
 @dataclass
 class ToolExecution:
@@ -98,32 +151,105 @@ class FeedbackStore:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_db()
 
+    @staticmethod
+    def has_executions(db_path: Path | str) -> bool:
+        """Check whether a database holds any tool executions, without initializing it.
+
+        Opens the file read-only, so unlike constructing a store it never
+        creates the schema, runs migrations, or switches the journal mode.
+
+        Args:
+            db_path: Path to SQLite database.
+
+        Returns:
+            False if the database is missing, has no tool_executions table, or
+            the table is empty; True otherwise (including when it can't be read).
+        """
+        path = Path(db_path)
+        if not path.exists():
+            return False
+        try:
+            conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        except sqlite3.Error:
+            return True
+        try:
+            return conn.execute("SELECT EXISTS (SELECT 1 FROM tool_executions)").fetchone()[0] == 1
+        except sqlite3.OperationalError as e:
+            return "no such table" not in str(e)
+        finally:
+            conn.close()
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection with row factory."""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # In WAL mode NORMAL stays consistent and only syncs at checkpoints,
+        # so per-tool-use commits from the hook don't each wait on fsync. The
+        # hook never checkpoints itself; wal_autocheckpoint runs a PASSIVE one
+        # once the WAL reaches the page limit, and maintain() is for other callers
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA wal_autocheckpoint={WAL_AUTOCHECKPOINT_PAGES}")
         return conn
 
+    @staticmethod
+    def _optimize(conn: sqlite3.Connection) -> None:
+        """Refresh query planner statistics (bounded, cheap when up to date)."""
+        conn.execute("PRAGMA analysis_limit=400")
+        conn.execute("PRAGMA optimize=0x10002")
+
+    @property
+    def maintenance_stamp_path(self) -> Path:
+        """File whose mtime records the last maintain() run."""
+        return self.db_path.with_name(self.db_path.name + MAINTENANCE_STAMP_SUFFIX)
+
+    def maintain(self, *, force: bool = False) -> bool:
+        """Refresh planner statistics and truncate the WAL, at most once per interval.
+
+        Each store usually lives for a single hook or CLI process, so the last
+        run is recorded on disk rather than in memory. Meant for user-facing
+        callers (insights, archive); the per-tool-use hook leaves the WAL to
+        wal_autocheckpoint.
+
+        Args:
+            force: Run even if the last maintenance is under
+                OPTIMIZE_INTERVAL_SECONDS old.
+
+        Returns:
+            True if maintenance ran.
+        """
+        stamp = self.maintenance_stamp_path
+        if not force:
+            try:
+                if time.time() - stamp.stat().st_mtime < OPTIMIZE_INTERVAL_SECONDS:
+                    return False
+            except OSError:
+                pass
+
+        conn = self._get_connection()
+        try:
+            self._optimize(conn)
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            _logger.debug("Feedback database maintenance failed: %s", e)
+            return False
+        finally:
+            conn.close()
+
+        with contextlib.suppress(OSError):
+            stamp.touch()
+        return True
+
     def _init_db(self) -> None:
         """Initialize database schema."""
         conn = self._get_connection()
         c = conn.cursor()
 
-        # Tool executions table
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS tool_executions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT NOT NULL,
-                tool_name TEXT NOT NULL,
-                tool_input TEXT,
-                tool_response TEXT,
-                success BOOLEAN NOT NULL,
-                error_message TEXT,
-                duration_ms INTEGER,
-                skill_used TEXT,
-                timestamp TEXT NOT NULL
-            )
-        """)
+        # WAL lets hook writers and insight readers proceed concurrently
+        c.execute("PRAGMA journal_mode=WAL")
+
+        # Tool executions table (id aliases rowid; no sqlite_sequence upkeep)
+        self._migrate_tool_executions_autoincrement(c)
+        c.execute(_TOOL_EXECUTIONS_DDL.format(table="IF NOT EXISTS tool_executions"))
 
         # Session summaries table
         c.execute("""
@@ -163,6 +289,24 @@ class FeedbackStore:
         conn.close()
         _logger.debug("Initialized feedback database at %s", self.db_path)
 
+    @staticmethod
+    def _migrate_tool_executions_autoincrement(c: sqlite3.Cursor) -> None:
+        """Rebuild tool_executions without AUTOINCREMENT if an old schema is found.
+
+        No-op for new databases and for databases that were already migrated.
+        Indexes are dropped with the old table and recreated by `_init_db`.
+        """
+        c.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'tool_executions'")
+        row = c.fetchone()
+        if row is None or "AUTOINCREMENT" not in row["sql"].upper():
+            return
+
+        c.execute(_TOOL_EXECUTIONS_DDL.format(table="tool_executions_new"))
+        c.execute(f"INSERT INTO tool_executions_new SELECT {_TOOL_EXECUTIONS_COLUMNS} FROM tool_executions")
+        c.execute("DROP TABLE tool_executions")
+        c.execute("ALTER TABLE tool_executions_new RENAME TO tool_executions")
+        _logger.info("Migrated tool_executions table to drop AUTOINCREMENT")
+
     def log_tool_execution(self, execution: ToolExecution) -> int:
         """Log a tool execution.
 
@@ -176,12 +320,7 @@ class FeedbackStore:
         c = conn.cursor()
 
         c.execute(
-            """
-            INSERT INTO tool_executions
-            (session_id, tool_name, tool_input, tool_response, success,
-             error_message, duration_ms, skill_used, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _INSERT_TOOL_EXECUTION_SQL,
             (
                 execution.session_id,
                 execution.tool_name,
@@ -206,6 +345,42 @@ class FeedbackStore:
         )
         return row_id or 0
 
+    def log_tool_executions(self, executions: Iterable[ToolExecution]) -> int:
+        """Log many tool executions in a single transaction.
+
+        Values are gathered column-wise (one list per field) and zipped into
+        executemany, avoiding a per-row tuple build and per-row commit.
+
+        Args:
+            executions: Tool execution records to insert.
+
+        Returns:
+            Number of rows inserted.
+        """
+        columns: list[list[Any]] = [[] for _ in range(9)]
+        session_ids, tool_names, inputs, responses, successes, errors, durations, skills, timestamps = columns
+        for execution in executions:
+            session_ids.append(execution.session_id)
+            tool_names.append(execution.tool_name)
+            inputs.append(json.dumps(execution.tool_input))
+            responses.append(json.dumps(execution.tool_response) if execution.tool_response else None)
+            successes.append(execution.success)
+            errors.append(execution.error_message)
+            durations.append(execution.duration_ms)
+            skills.append(execution.skill_used)
+            timestamps.append(execution.timestamp)
+
+        count = len(session_ids)
+        if not count:
+            return 0
+
+        conn = self._get_connection()
+        conn.executemany(_INSERT_TOOL_EXECUTION_SQL, zip(*columns, strict=True))
+        conn.commit()
+        conn.close()
+        _logger.debug("Logged %d tool executions", count)
+        return count
+
     def log_session_summary(self, summary: SessionSummary) -> None:
         """Log or update a session summary.
 
@@ -217,10 +392,20 @@ class FeedbackStore:
 
         c.execute(
             """
-            INSERT OR REPLACE INTO session_summaries
+            INSERT INTO session_summaries
             (session_id, prompt, tools_used, skills_detected, total_tool_calls,
              successful_calls, failed_calls, task_completed, completion_feedback, timestamp)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(session_id) DO UPDATE SET
+                prompt = excluded.prompt,
+                tools_used = excluded.tools_used,
+                skills_detected = excluded.skills_detected,
+                total_tool_calls = excluded.total_tool_calls,
+                successful_calls = excluded.successful_calls,
+                failed_calls = excluded.failed_calls,
+                task_completed = excluded.task_completed,
+                completion_feedback = excluded.completion_feedback,
+                timestamp = excluded.timestamp
             """,
             (
                 summary.session_id,
@@ -369,7 +554,7 @@ class FeedbackStore:
                 "error": r["error_message"],
                 "count": r["count"],
                 "tool": r["tool_name"],
-                "skill": skill_id if skill_id else r.get("skill_used"),
+                "skill": skill_id if skill_id else r["skill_used"],
             }
             for r in c.fetchall()
         ]
@@ -377,6 +562,52 @@ class FeedbackStore:
         conn.close()
         return results
 
+    def get_top_errors_per_skill(self, limit_per_skill: int = 3) -> dict[str, list[dict[str, Any]]]:
+        """Get the most common errors of every skill in one query.
+
+        Equivalent to calling get_common_errors(skill_id, limit_per_skill)
+        for each skill, without a query per skill.
+
+        Args:
+            limit_per_skill: Maximum number of errors to return per skill.
+
+        Returns:
+            Dict mapping skill_id to a list of dicts with error and count,
+            most frequent first. Skills without errors are omitted.
+        """
+        conn = self._get_connection()
+        c = conn.cursor()
+
+        c.execute(
+            """
+            SELECT skill_used, error_message, count, tool_name FROM (
+                SELECT skill_used, error_message, COUNT(*) AS count, tool_name,
+                       ROW_NUMBER() OVER (PARTITION BY skill_used ORDER BY COUNT(*) DESC) AS rn
+                FROM tool_executions
+                WHERE skill_used IS NOT NULL AND NOT success AND error_message IS NOT NULL
+                GROUP BY skill_used, error_message
+            )
+            WHERE rn <= ?
+            ORDER BY skill_used, rn
+            """,
+            (limit_per_skill,),
+        )
+
+        results: dict[str, list[dict[str, Any]]] = {}
+        for r in c.fetchall():
+            skill_id = r["skill_used"]
+            results.setdefault(skill_id, []).append(
+                {
+                    "error": r["error_message"],
+                    "count": r["count"],
+                    "tool": r["tool_name"],
+                    "skill": skill_id,
+                }
+            )
+
+        conn.close()
+        return results
+
     def get_tool_usage_stats(self) -> dict[str, dict[str, Any]]:
         """Get tool usage statistics.
 
@@ -408,6 +639,79 @@ class FeedbackStore:
         conn.close()
         return results
 
+    def get_all_stats(self, error_limit: int = 5) -> dict[str, Any]:
+        """Get skill stats, tool stats, and common errors in a single scan.
+
+        Equivalent to calling get_skill_stats(), get_tool_usage_stats() and
+        get_common_errors() back-to-back, but reads tool_executions once.
+
+        Args:
+            error_limit: Maximum number of errors to return.
+
+        Returns:
+            Dict with "skills", "tools" and "errors" keys, each shaped like the
+            result of the corresponding single-purpose method.
+        """
+        conn = self._get_connection()
+        c = conn.cursor()
+
+        c.execute("PRAGMA temp_store=MEMORY")
+        c.execute(
+            """
+            WITH e AS MATERIALIZED (
+                SELECT skill_used, tool_name, success, error_message FROM tool_executions
+            )
+            SELECT 'skill' AS kind, skill_used AS key, COUNT(*) AS total,
+                   SUM(CASE WHEN success THEN 1 ELSE 0 END) AS successful,
+                   NULL AS err_tool, NULL AS err_skill
+            FROM e WHERE skill_used IS NOT NULL GROUP BY skill_used
+            UNION ALL
+            SELECT 'tool', tool_name, COUNT(*), SUM(CASE WHEN success THEN 1 ELSE 0 END), NULL, NULL
+            FROM e GROUP BY tool_name
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'error', error_message, COUNT(*) AS count, 0, tool_name, skill_used
+                FROM e WHERE NOT success AND error_message IS NOT NULL
+                GROUP BY error_message
+                ORDER BY count DESC
+                LIMIT ?
+            )
+            """,
+            (error_limit,),
+        )
+
+        skills: dict[str, dict[str, Any]] = {}
+        tools: dict[str, dict[str, Any]] = {}
+        errors: list[dict[str, Any]] = []
+        for row in c.fetchall():
+            kind = row["kind"]
+            total = row["total"]
+            if kind == "error":
+                errors.append(
+                    {
+                        "error": row["key"],
+                        "count": total,
+                        "tool": row["err_tool"],
+                        "skill": row["err_skill"],
+                    }
+                )
+                continue
+            successful = row["successful"]
+            target = skills if kind == "skill" else tools
+            target[row["key"]] = {
+                "total": total,
+                "successful": successful,
+                "failed": total - successful,
+                "success_rate": successful / total if total > 0 else 0,
+            }
+
+        conn.close()
+        return {
+            "skills": skills,
+            "tools": dict(sorted(tools.items(), key=lambda x: x[1]["total"], reverse=True)),
+            "errors": sorted(errors, key=lambda x: x["count"], reverse=True),
+        }
+
     # Learned associations methods
 
     def get_learned_association(self, context_key: str) -> str | None:
@@ -544,6 +848,118 @@ class FeedbackStore:
             "total_skills": total_skills,
         }
 
+    # Cold archive methods
+
+    @property
+    def archive_dir(self) -> Path:
+        """Directory holding Parquet files of archived tool executions."""
+        return self.db_path.parent / ARCHIVE_DIR_NAME
+
+    def archive(self, before_ts: str) -> int:
+        """Move tool executions older than a timestamp into a Parquet file.
+
+        Rows are written to `feedback-archive/feedback-<UTC timestamp>.parquet`
+        and deleted from SQLite, so analytics over old data run on a columnar
+        file instead of the row store. The file is moved into place just
+        before the DELETE is committed and removed again if the delete or
+        commit fails, so a failed archive leaves the rows live only once.
+
+        Args:
+            before_ts: ISO timestamp; rows with an earlier timestamp are archived.
+
+        Returns:
+            Number of rows archived (0 if none, or if the archive extra is missing).
+        """
+        if not ARCHIVE_AVAILABLE:
+            _logger.warning("Archiving requires duckdb and pyarrow (pip install voyager[archive])")
+            return 0
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        conn = self._get_connection()
+        tmp: Path | None = None
+        target: Path | None = None
+        placed = False
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                f"SELECT {_TOOL_EXECUTIONS_COLUMNS} FROM tool_executions WHERE timestamp < ? ORDER BY id",
+                (before_ts,),
+            ).fetchall()
+            if not rows:
+                conn.rollback()
+                return 0
+
+            schema = pa.schema([(name, getattr(pa, type_name)()) for name, type_name in _ARCHIVE_COLUMN_TYPES])
+            columns = {name: [row[name] for row in rows] for name in schema.names}
+            columns["success"] = [bool(v) for v in columns["success"]]
+
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%f")
+            target = self.archive_dir / f"feedback-{stamp}.parquet"
+            tmp = target.with_suffix(".parquet.tmp")
+            pq.write_table(pa.Table.from_pydict(columns, schema=schema), tmp)
+
+            conn.execute("DELETE FROM tool_executions WHERE timestamp < ?", (before_ts,))
+            os.replace(tmp, target)
+            placed = True
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            # Rows stay live, so drop the file that would count them a second time
+            if placed and target is not None:
+                target.unlink(missing_ok=True)
+            elif tmp is not None:
+                tmp.unlink(missing_ok=True)
+            raise
+        finally:
+            conn.close()
+
+        _logger.info("Archived %d tool executions to %s", len(rows), target)
+        self.maintain()
+        return len(rows)
+
+    def get_skill_stats_with_archive(self, skill_id: str | None = None) -> dict[str, Any]:
+        """Get skill stats over live rows plus any archived Parquet files.
+
+        Archived rows are aggregated by DuckDB and merged with get_skill_stats().
+
+        Args:
+            skill_id: Optional skill ID to filter by.
+
+        Returns:
+            Dict mapping skill_id to stats (total, successful, failed, success_rate).
+        """
+        results = self.get_skill_stats(skill_id)
+        if not ARCHIVE_AVAILABLE or not any(self.archive_dir.glob("feedback-*.parquet")):
+            return results
+
+        import duckdb
+
+        pattern = str(self.archive_dir / "feedback-*.parquet").replace("'", "''")
+        sql = f"""
+            SELECT skill_used, COUNT(*) AS total,
+                   SUM(CASE WHEN success THEN 1 ELSE 0 END) AS successful
+            FROM read_parquet('{pattern}', union_by_name = true)
+            WHERE skill_used IS NOT NULL {"AND skill_used = ?" if skill_id else ""}
+            GROUP BY skill_used
+        """
+        with duckdb.connect() as db:
+            archived = db.execute(sql, [skill_id] if skill_id else []).fetchall()
+
+        for skill, total, successful in archived:
+            current = results.get(skill, {"total": 0, "successful": 0})
+            total += current["total"]
+            successful += current["successful"]
+            results[skill] = {
+                "total": total,
+                "successful": successful,
+                "failed": total - successful,
+                "success_rate": successful / total if total > 0 else 0,
+            }
+        return results
+
     def reset(self) -> None:
         """Reset the database (delete all data)."""
         conn = self._get_connection()
@@ -7,13 +7,18 @@ git is unavailable.
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
 import shutil
 import subprocess
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from fnmatch import fnmatchcase
+from fnmatch import translate
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, cast
 
 # Bounds to keep output compact
 MAX_TOP_LEVEL_ENTRIES = 50
@@ -22,6 +27,8 @@ MAX_HINT_LINES = 20
 MAX_HINT_LINE_LENGTH = 200
 MAX_HINT_FILE_BYTES = 64_000
 HINT_FILES = ("README*", "CONTRIBUTING*", "Makefile", "justfile", "package.json")
+# One regex for all HINT_FILES globs; the matching group gives the pattern's priority
+_HINT_FILES_REGEX = re.compile("|".join(f"(?P<p{i}>{translate(p)})" for i, p in enumerate(HINT_FILES)))
 HINT_PATTERNS = [
     r"^#+\s*(getting started|quick start|installation|usage|how to|running)",
     r"^(npm|yarn|pnpm|bun)\s+(run|install|start|dev|build|test)",
@@ -30,10 +37,31 @@ HINT_PATTERNS = [
     r"^(cargo|go|gradle|maven)\s+(run|build|test)",
     r"^\$\s+",  # Shell command examples
 ]
+# Single bytes alternation: each line is tested once and only matches are decoded
+_HINT_REGEX = re.compile("|".join(f"(?:{p})" for p in HINT_PATTERNS).encode(), re.IGNORECASE)
 
 # Directory summary bounds
 DIR_SUMMARY_MAX_DEPTH = 4
 DIR_SUMMARY_MAX_ITEMS = 1000
+# Top-level directories counted concurrently when walking without fd
+# (scandir releases the GIL); override with VOYAGER_SNAPSHOT_WORKERS
+DIR_SUMMARY_WORKERS = 4
+DIR_SUMMARY_MAX_WORKERS = 8
+
+# Dependency/build/cache directories skipped by name before consulting .gitignore
+FAST_SKIP_DIRS = frozenset(
+    {
+        "node_modules",
+        ".venv",
+        "venv",
+        "target",
+        "dist",
+        "build",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+    }
+)
 
 # Optional "tree" view bounds (fd + tree)
 FD_MAX_RESULTS = 5000
@@ -74,14 +102,24 @@ def _run_cmd(
     return None
 
 
-def _fd_list(
-    root: Path,
-    *,
-    include_hidden: bool,
-    max_depth: int | None,
-    max_results: int,
-    types: list[str],
-) -> list[str] | None:
+@dataclass(frozen=True)
+class _FdListing:
+    """Recursive file listing of a repo from one fd invocation (paths relative to root)."""
+
+    files: list[str]
+    # First path component of every nested file
+    top_dirs: set[str]
+    truncated: bool
+
+
+def _fd_snapshot(root: Path) -> _FdListing | None:
+    """List files under root with a single fd call.
+
+    The same listing feeds the top-level entries, directory summary and tree
+    view, so fd is only spawned once per snapshot. Only files are listed, so
+    FD_MAX_RESULTS is spent on files alone; directories are derived from the
+    file paths rather than fd's trailing '/' marker, which fd 8.x omits.
+    """
     fd = _find_fd_binary()
     if fd is None:
         return None
@@ -92,26 +130,32 @@ def _fd_list(
         "--exclude",
         ".git",
         "--no-require-git",
+        "--hidden",
         "--max-results",
-        str(max_results),
+        str(FD_MAX_RESULTS),
+        "--type",
+        "f",
+        # Match everything.
+        ".",
     ]
-    if include_hidden:
-        cmd.append("--hidden")
-    if max_depth is not None:
-        cmd.extend(["--max-depth", str(max_depth)])
-    for t in types:
-        cmd.extend(["--type", t])
-
-    # Match everything.
-    cmd.append(".")
 
     out = _run_cmd(cmd, cwd=root, timeout=1.0)
     if out is None:
         return None
 
-    items = [line.strip() for line in out.splitlines() if line.strip()]
-    # fd prints directories with trailing '/', normalize.
-    return [item[:-1] if item.endswith("/") else item for item in items]
+    files = [item for line in out.splitlines() if (item := line.strip())]
+    top_dirs = {rel.partition("/")[0] for rel in files if "/" in rel}
+    return _FdListing(files=files, top_dirs=top_dirs, truncated=len(files) >= FD_MAX_RESULTS)
+
+
+def _feed_stdin(stdin: IO[str], files: list[str]) -> None:
+    """Write the file list to a process's stdin, stopping quietly if it exits early."""
+    try:
+        for rel in files:
+            stdin.write(rel + "\n")
+        stdin.close()
+    except (OSError, ValueError):
+        pass
 
 
 def _build_tree_from_file_list(root: Path, files: list[str]) -> str | None:
@@ -119,48 +163,63 @@ def _build_tree_from_file_list(root: Path, files: list[str]) -> str | None:
     if tree is None:
         return None
 
-    stdin = "\n".join(files) + ("\n" if files else "")
-    out = _run_cmd(
-        [
-            tree,
-            "--fromfile",
-            "--noreport",
-            "--charset",
-            "ascii",
-            "-L",
-            str(TREE_MAX_DEPTH),
-        ],
-        cwd=root,
-        timeout=1.0,
-        input_text=stdin,
-    )
-    if out is None:
+    try:
+        proc = subprocess.Popen(
+            [
+                tree,
+                "--fromfile",
+                "--noreport",
+                "--charset",
+                "ascii",
+                "-L",
+                str(TREE_MAX_DEPTH),
+            ],
+            cwd=root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except OSError:
         return None
+    stdin, stdout = cast(IO[str], proc.stdin), cast(IO[str], proc.stdout)
+
+    # Feed stdin from a thread and read output as it arrives, so tree is
+    # stopped as soon as the output bounds are reached.
+    writer = threading.Thread(target=_feed_stdin, args=(stdin, files), daemon=True)
+    writer.start()
+    deadline = threading.Timer(1.0, proc.kill)
+    deadline.start()
 
-    # Bound output.
     lines: list[str] = []
     total_chars = 0
-    for line in out.splitlines():
-        if len(lines) >= TREE_MAX_LINES:
-            break
-        if total_chars + len(line) + 1 > TREE_MAX_CHARS:
-            break
-        lines.append(line.rstrip())
-        total_chars += len(line) + 1
+    bounded = False
+    try:
+        for line in stdout:
+            line = line.rstrip()
+            if len(lines) >= TREE_MAX_LINES or total_chars + len(line) + 1 > TREE_MAX_CHARS:
+                bounded = True
+                break
+            lines.append(line)
+            total_chars += len(line) + 1
+    finally:
+        timed_out = deadline.finished.is_set()
+        deadline.cancel()
+        if proc.poll() is None:
+            proc.kill()
+        stdout.close()
+        returncode = proc.wait()
+        writer.join(timeout=1.0)
+
+    if timed_out or (not bounded and returncode != 0):
+        return None
     return "\n".join(lines).strip() if lines else None
 
 
 def _directory_summary_from_files(files: list[str]) -> dict[str, int]:
-    summary: dict[str, int] = {}
-    for rel in files:
-        parts = rel.split("/", 1)
-        if len(parts) < 2:
-            continue  # file at root, not part of a top-level dir summary
-        top = parts[0]
-        if top.startswith("."):
-            continue
-        summary[top] = min(summary.get(top, 0) + 1, DIR_SUMMARY_MAX_ITEMS)
-    return summary
+    # Files at the root are not part of a top-level dir summary
+    counts = Counter(rel.partition("/")[0] for rel in files if "/" in rel and not rel.startswith("."))
+    return {top: min(count, DIR_SUMMARY_MAX_ITEMS) for top, count in counts.items()}
 
 
 @dataclass(frozen=True)
@@ -178,13 +237,71 @@ class _Gitignore:
     exclude large build/vendor directories for fast repo snapshots.
     """
 
-    def __init__(self, rules: list[_IgnoreRule]) -> None:
+    def __init__(
+        self,
+        rules: list[_IgnoreRule],
+        matchers: dict[bool, tuple[re.Pattern[str] | None, re.Pattern[str] | None]] | None = None,
+    ) -> None:
         self._rules = rules
+        # Compiled unions keyed by is_dir: (full-path matcher, per-component matcher)
+        if matchers is None:
+            matchers = {is_dir: self._compile(rules, is_dir=is_dir) for is_dir in (False, True)}
+        self._matchers = matchers
+        # Per-path memo; lives only as long as this matcher (one walk)
+        self._cache: dict[tuple[str, bool], bool] = {}
+
+    @staticmethod
+    def _compile(rules: list[_IgnoreRule], *, is_dir: bool) -> tuple[re.Pattern[str] | None, re.Pattern[str] | None]:
+        """Build regex unions for the rules that apply to files or directories.
+
+        Alternatives are ordered from the last rule to the first and each one is
+        a named group `r<index>`, so the group that matches identifies the last
+        matching rule (gitignore's "last match wins").
+        """
+        path_alts: list[str] = []
+        part_alts: list[str] = []
+        for index in reversed(range(len(rules))):
+            rule = rules[index]
+            if rule.dir_only and not is_dir:
+                continue
+            alt = f"(?P<r{index}>{translate(rule.pattern)})"
+            if rule.anchored or "/" in rule.pattern:
+                path_alts.append(alt)
+            else:
+                part_alts.append(alt)
+        return (
+            re.compile("|".join(path_alts)) if path_alts else None,
+            re.compile("|".join(part_alts)) if part_alts else None,
+        )
 
     @classmethod
     def from_root(cls, root: Path) -> _Gitignore:
-        rules: list[_IgnoreRule] = []
+        """Return a matcher for root/.gitignore.
+
+        The parsed and compiled rules are reused until the file changes; each
+        call gets a fresh is_ignored memo, so per-path results are dropped with
+        the walk that produced them instead of piling up for the process.
+        """
         path = root / ".gitignore"
+        try:
+            st = path.stat()
+        except OSError:
+            _gitignore_cache.pop(path, None)
+            return _NOOP_IGNORE
+
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        entry = _gitignore_cache.get(path)
+        if entry is None or entry[0] != stamp:
+            entry = (stamp, cls._parse(path))
+            _gitignore_cache[path] = entry
+        parsed = entry[1]
+        if parsed is _NOOP_IGNORE:
+            return parsed
+        return cls(parsed._rules, parsed._matchers)
+
+    @classmethod
+    def _parse(cls, path: Path) -> _Gitignore:
+        rules: list[_IgnoreRule] = []
         try:
             text = path.read_text(encoding="utf-8", errors="ignore")
         except OSError:
@@ -219,33 +336,46 @@ class _Gitignore:
                     )
                 )
 
+        if not rules:
+            return _NOOP_IGNORE
         return cls(rules)
 
-    def is_ignored(self, rel_path: Path, *, is_dir: bool) -> bool:
-        """Return True if rel_path should be ignored."""
-        rel_posix = rel_path.as_posix().lstrip("./")
-        parts = rel_path.parts
+    def is_ignored(self, rel_path: str, *, is_dir: bool) -> bool:
+        """Return True if rel_path (POSIX, relative to the root) should be ignored."""
+        rel_posix = rel_path.lstrip("./")
+        key = (rel_posix, is_dir)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        path_matcher, part_matcher = self._matchers[is_dir]
+        last = -1
+        if path_matcher is not None and (m := path_matcher.match(rel_posix)):
+            last = int(m.lastgroup[1:])
+        if part_matcher is not None:
+            for part in rel_path.split("/"):
+                if m := part_matcher.match(part):
+                    last = max(last, int(m.lastgroup[1:]))
+
+        ignored = last >= 0 and not self._rules[last].negate
+        self._cache[key] = ignored
+        return ignored
+
 
-        ignored = False
-        for rule in self._rules:
-            if rule.dir_only and not is_dir:
-                continue
+class _NoopIgnore(_Gitignore):
+    """Matcher for repos without .gitignore rules; ignores nothing."""
 
-            pattern = rule.pattern
+    def __init__(self) -> None:
+        super().__init__([])
 
-            matched = False
-            if rule.anchored:
-                matched = fnmatchcase(rel_posix, pattern)
-            else:
-                if "/" in pattern:
-                    matched = fnmatchcase(rel_posix, pattern)
-                else:
-                    matched = any(fnmatchcase(part, pattern) for part in parts)
+    def is_ignored(self, rel_path: str, *, is_dir: bool) -> bool:
+        return False
 
-            if matched:
-                ignored = not rule.negate
 
-        return ignored
+_NOOP_IGNORE = _NoopIgnore()
+
+# Parsed .gitignore rules by path: ((inode, mtime_ns, size), compiled matcher)
+_gitignore_cache: dict[Path, tuple[tuple[int, int, int], _Gitignore]] = {}
 
 
 @dataclass
@@ -303,23 +433,66 @@ def _run_git(args: list[str], cwd: Path, timeout: float = 5.0) -> str | None:
     return None
 
 
+def _has_git_dir(root: Path) -> bool:
+    """Return True if root or one of its parents has a .git entry.
+
+    A few stats are much cheaper than spawning git just to learn that the
+    directory is not a repository. `.git` may be a file (worktrees,
+    submodules), so existence is enough. GIT_DIR overrides discovery.
+    """
+    if os.environ.get("GIT_DIR"):
+        return True
+    return any((directory / ".git").exists() for directory in (root, *root.parents))
+
+
 GitInfo = tuple[bool, str | None, list[str], list[dict[str, str]]]
 
 
+def _parse_status_v2(output: str) -> tuple[str | None, list[str]]:
+    """Parse `git status --porcelain=v2 --branch` output.
+
+    Status entries are converted back to the short porcelain v1 form
+    (`XY path`, `XY orig -> path`) so snapshot output stays stable.
+
+    Returns:
+        Tuple of (branch, status_lines). Branch is "HEAD" when detached.
+    """
+    branch = None
+    status_lines = []
+    for line in output.split("\n"):
+        if line.startswith("# branch.head "):
+            head = line[len("# branch.head ") :]
+            branch = "HEAD" if head == "(detached)" else head
+        elif line.startswith(("1 ", "u ")):
+            fields = line.split(" ", 10 if line[0] == "u" else 8)
+            status_lines.append(f"{fields[1].replace('.', ' ')} {fields[-1]}")
+        elif line.startswith("2 "):
+            fields = line.split(" ", 9)
+            path, _, orig = fields[-1].partition("\t")
+            status_lines.append(f"{fields[1].replace('.', ' ')} {orig} -> {path}")
+        elif line.startswith(("? ", "! ")):
+            marker = line[0] * 2
+            status_lines.append(f"{marker} {line[2:]}")
+    return branch, status_lines
+
+
 def _get_git_info(root: Path) -> GitInfo:
     """Get git branch, status, and recent commits.
 
+    Branch and status come from a single `status --porcelain=v2 --branch`
+    call, so only two git processes are spawned per snapshot.
+
     Returns:
         Tuple of (git_available, branch, status_lines, commits)
     """
     # Check if git is available and this is a repo
-    branch = _run_git(["rev-parse", "--abbrev-ref", "HEAD"], root)
-    if branch is None:
+    if not _has_git_dir(root):
+        return False, None, [], []
+    status_output = _run_git(["status", "--porcelain=v2", "--branch", "-uno"], root)
+    if status_output is None:
         return False, None, [], []
 
-    # Get status (porcelain for stable parsing)
-    status_output = _run_git(["status", "--porcelain", "-uno"], root) or ""
-    status_lines = [line for line in status_output.split("\n") if line.strip()]
+    branch, status_lines = _parse_status_v2(status_output)
 
     # Get recent commits (short format)
     log_output = (
@@ -341,23 +514,19 @@ def _get_git_info(root: Path) -> GitInfo:
     return True, branch, status_lines, commits
 
 
-def _get_top_level_entries(root: Path) -> list[dict[str, str]]:
-    """Get top-level directory entries with types."""
-    fd_items = _fd_list(
-        root,
-        include_hidden=False,
-        max_depth=1,
-        max_results=MAX_TOP_LEVEL_ENTRIES * 5,
-        types=["f", "d"],
-    )
-    if fd_items is not None:
+def _get_top_level_entries(root: Path, listing: _FdListing | None = None) -> list[dict[str, str]]:
+    """Get top-level directory entries with types.
+
+    Uses the fd listing when it is complete; a truncated listing may be
+    missing top-level entries, so the directory is scanned instead.
+    """
+    if listing is not None and not listing.truncated:
         entries: list[dict[str, str]] = []
-        for item in fd_items:
-            name = Path(item).name
+        names = sorted([f for f in listing.files if "/" not in f] + list(listing.top_dirs))
+        for name in names:
             if name.startswith("."):
                 continue
-            full = root / item
-            entry_type = "dir" if full.is_dir(follow_symlinks=False) else "file"
+            entry_type = "dir" if name in listing.top_dirs else "file"
             entries.append({"name": name, "type": entry_type})
             if len(entries) >= MAX_TOP_LEVEL_ENTRIES:
                 break
@@ -366,12 +535,15 @@ def _get_top_level_entries(root: Path) -> list[dict[str, str]]:
     ignore = _Gitignore.from_root(root)
     entries = []
     try:
-        for item in sorted(root.iterdir()):
+        with os.scandir(root) as it:
+            items = sorted(it, key=lambda e: e.name)
+        for item in items:
             if item.name.startswith("."):
                 continue  # Skip hidden files
             item_is_dir = item.is_dir(follow_symlinks=False)
-            rel = item.relative_to(root)
-            if ignore.is_ignored(rel, is_dir=item_is_dir):
+            if item_is_dir and item.name in FAST_SKIP_DIRS:
+                continue
+            if ignore.is_ignored(item.name, is_dir=item_is_dir):
                 continue
             entry_type = "dir" if item_is_dir else "file"
             entries.append({"name": item.name, "type": entry_type})
@@ -382,103 +554,136 @@ def _get_top_level_entries(root: Path) -> list[dict[str, str]]:
     return entries
 
 
-def _get_directory_summary(root: Path) -> dict[str, int]:
+def _get_directory_summary(root: Path, listing: _FdListing | None = None) -> dict[str, int]:
     """Get a summary of directory structure (count of items per top-level dir)."""
-    fd_files = _fd_list(
-        root,
-        include_hidden=True,
-        max_depth=None,
-        max_results=FD_MAX_RESULTS,
-        types=["f"],
-    )
-    if fd_files is not None:
-        return _directory_summary_from_files(fd_files)
+    if listing is not None:
+        return _directory_summary_from_files(listing.files)
 
     ignore = _Gitignore.from_root(root)
     summary: dict[str, int] = {}
 
-    def count_dir(top_dir: Path) -> int:
+    def count_dir(top_name: str) -> int:
+        # Queue holds (relative posix path, depth); paths are joined as strings
+        # so no Path objects are built in the hot loop.
         count = 0
-        queue: list[tuple[Path, int]] = [(top_dir, 0)]
+        queue: deque[tuple[str, int]] = deque([(top_name, 0)])
 
         while queue and count < DIR_SUMMARY_MAX_ITEMS:
-            current, depth = queue.pop()
+            current, depth = queue.popleft()
             if depth > DIR_SUMMARY_MAX_DEPTH:
                 continue
             try:
-                for entry in current.iterdir():
-                    if entry.name.startswith("."):
-                        continue
-                    entry_is_dir = entry.is_dir(follow_symlinks=False)
-                    rel = entry.relative_to(root)
-                    if ignore.is_ignored(rel, is_dir=entry_is_dir):
-                        continue
-
-                    count += 1
-                    if count >= DIR_SUMMARY_MAX_ITEMS:
-                        return DIR_SUMMARY_MAX_ITEMS
-                    if entry_is_dir and depth < DIR_SUMMARY_MAX_DEPTH:
-                        queue.append((entry, depth + 1))
+                with os.scandir(os.path.join(root, current)) as it:
+                    for entry in it:
+                        if entry.name.startswith("."):
+                            continue
+                        entry_is_dir = entry.is_dir(follow_symlinks=False)
+                        if entry_is_dir and entry.name in FAST_SKIP_DIRS:
+                            continue
+                        # Ignored directories are never enqueued, so their subtrees are pruned
+                        rel = f"{current}/{entry.name}"
+                        if ignore.is_ignored(rel, is_dir=entry_is_dir):
+                            continue
+
+                        count += 1
+                        if count >= DIR_SUMMARY_MAX_ITEMS:
+                            return DIR_SUMMARY_MAX_ITEMS
+                        if entry_is_dir and depth < DIR_SUMMARY_MAX_DEPTH:
+                            queue.append((rel, depth + 1))
             except OSError:
                 continue
 
         return min(count, DIR_SUMMARY_MAX_ITEMS)
 
+    def safe_count_dir(top_name: str) -> int:
+        try:
+            return count_dir(top_name)
+        except OSError:
+            return 0
+
     try:
-        for item in root.iterdir():
-            if item.name.startswith("."):
-                continue
-            if item.is_dir(follow_symlinks=False):
-                rel = item.relative_to(root)
-                if ignore.is_ignored(rel, is_dir=True):
-                    continue
-                try:
-                    summary[item.name] = count_dir(item)
-                except OSError:
-                    summary[item.name] = 0
+        with os.scandir(root) as it:
+            items = list(it)
     except OSError:
-        pass
+        return summary
+
+    names = [
+        item.name
+        for item in items
+        if not item.name.startswith(".")
+        and item.is_dir(follow_symlinks=False)
+        and item.name not in FAST_SKIP_DIRS
+        and not ignore.is_ignored(item.name, is_dir=True)
+    ]
+    workers = min(_summary_workers(), len(names))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            counts = list(pool.map(safe_count_dir, names))
+    else:
+        counts = [safe_count_dir(name) for name in names]
+    summary.update(zip(names, counts, strict=True))
     return summary
 
 
+def _summary_workers() -> int:
+    """Return the thread count for the directory summary walk (1 disables threading)."""
+    try:
+        workers = int(os.environ.get("VOYAGER_SNAPSHOT_WORKERS", DIR_SUMMARY_WORKERS))
+    except ValueError:
+        workers = DIR_SUMMARY_WORKERS
+    return max(1, min(workers, DIR_SUMMARY_MAX_WORKERS, os.cpu_count() or 1))
+
+
 def _extract_run_hints(root: Path) -> list[str]:
     """Extract how-to-run hints from common documentation files."""
     ignore = _Gitignore.from_root(root)
     hints: list[str] = []
-    hint_patterns = [re.compile(p, re.IGNORECASE) for p in HINT_PATTERNS]
+    seen: set[str] = set()
 
-    for pattern in HINT_FILES:
-        for path in root.glob(pattern):
-            if not path.is_file():
-                continue
-            if path.name.startswith("."):
-                continue
-            try:
-                rel = path.relative_to(root)
-            except ValueError:
-                continue
-            if ignore.is_ignored(rel, is_dir=False):
-                continue
-            try:
-                with path.open("r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read(MAX_HINT_FILE_BYTES)
-                for line in content.splitlines():
-                    line = line.strip()
-                    if not line:
+    # Match root entries against HINT_FILES in one scan, ordered by pattern then name
+    candidates: list[tuple[int, str]] = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                m = _HINT_FILES_REGEX.match(entry.name)
+                if not m:
+                    continue
+                try:
+                    if not entry.is_file():
                         continue
-                    # Check if line matches any hint pattern
-                    for regex in hint_patterns:
-                        if regex.search(line):
-                            truncated = line[:MAX_HINT_LINE_LENGTH]
-                            if truncated not in hints:
-                                hints.append(truncated)
-                            break
-                    if len(hints) >= MAX_HINT_LINES:
+                except OSError:
+                    continue
+                candidates.append((int(m.lastgroup[1:]), entry.name))
+    except OSError:
+        return hints
+
+    for _priority, name in sorted(candidates):
+        if len(hints) >= MAX_HINT_LINES:
+            break
+        if ignore.is_ignored(name, is_dir=False):
+            continue
+        path = root / name
+        try:
+            # Stream lines within the byte budget; stop as soon as enough hints are found
+            with path.open("rb") as f:
+                remaining = MAX_HINT_FILE_BYTES
+                while remaining > 0 and len(hints) < MAX_HINT_LINES:
+                    raw = f.readline(remaining)
+                    if not raw:
                         break
-            except OSError:
-                continue
-            if len(hints) >= MAX_HINT_LINES:
-                break
+                    remaining -= len(raw)
+                    raw = raw.strip()
+                    # Check if line matches any hint pattern
+                    if not raw or not _HINT_REGEX.search(raw):
+                        continue
+                    truncated = raw.decode("utf-8", errors="ignore").strip()[:MAX_HINT_LINE_LENGTH]
+                    if truncated not in seen:
+                        seen.add(truncated)
+                        hints.append(truncated)
+        except OSError:
+            continue
 
     return hints
 
@@ -495,9 +700,10 @@ def create_snapshot(root: Path | str | None = None) -> RepoSnapshot:
     root = Path.cwd() if root is None else Path(root).resolve()
 
     # Try to find git root
-    git_root = _run_git(["rev-parse", "--show-toplevel"], root)
-    if git_root:
-        root = Path(git_root)
+    if _has_git_dir(root):
+        git_root = _run_git(["rev-parse", "--show-toplevel"], root)
+        if git_root:
+            root = Path(git_root)
 
     snapshot = RepoSnapshot(root=str(root))
 
@@ -508,20 +714,14 @@ def create_snapshot(root: Path | str | None = None) -> RepoSnapshot:
     snapshot.status = status
     snapshot.recent_commits = commits
 
-    # Collect file info
-    snapshot.top_level = _get_top_level_entries(root)
-    snapshot.directory_summary = _get_directory_summary(root)
+    # Collect file info (one fd listing shared by all views when available)
+    listing = _fd_snapshot(root)
+    snapshot.top_level = _get_top_level_entries(root, listing)
+    snapshot.directory_summary = _get_directory_summary(root, listing)
 
     # Optional tree view (fd + tree)
-    fd_files_for_tree = _fd_list(
-        root,
-        include_hidden=True,
-        max_depth=None,
-        max_results=FD_TREE_MAX_RESULTS,
-        types=["f"],
-    )
-    if fd_files_for_tree is not None:
-        snapshot.file_tree = _build_tree_from_file_list(root, fd_files_for_tree)
+    if listing is not None:
+        snapshot.file_tree = _build_tree_from_file_list(root, listing.files[:FD_TREE_MAX_RESULTS])
 
     # Extract run hints
     snapshot.run_hints = _extract_run_hints(root)
@@ -529,6 +729,45 @@ def create_snapshot(root: Path | str | None = None) -> RepoSnapshot:
     return snapshot
 
 
+def repo_fingerprint(root: Path | str | None = None) -> str | None:
+    """Return a cheap fingerprint of the state a snapshot is built from.
+
+    Combines HEAD, the branch, the full porcelain status (including untracked
+    files), and the stat of each top-level entry (which covers edits to run
+    hint files). Costs one git process instead of a full repo walk.
+
+    Args:
+        root: Repository root path. Defaults to current directory.
+
+    Returns:
+        Hex digest, or None outside a git repository.
+    """
+    root = Path.cwd() if root is None else Path(root).resolve()
+    if not _has_git_dir(root):
+        return None
+    status = _run_git(["status", "--porcelain=v2", "--branch", "-z"], root)
+    if status is None:
+        return None
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(root).encode("utf-8"))
+    digest.update(status.encode("utf-8", errors="surrogateescape"))
+    try:
+        with os.scandir(root) as it:
+            for entry in sorted(it, key=lambda e: e.name):
+                # git status itself touches .git (index refresh)
+                if entry.name == ".git":
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                digest.update(f"\0{entry.name}:{st.st_mtime_ns}:{st.st_size}".encode("utf-8", errors="surrogateescape"))
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
 def snapshot_to_json(root: Path | str | None = None) -> dict[str, Any]:
     """Create a snapshot and return as JSON-serializable dict.
 
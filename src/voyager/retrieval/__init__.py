@@ -10,9 +10,10 @@ This module provides semantic search over skill libraries:
 
 from __future__ import annotations
 
-from voyager.retrieval.discovery import discover_all_skills, discover_skills_roots
+from voyager.retrieval.discovery import discover_all_skills, discover_skills_roots, iter_skills
 
 __all__ = [
     "discover_all_skills",
     "discover_skills_roots",
+    "iter_skills",
 ]
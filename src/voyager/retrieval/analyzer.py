@@ -6,16 +6,37 @@ Uses the LLM to understand capabilities, task types, and generate example querie
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from voyager.llm import call_claude
+import yaml
+
+from voyager.config import get_skill_analysis_cache_dir
+from voyager.io import read_json, write_json
+from voyager.llm import RECURSION_GUARD_VAR, call_claude
 from voyager.logging import get_logger
 
 _logger = get_logger("retrieval.analyzer")
 
+# libyaml-backed loader when available, same semantics as safe_load
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---\n(.*)$", re.DOTALL)
+_JSON_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL)
+_JSON_BRACE_RE = re.compile(r"\{[^{}]*\}", re.DOTALL)
+
+# Bump when EXTRACTION_PROMPT or the extracted fields change to invalidate the cache
+ANALYSIS_CACHE_VERSION = "1"
+
+# Default number of skills analyzed concurrently (each holds one LLM call)
+DEFAULT_ANALYZE_CONCURRENCY = 8
+
 
 @dataclass
 class SkillMetadata:
@@ -75,15 +96,16 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     Returns:
         Tuple of (frontmatter dict, body content).
     """
+    if not content.startswith("---"):
+        return {}, content
+
     # Match YAML frontmatter between --- markers
-    match = re.match(r"^---\n(.*?)\n---\n(.*)$", content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
     if not match:
         return {}, content
 
     try:
-        import yaml
-
-        fm = yaml.safe_load(match.group(1))
+        fm = yaml.load(match.group(1), Loader=_YAML_LOADER)
         return fm or {}, match.group(2)
     except Exception as e:
         _logger.warning("Failed to parse frontmatter: %s", e)
@@ -135,6 +157,14 @@ def analyze_skill(
         _extract_triggers_from_description(metadata)
         return metadata
 
+    # Serve unchanged SKILL.md files from the on-disk cache
+    cache_path = _analysis_cache_path(content)
+    cached = read_json(cache_path)
+    if isinstance(cached, dict) and cached.get("version") == ANALYSIS_CACHE_VERSION:
+        _logger.debug("Using cached analysis for %s", skill_path.name)
+        _apply_extracted(metadata, cached.get("extracted", {}))
+        return metadata
+
     # Call LLM for rich extraction
     try:
         _logger.debug("Analyzing skill with LLM: %s", skill_path.name)
@@ -152,13 +182,8 @@ def analyze_skill(
             # Parse JSON from output
             extracted = _parse_json_response(result.output)
             if extracted:
-                metadata.purpose = extracted.get("purpose", metadata.purpose)
-                metadata.task_types = extracted.get("task_types", [])
-                metadata.file_types = extracted.get("file_types", [])
-                metadata.capabilities = extracted.get("capabilities", [])
-                metadata.when_to_use = extracted.get("when_to_use", "")
-                metadata.when_not_to_use = extracted.get("when_not_to_use", "")
-                metadata.example_queries = extracted.get("example_queries", [])
+                _apply_extracted(metadata, extracted)
+                write_json(cache_path, {"version": ANALYSIS_CACHE_VERSION, "extracted": extracted})
         else:
             _logger.warning("LLM call failed for %s: %s", skill_path.name, result.error)
             _extract_triggers_from_description(metadata)
@@ -170,16 +195,95 @@ def analyze_skill(
     return metadata
 
 
+def _analysis_cache_path(content: str) -> Path:
+    """Return the cache file for a SKILL.md, keyed by its content hash."""
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+    return get_skill_analysis_cache_dir() / f"{digest}.json"
+
+
+def _apply_extracted(metadata: SkillMetadata, extracted: dict) -> None:
+    """Copy LLM-extracted fields onto metadata."""
+    metadata.purpose = extracted.get("purpose", metadata.purpose)
+    metadata.task_types = extracted.get("task_types", [])
+    metadata.file_types = extracted.get("file_types", [])
+    metadata.capabilities = extracted.get("capabilities", [])
+    metadata.when_to_use = extracted.get("when_to_use", "")
+    metadata.when_not_to_use = extracted.get("when_not_to_use", "")
+    metadata.example_queries = extracted.get("example_queries", [])
+
+
+def analyze_skills_batch(
+    skill_paths: Iterable[Path],
+    *,
+    skip_llm: bool = False,
+    max_concurrency: int = DEFAULT_ANALYZE_CONCURRENCY,
+    on_result: Callable[[Path, Exception | None], None] | None = None,
+) -> list[SkillMetadata]:
+    """Analyze several skills concurrently.
+
+    Each analysis is independent and mostly waits on the LLM, so running them
+    in a thread pool makes total latency roughly the slowest call instead of
+    the sum of all calls. Skills are submitted as ``skill_paths`` yields them,
+    so a lazy discovery walk overlaps with analysis of the skills found so far.
+
+    Args:
+        skill_paths: Skill directories containing SKILL.md (any iterable,
+            including a generator).
+        skip_llm: If True, skip LLM analysis and only use frontmatter.
+        max_concurrency: Maximum number of skills analyzed at once.
+        on_result: Optional callback invoked as each skill finishes, with the
+            exception if its analysis failed.
+
+    Returns:
+        SkillMetadata for every skill that was analyzed successfully, in the
+        same order as skill_paths.
+    """
+    paths: list[Path] = []
+    results: dict[Path, SkillMetadata] = {}
+    # The pool only starts threads as work is submitted, so this is an upper bound
+    workers = 1 if skip_llm else max(1, max_concurrency)
+
+    # call_claude saves and restores the recursion guard around each call.
+    # Set it for the whole batch so overlapping calls can't restore a stale value.
+    env_backup = os.environ.get(RECURSION_GUARD_VAR)
+    os.environ[RECURSION_GUARD_VAR] = "1"
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for path in skill_paths:
+                paths.append(path)
+                futures[executor.submit(analyze_skill, path, skip_llm=skip_llm)] = path
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    results[path] = future.result()
+                except Exception as e:
+                    _logger.warning("Failed to analyze %s: %s", path.name, e)
+                    if on_result:
+                        on_result(path, e)
+                    continue
+                if on_result:
+                    on_result(path, None)
+    finally:
+        if env_backup is None:
+            os.environ.pop(RECURSION_GUARD_VAR, None)
+        else:
+            os.environ[RECURSION_GUARD_VAR] = env_backup
+
+    return [results[path] for path in paths if path in results]
+
+
 def _parse_json_response(text: str) -> dict | None:
     """Parse JSON from LLM response, handling common issues."""
-    # Try direct parse first
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
+    # Try direct parse first (only worth it when the output starts with an object)
+    if text.lstrip()[:1] == "{":
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
 
     # Try to extract JSON from markdown code block
-    json_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", text, re.DOTALL)
+    json_match = _JSON_CODE_BLOCK_RE.search(text)
     if json_match:
         try:
             return json.loads(json_match.group(1))
@@ -187,7 +291,7 @@ def _parse_json_response(text: str) -> dict | None:
             pass
 
     # Try to find JSON object in text
-    brace_match = re.search(r"\{[^{}]*\}", text, re.DOTALL)
+    brace_match = _JSON_BRACE_RE.search(text)
     if brace_match:
         try:
             return json.loads(brace_match.group(0))
@@ -11,6 +11,7 @@ No configuration required - skills are discovered from:
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
 from pathlib import Path
 
 from voyager.config import (
@@ -22,34 +23,66 @@ from voyager.logging import get_logger
 
 _logger = get_logger("retrieval.discovery")
 
+SKILL_FILENAME = "SKILL.md"
+
+# Directories never searched for skills (hidden directories are skipped too)
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        ".venv",
+        "venv",
+        "__pycache__",
+        "target",
+        "dist",
+        "build",
+        ".mypy_cache",
+        ".pytest_cache",
+    }
+)
+
+
+def _walk_skill_dirs(root: Path) -> Iterator[Path]:
+    """Yield directories under root that contain a SKILL.md.
+
+    Walks top-down without following symlinks, pruning SKIP_DIRS and hidden
+    directories in place so their subtrees are never read.
+    """
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=False):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith("."))
+        if SKILL_FILENAME in filenames:
+            yield Path(dirpath)
+
 
 def discover_skills_roots(
     extra_paths: list[Path] | None = None,
 ) -> list[Path]:
     """Discover all skill root directories.
 
+    Roots are not probed for SKILL.md files; discover_all_skills walks them
+    once and roots without skills simply contribute nothing.
+
     Args:
         extra_paths: Additional paths to include.
 
     Returns:
         List of existing skill root directories.
     """
-    roots: list[Path] = []
+    candidates: list[Path] = []
 
     # Check environment variable first
     env_path = os.environ.get("CLAUDE_SKILLS_PATH")
     if env_path:
-        p = Path(env_path)
-        if p.exists():
-            roots.append(p)
-            _logger.debug("Found skills from env: %s", p)
+        candidates.append(Path(env_path))
 
     # Standard locations (project-relative)
-    candidates = [
-        get_plugin_skills_dir(),  # ./skills/
-        get_local_skills_dir(),  # ./.claude/skills/local/
-        get_generated_skills_dir(),  # ./.claude/skills/generated/
-    ]
+    candidates.extend(
+        [
+            get_plugin_skills_dir(),  # ./skills/
+            get_local_skills_dir(),  # ./.claude/skills/local/
+            get_generated_skills_dir(),  # ./.claude/skills/generated/
+        ]
+    )
 
     # User-global skills
     user_skills = Path.home() / ".claude" / "skills"
@@ -59,45 +92,62 @@ def discover_skills_roots(
     if extra_paths:
         candidates.extend(extra_paths)
 
-    for candidate in candidates:
-        if candidate.exists() and candidate not in roots and any(candidate.rglob("SKILL.md")):
-            roots.append(candidate)
-            _logger.debug("Found skills root: %s", candidate)
+    # Dedupe preserving order; one stat per candidate
+    roots = [candidate for candidate in dict.fromkeys(candidates) if os.path.isdir(candidate)]
+    for root in roots:
+        _logger.debug("Found skills root: %s", root)
 
     return roots
 
 
-def discover_all_skills(
+def iter_skills(
     roots: list[Path] | None = None,
     extra_paths: list[Path] | None = None,
-) -> list[Path]:
-    """Find all skill directories containing SKILL.md.
+) -> Iterator[Path]:
+    """Yield skill directories containing SKILL.md as they are found.
+
+    Lets callers start work on the first skills while the rest of the
+    filesystem walk is still running.
 
     Args:
         roots: Specific root directories to search. If None, auto-discover.
         extra_paths: Additional paths to include when auto-discovering.
 
-    Returns:
-        List of paths to skill directories (parent of SKILL.md).
+    Yields:
+        Resolved paths to skill directories (parent of SKILL.md), without duplicates.
     """
     if roots is None:
         roots = discover_skills_roots(extra_paths=extra_paths)
 
     if not roots:
         _logger.warning("No skill roots found")
-        return []
+        return
 
-    skills: list[Path] = []
     seen: set[Path] = set()
 
     for root in roots:
         _logger.debug("Scanning %s for skills...", root)
-        for skill_md in root.rglob("SKILL.md"):
-            skill_dir = skill_md.parent.resolve()
+        for skill_dir in _walk_skill_dirs(root):
+            skill_dir = skill_dir.resolve()
             if skill_dir not in seen:
                 seen.add(skill_dir)
-                skills.append(skill_dir)
                 _logger.debug("Found skill: %s", skill_dir.name)
+                yield skill_dir
 
-    _logger.info("Discovered %d skills from %d roots", len(skills), len(roots))
+
+def discover_all_skills(
+    roots: list[Path] | None = None,
+    extra_paths: list[Path] | None = None,
+) -> list[Path]:
+    """Find all skill directories containing SKILL.md.
+
+    Args:
+        roots: Specific root directories to search. If None, auto-discover.
+        extra_paths: Additional paths to include when auto-discovering.
+
+    Returns:
+        List of paths to skill directories (parent of SKILL.md).
+    """
+    skills = list(iter_skills(roots=roots, extra_paths=extra_paths))
+    _logger.info("Discovered %d skills", len(skills))
     return skills
@@ -24,43 +24,32 @@ def generate_embedding_text(metadata: SkillMetadata) -> str:
     Returns:
         Text optimized for embedding-based search.
     """
-    sections: list[str] = []
-
-    # Example queries are GOLD - they're exactly what users will search for
-    if metadata.example_queries:
-        sections.append("Example uses: " + " | ".join(metadata.example_queries))
-
-    # Purpose gives semantic grounding
-    if metadata.purpose:
-        sections.append(f"Purpose: {metadata.purpose}")
-
-    # Description if different from purpose
+    # Description if different from purpose (first line only)
+    first_line = ""
     if metadata.description and metadata.description != metadata.purpose:
-        # Use first line of description
-        first_line = metadata.description.split("\n")[0].strip()
-        if first_line and first_line != metadata.purpose:
-            sections.append(f"Description: {first_line}")
-
-    # Capabilities for verb matching
-    if metadata.capabilities:
-        sections.append(f"Can: {', '.join(metadata.capabilities)}")
-
-    # Task types for categorical queries
-    if metadata.task_types:
-        sections.append(f"Tasks: {', '.join(metadata.task_types)}")
-
-    # File types for specific queries like "edit a .docx"
-    if metadata.file_types:
-        sections.append(f"File types: {', '.join(metadata.file_types)}")
-
-    # When to use (positive matching)
-    if metadata.when_to_use:
-        sections.append(f"Use for: {metadata.when_to_use}")
-
-    # Skill name as anchor
-    sections.append(f"Skill: {metadata.name}")
-
-    return "\n".join(sections)
+        first_line = metadata.description.split("\n", 1)[0].strip()
+        if first_line == metadata.purpose:
+            first_line = ""
+
+    sections = [
+        # Example queries are GOLD - they're exactly what users will search for
+        "Example uses: " + " | ".join(metadata.example_queries) if metadata.example_queries else None,
+        # Purpose gives semantic grounding
+        f"Purpose: {metadata.purpose}" if metadata.purpose else None,
+        f"Description: {first_line}" if first_line else None,
+        # Capabilities for verb matching
+        f"Can: {', '.join(metadata.capabilities)}" if metadata.capabilities else None,
+        # Task types for categorical queries
+        f"Tasks: {', '.join(metadata.task_types)}" if metadata.task_types else None,
+        # File types for specific queries like "edit a .docx"
+        f"File types: {', '.join(metadata.file_types)}" if metadata.file_types else None,
+        # When to use (positive matching)
+        f"Use for: {metadata.when_to_use}" if metadata.when_to_use else None,
+        # Skill name as anchor
+        f"Skill: {metadata.name}",
+    ]
+
+    return "\n".join(section for section in sections if section)
 
 
 def generate_simple_embedding_text(metadata: SkillMetadata) -> str:
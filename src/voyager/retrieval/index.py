@@ -6,29 +6,57 @@ Gracefully degrades to simple text matching when dependencies are unavailable.
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass, field
+import contextlib
+import functools
+import hashlib
+import heapq
+import importlib.util
+import os
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field, replace
+from operator import itemgetter
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from voyager.config import get_skill_index_dir
+from voyager.fastjson import dumps_compact, loads
+from voyager.io import write_file
 from voyager.logging import get_logger
-from voyager.retrieval.analyzer import SkillMetadata, analyze_skill
-from voyager.retrieval.discovery import discover_all_skills
-from voyager.retrieval.embedding import (
-    generate_embedding_text,
-    generate_simple_embedding_text,
-)
+from voyager.retrieval.discovery import iter_skills
+
+if TYPE_CHECKING:
+    from voyager.retrieval.analyzer import SkillMetadata
 
 _logger = get_logger("retrieval.index")
 
-# Check if RAGatouille is available
-RAGATOUILLE_AVAILABLE = False
-try:
+# Most recent search results kept per SkillIndex instance
+QUERY_CACHE_SIZE = 128
+
+# On-disk result cache shared across processes (e.g. repeated `skill find` runs)
+QUERY_DISK_CACHE_TTL_SECONDS = 300
+QUERY_DISK_CACHE_MAX_ENTRIES = 1000
+
+# Documents encoded per batch when building a ColBERT index (RAGatouille's default)
+DEFAULT_EMBED_BATCH_SIZE = 32
+
+# Check if RAGatouille is available without importing it (it pulls in torch);
+# the module itself is imported only when a ColBERT index is built or searched.
+RAGATOUILLE_AVAILABLE = importlib.util.find_spec("ragatouille") is not None
+
+
+@functools.lru_cache(maxsize=4)
+def _load_rag(index_dir: str) -> Any:
+    """Load a ColBERT index once per process and directory.
+
+    ``RAGPretrainedModel.from_index`` loads the checkpoint and index from disk,
+    which dominates search latency; repeated searches (or several SkillIndex
+    instances over the same directory) reuse the loaded model.
+    """
     from ragatouille import RAGPretrainedModel
 
-    RAGATOUILLE_AVAILABLE = True
-except ImportError:
-    _logger.debug("RAGatouille not available, will use fallback search")
+    return RAGPretrainedModel.from_index(index_dir)
 
 
 @dataclass
@@ -52,6 +80,62 @@ class IndexMetadata:
     version: str = "1"
     index_type: str = "colbert"  # or "simple"
 
+    def to_dict(self) -> dict:
+        """Shallow dict for serialization (avoids asdict's deep copy)."""
+        return {"skills": self.skills, "version": self.version, "index_type": self.index_type}
+
+
+@dataclass
+class _SimpleCorpus:
+    """Lowercased simple-index documents joined by NUL for substring search.
+
+    Each query term is located with str.find over the joined text, so a term
+    costs one C-level scan of the corpus rather than one `in` check per
+    document. Matching stays substring-based, as in the original scoring.
+    """
+
+    doc_ids: list[str]
+    text: str
+    starts: list[int]
+
+    @classmethod
+    def from_documents(cls, documents: dict[str, str]) -> _SimpleCorpus:
+        parts: list[str] = []
+        starts: list[int] = []
+        pos = 0
+        for doc_text in documents.values():
+            lowered = doc_text.lower()
+            starts.append(pos)
+            parts.append(lowered)
+            pos += len(lowered) + 1
+        return cls(doc_ids=list(documents), text="\0".join(parts), starts=starts)
+
+    @classmethod
+    def from_index_data(cls, data: dict) -> _SimpleCorpus:
+        """Load from simple_index.json (columnar layout, or the older documents dict)."""
+        if "documents" in data:
+            return cls.from_documents(data["documents"])
+        return cls(doc_ids=data["doc_ids"], text=data["text"], starts=data["starts"])
+
+    def to_index_data(self) -> dict:
+        """Columnar layout stored in simple_index.json."""
+        return {"doc_ids": self.doc_ids, "starts": self.starts, "text": self.text}
+
+    def matching_docs(self, needle: str) -> list[int]:
+        """Return indexes of documents containing needle (lowercased)."""
+        hits: list[int] = []
+        if not self.starts:
+            return hits
+        pos = self.text.find(needle)
+        while pos != -1:
+            doc = bisect_right(self.starts, pos) - 1
+            hits.append(doc)
+            if doc + 1 >= len(self.starts):
+                break
+            # Skip the rest of this document; each one counts at most once
+            pos = self.text.find(needle, self.starts[doc + 1])
+        return hits
+
 
 class SkillIndex:
     """Manager for skill search index."""
@@ -60,24 +144,34 @@ class SkillIndex:
         self,
         index_path: Path | None = None,
         model_name: str = "colbert-ir/colbertv2.0",
+        *,
+        disk_cache: bool = False,
     ):
         """Initialize the skill index.
 
         Args:
             index_path: Path to store the index. Defaults to ~/.skill-index/
             model_name: ColBERT model to use.
+            disk_cache: Also cache search results in the index directory, so
+                repeated queries from separate processes skip the search.
         """
         self.index_path = index_path or get_skill_index_dir()
         self.model_name = model_name
+        self.disk_cache = disk_cache
         self.index_name = "claude_skills"
 
         self._rag = None
         self._metadata: IndexMetadata | None = None
+        # Parsed simple index, keyed by the file's mtime so rebuilds are picked up
+        self._simple_cache: tuple[int, _SimpleCorpus] | None = None
+        # Results keyed by (stripped query, k, index mtime); rebuilds change the key
+        self._query_cache: OrderedDict[tuple[str, int, int], list[SearchResult]] = OrderedDict()
 
         # Paths
         self._metadata_path = self.index_path / "metadata.json"
         self._simple_index_path = self.index_path / "simple_index.json"
         self._colbert_index_dir = self.index_path / "colbert" / "indexes" / self.index_name
+        self._query_cache_dir = self.index_path / "query_cache"
 
     def build(
         self,
@@ -86,6 +180,8 @@ class SkillIndex:
         force: bool = False,
         skip_llm: bool = False,
         verbose: bool = False,
+        parallel: bool = True,
+        embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
     ) -> int:
         """Build the skill index.
 
@@ -94,6 +190,8 @@ class SkillIndex:
             force: Rebuild even if index exists.
             skip_llm: Skip LLM analysis (faster but lower quality).
             verbose: Print progress.
+            parallel: Analyze skills concurrently (set False to analyze one at a time).
+            embed_batch_size: Documents per ColBERT encoder batch.
 
         Returns:
             Number of skills indexed.
@@ -104,46 +202,50 @@ class SkillIndex:
                 print(f"Index exists at {self.index_path}. Use --rebuild to recreate.")
             return 0
 
-        # Discover skills
-        skills = discover_all_skills(roots=skill_roots)
-        if not skills:
+        # Analysis imports the LLM client; only the build path needs it
+        from voyager.retrieval.analyzer import DEFAULT_ANALYZE_CONCURRENCY, analyze_skills_batch
+        from voyager.retrieval.embedding import (
+            generate_embedding_text,
+            generate_simple_embedding_text,
+        )
+
+        # Analyze skills concurrently (LLM calls are independent), starting on
+        # each skill as soon as discovery yields it
+        done = 0
+
+        def report(skill_path: Path, error: Exception | None) -> None:
+            nonlocal done
+            done += 1
+            if verbose:
+                status = "OK" if error is None else f"FAIL: {error}"
+                print(f"  [{done}] Analyzed {skill_path.name}... {status}")
+
+        analyzed: list[SkillMetadata] = analyze_skills_batch(
+            iter_skills(roots=skill_roots),
+            skip_llm=skip_llm,
+            max_concurrency=DEFAULT_ANALYZE_CONCURRENCY if parallel else 1,
+            on_result=report,
+        )
+
+        if not done:
             _logger.warning("No skills found to index")
             return 0
 
         if verbose:
-            print(f"Found {len(skills)} skills to index")
-
-        # Analyze each skill
-        analyzed: list[SkillMetadata] = []
-        for i, skill_path in enumerate(skills, 1):
-            if verbose:
-                print(f"  [{i}/{len(skills)}] Analyzing {skill_path.name}...", end=" ")
-            try:
-                metadata = analyze_skill(skill_path, skip_llm=skip_llm)
-                analyzed.append(metadata)
-                if verbose:
-                    print("OK")
-            except Exception as e:
-                if verbose:
-                    print(f"FAIL: {e}")
-                _logger.warning("Failed to analyze %s: %s", skill_path.name, e)
+            print(f"Analyzed {len(analyzed)} of {done} skills")
 
         if not analyzed:
             _logger.warning("No skills successfully analyzed")
             return 0
 
         # Generate embedding text
-        documents: list[str] = []
-        doc_ids: list[str] = []
-        metadata_dict: dict[str, dict] = {}
-
-        for skill in analyzed:
-            embed_text = (
-                generate_embedding_text(skill) if skill.example_queries else generate_simple_embedding_text(skill)
-            )
-            documents.append(embed_text)
-            doc_ids.append(skill.skill_id)
-            metadata_dict[skill.skill_id] = {
+        doc_ids = [skill.skill_id for skill in analyzed]
+        documents = [
+            generate_embedding_text(skill) if skill.example_queries else generate_simple_embedding_text(skill)
+            for skill in analyzed
+        ]
+        metadata_dict: dict[str, dict] = {
+            skill.skill_id: {
                 "name": skill.name,
                 "purpose": skill.purpose,
                 "path": str(skill.path),
@@ -152,10 +254,12 @@ class SkillIndex:
                 "description": skill.description,
                 "example_queries": skill.example_queries,
             }
+            for skill in analyzed
+        }
 
         # Build index
         if RAGATOUILLE_AVAILABLE:
-            self._build_colbert_index(documents, doc_ids, metadata_dict, verbose)
+            self._build_colbert_index(documents, doc_ids, metadata_dict, verbose, embed_batch_size)
         else:
             self._build_simple_index(documents, doc_ids, metadata_dict, verbose)
 
@@ -167,6 +271,7 @@ class SkillIndex:
         doc_ids: list[str],
         metadata_dict: dict[str, dict],
         verbose: bool,
+        embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
     ) -> None:
         """Build ColBERT index using RAGatouille."""
         if verbose:
@@ -175,6 +280,14 @@ class SkillIndex:
         # Ensure index directory exists
         self.index_path.mkdir(parents=True, exist_ok=True)
 
+        # Sort by length so encoder batches hold similarly sized documents and
+        # waste less work on padding (metadata is keyed by id, so order is free)
+        order = sorted(range(len(documents)), key=lambda i: len(documents[i]))
+        documents = [documents[i] for i in order]
+        doc_ids = [doc_ids[i] for i in order]
+
+        from ragatouille import RAGPretrainedModel
+
         # Create RAG model and index
         self._rag = RAGPretrainedModel.from_pretrained(self.model_name)
         self._rag.index(
@@ -183,11 +296,16 @@ class SkillIndex:
             index_name=self.index_name,
             max_document_length=256,
             split_documents=True,
+            bsize=embed_batch_size,
         )
 
+        # A model loaded from the previous index on disk is now stale
+        _load_rag.cache_clear()
+        self._query_cache.clear()
+
         # Save metadata
         self._metadata = IndexMetadata(skills=metadata_dict, index_type="colbert")
-        self._metadata_path.write_text(json.dumps(asdict(self._metadata), indent=2))
+        self._write_json(self._metadata_path, self._metadata.to_dict())
 
         if verbose:
             print(f"ColBERT index built: {len(doc_ids)} skills")
@@ -206,16 +324,16 @@ class SkillIndex:
         # Ensure index directory exists
         self.index_path.mkdir(parents=True, exist_ok=True)
 
-        # Build simple index: document text + metadata
-        simple_index = {
-            "documents": dict(zip(doc_ids, documents, strict=True)),
-            "metadata": metadata_dict,
-        }
-        self._simple_index_path.write_text(json.dumps(simple_index, indent=2))
+        # Build simple index: searchable corpus (ids, offsets, one text blob) + metadata
+        corpus = _SimpleCorpus.from_documents(dict(zip(doc_ids, documents, strict=True)))
+        simple_index = {**corpus.to_index_data(), "metadata": metadata_dict}
+        self._write_json(self._simple_index_path, simple_index)
+        self._simple_cache = None
+        self._query_cache.clear()
 
         # Save metadata
         self._metadata = IndexMetadata(skills=metadata_dict, index_type="simple")
-        self._metadata_path.write_text(json.dumps(asdict(self._metadata), indent=2))
+        self._write_json(self._metadata_path, self._metadata.to_dict())
 
         if verbose:
             print(f"Simple index built: {len(doc_ids)} skills")
@@ -238,20 +356,44 @@ class SkillIndex:
                 f"No index found. Run `voyager skill index` first.\nExpected index at: {self.index_path}"
             )
 
+        # Surrounding whitespace never matters; strip it once so the cache key
+        # is exactly the query that gets searched (case is left to the backend)
+        query = query.strip()
+        key = (query, k, self._index_mtime())
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return [replace(r) for r in cached]
+
+        if self.disk_cache:
+            cached = self._load_disk_cached(key)
+            if cached is not None:
+                self._query_cache[key] = cached
+                if len(self._query_cache) > QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+                return [replace(r) for r in cached]
+
         # Load metadata if needed
         if self._metadata is None:
             self._load_metadata()
 
         # Use appropriate search method
         if self._metadata.index_type == "colbert" and RAGATOUILLE_AVAILABLE:
-            return self._search_colbert(query, k)
+            results = self._search_colbert(query, k)
         else:
-            return self._search_simple(query, k)
+            results = self._search_simple(query, k)
+
+        if self.disk_cache:
+            self._store_disk_cached(key, results)
+        self._query_cache[key] = results
+        if len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return [replace(r) for r in results]
 
     def _search_colbert(self, query: str, k: int) -> list[SearchResult]:
         """Search using ColBERT index."""
         if self._rag is None:
-            self._rag = RAGPretrainedModel.from_index(str(self._colbert_index_dir))
+            self._rag = _load_rag(str(self._colbert_index_dir))
 
         results = self._rag.search(query=query, k=k)
 
@@ -280,28 +422,29 @@ class SkillIndex:
         if not self._simple_index_path.exists():
             raise RuntimeError("Simple index file not found")
 
-        index_data = json.loads(self._simple_index_path.read_text())
-        documents = index_data["documents"]
-
-        # Simple scoring: count query term matches
-        query_terms = set(query.lower().split())
-        scores: list[tuple[str, float]] = []
-
-        for skill_id, doc_text in documents.items():
-            doc_lower = doc_text.lower()
-            # Count term matches + bonus for exact phrase match
-            match_count = sum(1 for term in query_terms if term in doc_lower)
-            exact_bonus = 2.0 if query.lower() in doc_lower else 0.0
-            score = match_count + exact_bonus
-            scores.append((skill_id, score))
-
-        # Sort by score descending
-        scores.sort(key=lambda x: x[1], reverse=True)
+        corpus = self._load_simple_corpus()
+
+        # Simple scoring: count query term matches + bonus for exact phrase match
+        query_lower = query.lower()
+        doc_scores = [0.0] * len(corpus.doc_ids)
+        term_hits = {term: corpus.matching_docs(term) for term in set(query_lower.split())}
+        for hits in term_hits.values():
+            for doc in hits:
+                doc_scores[doc] += 1
+        # A single-word query is its own phrase; reuse its hits instead of rescanning
+        phrase_hits = term_hits.get(query_lower)
+        if phrase_hits is None:
+            phrase_hits = corpus.matching_docs(query_lower)
+        for doc in phrase_hits:
+            doc_scores[doc] += 2.0
+
+        # Top k by score descending (ties keep index order, like a stable sort);
+        # most documents score zero, so drop them before they reach the heap
+        scored = ((sid, score) for sid, score in zip(corpus.doc_ids, doc_scores, strict=True) if score)
+        top = heapq.nlargest(k, scored, key=itemgetter(1))
 
         output: list[SearchResult] = []
-        for skill_id, score in scores[:k]:
-            if score == 0:
-                continue
+        for skill_id, score in top:
             meta = self._metadata.skills.get(skill_id, {})
             output.append(
                 SearchResult(
@@ -317,6 +460,67 @@ class SkillIndex:
 
         return output
 
+    def _load_simple_corpus(self) -> _SimpleCorpus:
+        """Return the parsed simple index, re-reading it only when the file changes."""
+        mtime = self._simple_index_path.stat().st_mtime_ns
+        if self._simple_cache is not None and self._simple_cache[0] == mtime:
+            return self._simple_cache[1]
+
+        index_data = loads(self._simple_index_path.read_text())
+        corpus = _SimpleCorpus.from_index_data(index_data)
+        self._simple_cache = (mtime, corpus)
+        return corpus
+
+    def _disk_cache_path(self, key: tuple[str, int, int]) -> Path:
+        """Return the on-disk cache file for a (stripped query, k, index mtime) key."""
+        digest = hashlib.blake2b(dumps_compact(list(key)).encode("utf-8"), digest_size=16).hexdigest()
+        return self._query_cache_dir / f"{digest}.json"
+
+    def _load_disk_cached(self, key: tuple[str, int, int]) -> list[SearchResult] | None:
+        """Return results cached on disk for key, if present and not expired."""
+        path = self._disk_cache_path(key)
+        try:
+            entry = loads(path.read_bytes())
+            if time.time() - entry["ts"] > QUERY_DISK_CACHE_TTL_SECONDS:
+                return None
+            results = [SearchResult(**r) for r in entry["results"]]
+            # The file mtime tracks last use, for LRU eviction
+            os.utime(path)
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        _logger.debug("Query cache hit for %r", key[0])
+        return results
+
+    def _store_disk_cached(self, key: tuple[str, int, int], results: list[SearchResult]) -> None:
+        """Cache results on disk, evicting the least recently used entries beyond the size cap."""
+        entry = {"ts": time.time(), "results": [asdict(r) for r in results]}
+        if not write_file(self._disk_cache_path(key), dumps_compact(entry)):
+            return
+        try:
+            with os.scandir(self._query_cache_dir) as it:
+                entries = [(e.stat().st_mtime_ns, e.path) for e in it if e.name.endswith(".json")]
+        except OSError:
+            return
+        excess = len(entries) - QUERY_DISK_CACHE_MAX_ENTRIES
+        if excess > 0:
+            for _, path in heapq.nsmallest(excess, entries):
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+
+    @staticmethod
+    def _write_json(path: Path, data: dict) -> None:
+        """Write compact index JSON atomically (temp file + rename).
+
+        Always rewritten, since the files' mtimes mark rebuilds (see _index_mtime).
+        """
+        if not write_file(path, dumps_compact(data), force=True):
+            raise OSError(f"Failed to write {path}")
+
+    def _index_mtime(self) -> int:
+        """Return the newest mtime (ns) of the index files, to detect rebuilds."""
+        mtimes = [p.stat().st_mtime_ns for p in (self._metadata_path, self._simple_index_path) if p.exists()]
+        return max(mtimes, default=0)
+
     def _index_exists(self) -> bool:
         """Check if an index exists."""
         return self._metadata_path.exists() or self._simple_index_path.exists()
@@ -326,7 +530,7 @@ class SkillIndex:
         if not self._metadata_path.exists():
             # Try to infer from simple index
             if self._simple_index_path.exists():
-                index_data = json.loads(self._simple_index_path.read_text())
+                index_data = loads(self._simple_index_path.read_text())
                 self._metadata = IndexMetadata(
                     skills=index_data.get("metadata", {}),
                     index_type="simple",
@@ -335,7 +539,7 @@ class SkillIndex:
                 self._metadata = IndexMetadata(skills={}, index_type="unknown")
             return
 
-        data = json.loads(self._metadata_path.read_text())
+        data = loads(self._metadata_path.read_text())
         self._metadata = IndexMetadata(
             skills=data.get("skills", {}),
             version=data.get("version", "1"),
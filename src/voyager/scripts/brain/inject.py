@@ -6,21 +6,33 @@ as additionalContext into the session. This runs fast without LLM calls.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import sys
+import time
 from pathlib import Path
 from typing import Annotated, Any
 
 import typer
 
-from voyager.config import get_brain_json_path, get_brain_md_path, get_voyager_state_dir
-from voyager.io import read_file, read_json
+from voyager.config import (
+    get_brain_json_path,
+    get_brain_md_path,
+    get_snapshot_cache_path,
+    get_voyager_state_dir,
+)
+from voyager.fastjson import dumps_bytes, dumps_indented, loads
+from voyager.io import read_file, read_json, write_json
 from voyager.llm import is_internal_call
 from voyager.logging import get_logger
 from voyager.repo.snapshot import snapshot_to_json
 
 _logger = get_logger("inject_context")
 
+# Reuse a cached snapshot for back-to-back session starts; the TTL bounds
+# staleness from changes the cache key does not see (e.g. mid-rebase edits)
+SNAPSHOT_CACHE_TTL_SECONDS = 30
+
 app = typer.Typer(
     name="inject",
     help="Inject brain context at SessionStart.",
@@ -53,8 +65,8 @@ def _render_snapshot_compact(snapshot: dict[str, Any]) -> str:
     tree = files.get("tree")
     if isinstance(tree, str) and tree.strip():
         lines.append("Tree:")
-        for line in tree.splitlines()[:40]:
-            lines.append(f"  {line}")
+        # maxsplit stops splitting after the first 40 lines
+        lines.extend(f"  {line}" for line in tree.rstrip("\n").split("\n", 40)[:40])
     else:
         top_level = files.get("top_level", [])
         if top_level:
@@ -69,12 +81,43 @@ def _render_snapshot_compact(snapshot: dict[str, Any]) -> str:
     hints = snapshot.get("run_hints", [])
     if hints:
         lines.append("Hints:")
-        for hint in hints[:5]:
-            lines.append(f"  {hint[:100]}")
+        lines.extend(f"  {hint[:100]}" for hint in hints[:5])
 
     return "\n".join(lines) if lines else "(empty snapshot)"
 
 
+def _snapshot_cache_key(cwd: str) -> str:
+    """Key a snapshot by cwd plus the mtimes of the repo root and git state files."""
+    parts = [cwd]
+    root = Path(cwd)
+    for path in (root, root / ".git" / "HEAD", root / ".git" / "index"):
+        try:
+            parts.append(str(path.stat().st_mtime_ns))
+        except OSError:
+            parts.append("-")
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _get_snapshot_cached(cwd: str) -> dict[str, Any]:
+    """Return the repo snapshot for cwd, reusing a fresh cached copy if possible."""
+    cache_path = get_snapshot_cache_path()
+    key = _snapshot_cache_key(cwd)
+
+    cached = read_json(cache_path)
+    if (
+        isinstance(cached, dict)
+        and cached.get("key") == key
+        and cached.get("expires", 0) > time.time()
+        and isinstance(cached.get("snapshot"), dict)
+    ):
+        _logger.debug("Using cached snapshot for %s", cwd)
+        return cached["snapshot"]
+
+    snapshot = snapshot_to_json(cwd)
+    write_json(cache_path, {"key": key, "expires": time.time() + SNAPSHOT_CACHE_TTL_SECONDS, "snapshot": snapshot})
+    return snapshot
+
+
 def _get_next_actions(brain: dict[str, Any]) -> list[str]:
     """Extract next actions from brain state.
 
@@ -107,14 +150,14 @@ def _get_next_actions(brain: dict[str, Any]) -> list[str]:
 def build_context(
     brain_md: str | None,
     brain: dict[str, Any] | None,
-    snapshot: dict[str, Any],
+    snapshot: dict[str, Any] | None,
 ) -> str:
     """Build the additionalContext string for injection.
 
     Args:
         brain_md: Brain markdown content (or None).
         brain: Brain JSON dict (or None).
-        snapshot: Repo snapshot dict.
+        snapshot: Repo snapshot dict (or None to omit the snapshot section).
 
     Returns:
         Context string for injection.
@@ -139,14 +182,48 @@ def build_context(
             sections.append("")
 
     # Repo snapshot section
-    sections.append("## Repo Snapshot")
-    sections.append("")
-    sections.append(_render_snapshot_compact(snapshot))
-    sections.append("")
+    if snapshot is not None:
+        sections.append("## Repo Snapshot")
+        sections.append("")
+        sections.append(_render_snapshot_compact(snapshot))
+        sections.append("")
 
     return "\n".join(sections)
 
 
+def _read_hook_input() -> dict[str, Any]:
+    """Parse hook input JSON from stdin, reading raw bytes when possible.
+
+    Returns:
+        Hook input dict, or an empty dict if stdin is empty or invalid.
+    """
+    stream = getattr(sys.stdin, "buffer", sys.stdin)
+    raw = stream.read()
+    if not raw:
+        return {}
+    try:
+        hook_input = loads(raw)
+    except ValueError:
+        return {}
+    return hook_input if isinstance(hook_input, dict) else {}
+
+
+def write_hook_output(output: dict[str, Any]) -> None:
+    """Write hook output JSON to stdout as a single line.
+
+    Args:
+        output: Hook output dict.
+    """
+    data = dumps_bytes(output)
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is None:
+        sys.stdout.write(data.decode("utf-8") + "\n")
+        return
+    sys.stdout.flush()
+    stream.write(data + b"\n")
+    stream.flush()
+
+
 def inject_from_stdin() -> dict[str, Any]:
     """Read hook input from stdin and produce injection output.
 
@@ -154,10 +231,7 @@ def inject_from_stdin() -> dict[str, Any]:
         Hook output dict with additionalContext.
     """
     # Parse hook input
-    try:
-        hook_input = json.load(sys.stdin)
-    except json.JSONDecodeError:
-        hook_input = {}
+    hook_input = _read_hook_input()
 
     cwd = hook_input.get("cwd", str(Path.cwd()))
     session_id = hook_input.get("session_id", "")
@@ -176,8 +250,8 @@ def inject_from_stdin() -> dict[str, Any]:
     brain_json_path = get_brain_json_path()
     brain = read_json(brain_json_path)
 
-    # Generate repo snapshot
-    snapshot = snapshot_to_json(cwd)
+    # Generate repo snapshot (cached briefly across back-to-back session starts)
+    snapshot = _get_snapshot_cached(cwd)
 
     # Build context
     context = build_context(brain_md, brain, snapshot)
@@ -212,6 +286,10 @@ def main(
         Path | None,
         typer.Option("--repo", "-r", help="Repo path for snapshot generation"),
     ] = None,
+    no_snapshot: Annotated[
+        bool,
+        typer.Option("--no-snapshot", help="Skip the repo snapshot section entirely"),
+    ] = False,
 ) -> None:
     """Inject brain context at SessionStart.
 
@@ -226,7 +304,7 @@ def main(
 
     if from_stdin:
         output = inject_from_stdin()
-        typer.echo(json.dumps(output))
+        write_hook_output(output)
         raise typer.Exit(0)
 
     # Manual mode: use explicit paths
@@ -239,11 +317,13 @@ def main(
     if brain_json_path.exists():
         brain = read_json(brain_json_path)
 
-    snapshot: dict[str, Any]
-    if snapshot_path and snapshot_path.exists():
+    snapshot: dict[str, Any] | None
+    if no_snapshot:
+        snapshot = None
+    elif snapshot_path and snapshot_path.exists():
         snapshot = read_json(snapshot_path) or {}
     else:
-        snapshot = snapshot_to_json(repo_path or Path.cwd())
+        snapshot = _get_snapshot_cached(str(repo_path or Path.cwd()))
 
     context = build_context(brain_md, brain, snapshot)
     output = {
@@ -253,7 +333,11 @@ def main(
         "suppressOutput": True,
     }
 
-    typer.echo(json.dumps(output, indent=2))
+    # Pretty-print for a human at a terminal; pipes get compact JSON
+    if sys.stdout.isatty():
+        typer.echo(dumps_indented(output))
+    else:
+        write_hook_output(output)
 
 
 if __name__ == "__main__":
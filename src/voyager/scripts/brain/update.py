@@ -6,7 +6,10 @@ validates the result, renders brain.md, and saves an episode snapshot.
 
 from __future__ import annotations
 
+import io
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Annotated, Any
@@ -21,7 +24,8 @@ from voyager.brain.store import (
     save_last_update,
 )
 from voyager.config import get_brain_json_path, get_brain_md_path, get_plugin_root
-from voyager.io import read_file, read_json, read_jsonl
+from voyager.fastjson import dumps_indented, dumps_indented_capped
+from voyager.io import read_json, read_static_file, tail_jsonl
 from voyager.llm import call_claude, is_internal_call
 from voyager.logging import get_logger
 
@@ -40,7 +44,7 @@ MAX_TRANSCRIPT_CHARS = 50000
 def _load_prompt_template() -> str:
     """Load the update_brain prompt template."""
     prompt_path = get_plugin_root() / "skills/session-brain/prompts/update_brain.prompt.md"
-    content = read_file(prompt_path)
+    content = read_static_file(str(prompt_path))
     if content is None:
         # Fallback minimal prompt
         return """Update the brain JSON based on the transcript.
@@ -104,12 +108,32 @@ def _format_transcript_for_prompt(
     return "\n".join(formatted)
 
 
+def _bump_signals(brain: dict[str, Any], session_id: str, now: str) -> bool:
+    """Record this session in brain["signals"], keeping any other signal fields.
+
+    Args:
+        brain: Brain dict to update in place.
+        session_id: Current session ID.
+        now: Current ISO timestamp.
+
+    Returns:
+        True if either signal value changed.
+    """
+    signals = brain.setdefault("signals", {})
+    if signals.get("last_session_id") == session_id and signals.get("last_updated_at") == now:
+        return False
+    signals["last_session_id"] = session_id
+    signals["last_updated_at"] = now
+    return True
+
+
 def _build_update_prompt(
     current_brain: dict[str, Any],
     transcript_text: str,
     snapshot: dict[str, Any] | None,
     session_id: str,
     output_path: Path,
+    now: str | None = None,
 ) -> str:
     """Build the full prompt for brain update.
 
@@ -119,46 +143,35 @@ def _build_update_prompt(
         snapshot: Optional repo snapshot.
         session_id: Session identifier.
         output_path: Path where brain JSON should be written.
+        now: ISO timestamp the agent should record in signals (default: now).
 
     Returns:
         Complete prompt string.
     """
     template = _load_prompt_template()
-    now = datetime.now(UTC).isoformat()
-
-    parts = [template, "", "---", "", "## Current Brain", ""]
-    parts.append("```json")
-    parts.append(json.dumps(current_brain, indent=2, ensure_ascii=False))
-    parts.append("```")
-    parts.append("")
+    now = now or datetime.now(UTC).isoformat()
 
-    parts.append("## Session Transcript")
-    parts.append("")
-    parts.append("```")
-    parts.append(transcript_text)
-    parts.append("```")
-    parts.append("")
+    # Most stable content first and per-session content last, so consecutive
+    # prompts share the longest possible prefix for prompt caching
+    buf = io.StringIO()
+    buf.write(template)
+    buf.write("\n\n---\n\n## Current Brain\n\n```json\n")
+    buf.write(dumps_indented(current_brain))
+    buf.write("\n```\n\n")
 
     if snapshot:
-        parts.append("## Repo Snapshot")
-        parts.append("")
-        parts.append("```json")
-        parts.append(json.dumps(snapshot, indent=2, ensure_ascii=False)[:5000])
-        parts.append("```")
-        parts.append("")
-
-    parts.append("## Output")
-    parts.append("")
-    parts.append(f"Write the updated brain JSON to: `{output_path}`")
-    parts.append("")
-    parts.append("## Metadata")
-    parts.append("")
-    parts.append(f"- Session ID: {session_id}")
-    parts.append(f"- Current timestamp: {now}")
-    parts.append("")
-    parts.append("Use the Write tool to save the brain JSON file directly.")
-
-    return "\n".join(parts)
+        buf.write("## Repo Snapshot\n\n```json\n")
+        buf.write(dumps_indented_capped(snapshot, 5000)[0])
+        buf.write("\n```\n\n")
+
+    buf.write(f"## Output\n\nWrite the updated brain JSON to: `{output_path}`\n\n")
+    buf.write("## Session Transcript\n\n```\n")
+    buf.write(transcript_text)
+    buf.write("\n```\n\n")
+    buf.write(f"## Metadata\n\n- Session ID: {session_id}\n- Current timestamp: {now}\n\n")
+    buf.write("Use the Write tool to save the brain JSON file directly.")
+
+    return buf.getvalue()
 
 
 @app.callback(invoke_without_command=True)
@@ -202,13 +215,16 @@ def main(
 
     # Load current brain
     current_brain = load_brain()
-    _logger.debug("Loaded brain: %s", render_compact(current_brain))
+    if _logger.isEnabledFor(logging.DEBUG):
+        # Only render the summary when it will actually be logged
+        _logger.debug("Loaded brain: %s", render_compact(current_brain))
 
     # Read transcript
     transcript_lines: list[dict[str, Any]] = []
     total_lines = 0
     if transcript and transcript.exists():
-        result = read_jsonl(transcript)
+        # Only the most recent lines reach the prompt; don't parse the rest
+        result = tail_jsonl(transcript, MAX_TRANSCRIPT_LINES)
         total_lines = result.total_lines
         if result.invalid_lines:
             _logger.warning(
@@ -231,14 +247,15 @@ def main(
     brain_path = get_brain_json_path()
 
     # Determine if we should call LLM
+    validate_on_save = True
+    now = datetime.now(UTC).isoformat()
     if skip_llm or not transcript_lines:
         # Minimal update: just update timestamps
         _logger.info("Skipping LLM call, minimal update only")
-        updated_brain = current_brain.copy()
-        updated_brain["signals"] = {
-            "last_session_id": session_id,
-            "last_updated_at": datetime.now(UTC).isoformat(),
-        }
+        updated_brain = current_brain
+        _bump_signals(updated_brain, session_id, now)
+        # load_brain already validated everything but the two signal strings
+        validate_on_save = False
         status = "skipped"
         error = "No transcript or LLM skipped"
     elif dry_run:
@@ -248,7 +265,7 @@ def main(
     else:
         # Build prompt and call LLM agent
         transcript_text = _format_transcript_for_prompt(transcript_lines)
-        prompt = _build_update_prompt(current_brain, transcript_text, snapshot, session_id, brain_path)
+        prompt = _build_update_prompt(current_brain, transcript_text, snapshot, session_id, brain_path, now)
 
         _logger.info("Calling LLM agent to update brain...")
         result = call_claude(
@@ -267,63 +284,59 @@ def main(
                 typer.echo("Error: Invalid brain file written", err=True)
                 raise typer.Exit(1)
 
-            # Ensure signals are updated
-            updated_brain.setdefault("signals", {})
-            updated_brain["signals"]["last_session_id"] = session_id
-            updated_brain["signals"]["last_updated_at"] = datetime.now(UTC).isoformat()
-
-            # Re-save with updated signals
-            save_brain(updated_brain, brain_path)
+            # Ensure signals are updated; the prompt asks the agent to write these
+            # exact values, so only rewrite the file when it didn't
+            if _bump_signals(updated_brain, session_id, now):
+                save_brain(updated_brain, brain_path)
             status = "success"
             error = None
         else:
             # LLM failed, do minimal update
             _logger.warning("LLM call failed: %s", result.error)
-            updated_brain = current_brain.copy()
-            updated_brain["signals"] = {
-                "last_session_id": session_id,
-                "last_updated_at": datetime.now(UTC).isoformat(),
-            }
+            updated_brain = current_brain
+            _bump_signals(updated_brain, session_id, now)
             # Add a note about the failed update
             progress = updated_brain.setdefault("progress", {})
-            recent = progress.setdefault("recent_changes", [])
-            recent.insert(0, f"[{session_id}] Brain update failed: {result.error}")
-            recent = recent[:10]  # Keep bounded
-            progress["recent_changes"] = recent
+            recent = progress.get("recent_changes", [])
+            # Newest first, kept bounded to 10 entries
+            progress["recent_changes"] = [f"[{session_id}] Brain update failed: {result.error}", *recent[:9]]
             status = "failed"
             error = result.error
 
     if dry_run:
-        typer.echo(json.dumps(updated_brain, indent=2, ensure_ascii=False))
+        typer.echo(dumps_indented(updated_brain))
         raise typer.Exit(0)
 
     # Save brain.json (if not already saved by LLM)
     if status != "success":
-        if save_brain(updated_brain, brain_path):
+        if save_brain(updated_brain, brain_path, validate_schema=validate_on_save):
             _logger.info("Saved brain to %s", brain_path)
         else:
             _logger.error("Failed to save brain")
             save_last_update(session_id, "failed", error="Failed to save brain.json")
             raise typer.Exit(1)
 
-    # Render brain.md
+    # Render brain.md and save the episode concurrently; both are independent
+    # file writes that only read updated_brain
     md_path = get_brain_md_path()
-    if render_and_save(updated_brain, output_path=md_path):
-        _logger.info("Rendered brain.md to %s", md_path)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rendered = executor.submit(render_and_save, updated_brain, output_path=md_path)
+        episode = executor.submit(save_episode, updated_brain, session_id)
+
+        # Save last update metadata
+        save_last_update(
+            session_id,
+            status,
+            error=error,
+            transcript_lines=total_lines,
+        )
 
-    # Save episode
-    episode_path = save_episode(updated_brain, session_id)
+    if rendered.result():
+        _logger.info("Rendered brain.md to %s", md_path)
+    episode_path = episode.result()
     if episode_path:
         _logger.info("Saved episode to %s", episode_path)
 
-    # Save last update metadata
-    save_last_update(
-        session_id,
-        status,
-        error=error,
-        transcript_lines=total_lines,
-    )
-
     typer.echo(f"Brain updated: {render_compact(updated_brain)}", err=True)
 
 
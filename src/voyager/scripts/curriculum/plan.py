@@ -6,29 +6,32 @@ a structured task backlog, validates the result, and saves the curriculum.
 
 from __future__ import annotations
 
-import json
+import io
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Annotated, Any
 
 import typer
 
-from voyager.brain.store import load_brain
+from voyager.brain.store import load_brain_cached
 from voyager.config import (
     get_curriculum_json_path,
     get_curriculum_md_path,
+    get_plan_snapshot_cache_path,
     get_plugin_root,
 )
 from voyager.curriculum.render import render_and_save, render_compact
 from voyager.curriculum.store import (
-    load_curriculum,
+    load_curriculum_cached,
     save_curriculum,
     save_last_update,
 )
-from voyager.io import read_file, read_json
+from voyager.fastjson import dumps_indented, dumps_indented_capped
+from voyager.io import read_json, read_static_file, write_json
 from voyager.llm import call_claude, is_internal_call
+from voyager.llm_cache import llm_cache_key, load_cached_output, store_cached_output
 from voyager.logging import get_logger
-from voyager.repo.snapshot import snapshot_to_json
+from voyager.repo.snapshot import repo_fingerprint, snapshot_to_json
 
 _logger = get_logger("curriculum.plan")
 
@@ -41,7 +44,7 @@ app = typer.Typer(
 def _load_prompt_template() -> str:
     """Load the plan_curriculum prompt template."""
     prompt_path = get_plugin_root() / "skills/curriculum-planner/prompts/plan_curriculum.prompt.md"
-    content = read_file(prompt_path)
+    content = read_static_file(str(prompt_path))
     if content is None:
         # Fallback minimal prompt
         return """Generate a curriculum of tasks for this codebase.
@@ -49,10 +52,32 @@ Write the curriculum JSON matching the curriculum schema."""
     return content
 
 
+def _get_snapshot() -> dict[str, Any]:
+    """Return a repo snapshot, reusing the last one while the repo is unchanged."""
+    fingerprint = repo_fingerprint()
+    cache_path = get_plan_snapshot_cache_path()
+    if fingerprint is not None:
+        cached = read_json(cache_path)
+        if (
+            isinstance(cached, dict)
+            and cached.get("fingerprint") == fingerprint
+            and isinstance(cached.get("snapshot"), dict)
+        ):
+            _logger.info("Repo unchanged since last snapshot, reusing it")
+            return cached["snapshot"]
+
+    _logger.info("Generating fresh repo snapshot")
+    snapshot = snapshot_to_json()
+    if fingerprint is not None:
+        write_json(cache_path, {"fingerprint": fingerprint, "snapshot": snapshot})
+    return snapshot
+
+
 def _build_plan_prompt(
     brain: dict[str, Any],
     snapshot: dict[str, Any],
     output_path: Path,
+    now: str | None = None,
 ) -> str:
     """Build the full prompt for curriculum planning.
 
@@ -60,41 +85,31 @@ def _build_plan_prompt(
         brain: Current brain state.
         snapshot: Repo snapshot.
         output_path: Path where curriculum JSON should be written.
+        now: ISO timestamp for the prompt metadata (default: now).
 
     Returns:
         Complete prompt string.
     """
     template = _load_prompt_template()
-    now = datetime.now(UTC).isoformat()
-
-    parts = [template, "", "---", "", "## Brain State", ""]
-    parts.append("```json")
-    parts.append(json.dumps(brain, indent=2, ensure_ascii=False))
-    parts.append("```")
-    parts.append("")
-
-    parts.append("## Repo Snapshot")
-    parts.append("")
-    parts.append("```json")
-    # Truncate snapshot if too large
-    snapshot_str = json.dumps(snapshot, indent=2, ensure_ascii=False)
-    if len(snapshot_str) > 8000:
-        snapshot_str = snapshot_str[:8000] + "\n... (truncated)"
-    parts.append(snapshot_str)
-    parts.append("```")
-    parts.append("")
-
-    parts.append("## Output")
-    parts.append("")
-    parts.append(f"Write the curriculum JSON to: `{output_path}`")
-    parts.append("")
-    parts.append("## Metadata")
-    parts.append("")
-    parts.append(f"- Current timestamp: {now}")
-    parts.append("")
-    parts.append("Use the Write tool to save the curriculum JSON file directly.")
-
-    return "\n".join(parts)
+    now = now or datetime.now(UTC).isoformat()
+
+    buf = io.StringIO()
+    buf.write(template)
+    buf.write("\n\n---\n\n## Brain State\n\n```json\n")
+    buf.write(dumps_indented(brain))
+    buf.write("\n```\n\n## Repo Snapshot\n\n```json\n")
+    # Truncate snapshot if too large (without serializing all of it)
+    snapshot_str, truncated = dumps_indented_capped(snapshot, 8000)
+    buf.write(snapshot_str)
+    if truncated:
+        buf.write("\n... (truncated)")
+    buf.write("\n```\n\n")
+
+    buf.write(f"## Output\n\nWrite the curriculum JSON to: `{output_path}`\n\n")
+    buf.write(f"## Metadata\n\n- Current timestamp: {now}\n\n")
+    buf.write("Use the Write tool to save the curriculum JSON file directly.")
+
+    return buf.getvalue()
 
 
 def _count_tasks(curriculum: dict[str, Any]) -> int:
@@ -102,6 +117,75 @@ def _count_tasks(curriculum: dict[str, Any]) -> int:
     return sum(len(track.get("tasks", [])) for track in curriculum.get("tracks", []))
 
 
+def _generate_curriculum(
+    brain: dict[str, Any],
+    snapshot: dict[str, Any],
+    curriculum_path: Path,
+    brain_session: str,
+    now: str,
+) -> tuple[dict[str, Any], bool]:
+    """Have the LLM agent write a new curriculum and stamp its metadata.
+
+    Args:
+        brain: Current brain state.
+        snapshot: Repo snapshot.
+        curriculum_path: Path where curriculum JSON should be written.
+        brain_session: Session ID of the brain the curriculum is based on.
+        now: ISO timestamp of this run, used in the prompt and metadata.
+
+    Returns:
+        Tuple of (curriculum, whether it passed validation and was saved).
+
+    Raises:
+        typer.Exit: If the LLM call fails or writes an invalid file.
+    """
+    # Build prompt and call LLM agent
+    prompt = _build_plan_prompt(brain, snapshot, curriculum_path, now)
+
+    _logger.info("Calling LLM agent to generate curriculum...")
+    result = call_claude(
+        prompt,
+        cwd=curriculum_path.parent,
+        timeout_seconds=180,
+    )
+
+    if not (result.success and result.files):
+        # LLM failed
+        _logger.warning("LLM call failed: %s", result.error)
+        save_last_update(
+            "failed",
+            error=result.error,
+            brain_session=brain_session,
+        )
+        typer.echo(f"Error: {result.error}", err=True)
+        raise typer.Exit(1)
+
+    _logger.info("LLM curriculum generation successful")
+    # Load the written curriculum
+    curriculum = read_json(curriculum_path)
+    if not curriculum:
+        _logger.error("LLM wrote curriculum but file is empty/invalid")
+        save_last_update(
+            "failed",
+            error="Invalid curriculum file",
+            brain_session=brain_session,
+        )
+        typer.echo("Error: Invalid curriculum file written", err=True)
+        raise typer.Exit(1)
+
+    # Update metadata
+    curriculum.setdefault("metadata", {})
+    curriculum["metadata"]["updated_at"] = now
+    if "created_at" not in curriculum["metadata"]:
+        curriculum["metadata"]["created_at"] = now
+    curriculum["metadata"]["source_brain_session"] = brain_session
+    curriculum["metadata"]["total_tasks"] = _count_tasks(curriculum)
+
+    # Re-save with updated metadata
+    saved = save_curriculum(curriculum, curriculum_path)
+    return curriculum, saved
+
+
 @app.callback(invoke_without_command=True)
 def main(
     brain_path: Annotated[
@@ -124,6 +208,10 @@ def main(
         bool,
         typer.Option("--skip-llm", help="Skip LLM call, just render existing"),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Always call the LLM, even if inputs are unchanged"),
+    ] = False,
 ) -> None:
     """Generate a curriculum from brain state and repo snapshot.
 
@@ -138,7 +226,7 @@ def main(
     _logger.info("Starting curriculum planning")
 
     # Load brain
-    brain = load_brain(brain_path)
+    brain = load_brain_cached(brain_path)
     brain_session = brain.get("signals", {}).get("last_session_id", "unknown")
     _logger.debug("Loaded brain (session: %s)", brain_session)
 
@@ -147,8 +235,7 @@ def main(
         snapshot = read_json(snapshot_path) or {}
         _logger.debug("Loaded snapshot from %s", snapshot_path)
     else:
-        _logger.info("Generating fresh repo snapshot")
-        snapshot = snapshot_to_json()
+        snapshot = _get_snapshot()
 
     # Determine output path
     curriculum_path = output or get_curriculum_json_path()
@@ -156,63 +243,41 @@ def main(
 
     if skip_llm:
         # Just render existing curriculum
-        curriculum = load_curriculum(curriculum_path)
+        curriculum = load_curriculum_cached(curriculum_path)
         _logger.info("Skipping LLM, rendering existing curriculum")
+        # The file may have been edited by hand, so don't trust its metadata
+        task_count = _count_tasks(curriculum)
     elif dry_run:
         # For dry run, we need to get the curriculum without writing
         typer.echo("Dry run not supported with LLM mode", err=True)
         raise typer.Exit(1)
     else:
-        # Build prompt and call LLM agent
-        prompt = _build_plan_prompt(brain, snapshot, curriculum_path)
-
-        _logger.info("Calling LLM agent to generate curriculum...")
-        result = call_claude(
-            prompt,
-            cwd=curriculum_path.parent,
-            timeout_seconds=180,
+        cache_key = llm_cache_key(
+            "curriculum",
+            {
+                "template": _load_prompt_template(),
+                "brain": brain,
+                "snapshot": snapshot,
+                "output": str(curriculum_path),
+            },
         )
-
-        if result.success and result.files:
-            _logger.info("LLM curriculum generation successful")
-            # Load the written curriculum
-            curriculum = read_json(curriculum_path)
-            if not curriculum:
-                _logger.error("LLM wrote curriculum but file is empty/invalid")
-                save_last_update(
-                    "failed",
-                    error="Invalid curriculum file",
-                    brain_session=brain_session,
-                )
-                typer.echo("Error: Invalid curriculum file written", err=True)
-                raise typer.Exit(1)
-
-            # Update metadata
-            curriculum.setdefault("metadata", {})
-            now = datetime.now(UTC).isoformat()
-            curriculum["metadata"]["updated_at"] = now
-            if "created_at" not in curriculum["metadata"]:
-                curriculum["metadata"]["created_at"] = now
-            curriculum["metadata"]["source_brain_session"] = brain_session
-            curriculum["metadata"]["total_tasks"] = _count_tasks(curriculum)
-
-            # Re-save with updated metadata
+        cached = None if no_cache else load_cached_output(cache_key)
+        if cached is not None:
+            _logger.info("Inputs unchanged since a previous run, reusing its curriculum")
+            curriculum = cached
             save_curriculum(curriculum, curriculum_path)
         else:
-            # LLM failed
-            _logger.warning("LLM call failed: %s", result.error)
-            save_last_update(
-                "failed",
-                error=result.error,
-                brain_session=brain_session,
+            curriculum, saved = _generate_curriculum(
+                brain, snapshot, curriculum_path, brain_session, datetime.now(UTC).isoformat()
             )
-            typer.echo(f"Error: {result.error}", err=True)
-            raise typer.Exit(1)
-
-    task_count = _count_tasks(curriculum)
+            # A curriculum that failed validation must not be served to later runs
+            if saved:
+                store_cached_output(cache_key, curriculum)
+        # Set by _generate_curriculum, including for the cached copy
+        task_count = curriculum["metadata"]["total_tasks"]
 
     if dry_run:
-        typer.echo(json.dumps(curriculum, indent=2, ensure_ascii=False))
+        typer.echo(dumps_indented(curriculum))
         raise typer.Exit(0)
 
     # Render curriculum.md
@@ -6,27 +6,33 @@ repeated workflows that could become reusable skills.
 
 from __future__ import annotations
 
-import json
+import io
+import re
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Annotated, Any
 
 import typer
 
-from voyager.brain.store import load_brain
+from voyager.brain.store import load_brain_cached
 from voyager.config import get_plugin_root, get_voyager_state_dir
-from voyager.curriculum.store import load_curriculum
+from voyager.curriculum.store import load_curriculum_cached
 from voyager.factory.store import (
     get_existing_skill_names,
     save_last_update,
     validate_proposals,
 )
-from voyager.io import read_file, read_json
+from voyager.fastjson import dumps_indented
+from voyager.io import read_json, read_static_file, tail_jsonl, write_json
 from voyager.llm import call_claude, is_internal_call
+from voyager.llm_cache import llm_cache_key, load_cached_output, store_cached_output
 from voyager.logging import get_logger
 
 _logger = get_logger("factory.propose")
 
+# Transcript lines the summarizer uses; checked on raw bytes before JSON parsing
+_SUMMARY_LINE_RE = re.compile(rb'"type"\s*:\s*"(?:user|assistant)"')
+
 app = typer.Typer(
     name="propose",
     help="Propose new skills from observed patterns.",
@@ -36,7 +42,7 @@ app = typer.Typer(
 def _load_prompt_template() -> str:
     """Load the propose_skills prompt template."""
     prompt_path = get_plugin_root() / "skills/skill-factory/prompts/propose_skills.prompt.md"
-    content = read_file(prompt_path)
+    content = read_static_file(str(prompt_path))
     if content is None:
         # Fallback minimal prompt
         return """Analyze the provided context and propose reusable skills.
@@ -49,7 +55,7 @@ def _summarize_transcript(transcript_path: Path, max_lines: int = 500) -> str:
 
     Args:
         transcript_path: Path to transcript JSONL file.
-        max_lines: Maximum lines to read.
+        max_lines: Maximum user/assistant lines to read, counted from the end of the file.
 
     Returns:
         Summarized transcript as string.
@@ -58,38 +64,29 @@ def _summarize_transcript(transcript_path: Path, max_lines: int = 500) -> str:
         return ""
 
     lines = []
-    try:
-        with transcript_path.open("r", encoding="utf-8") as f:
-            for i, line in enumerate(f):
-                if i >= max_lines:
-                    break
-                try:
-                    entry = json.loads(line.strip())
-                    # Extract relevant fields for pattern detection
-                    msg_type = entry.get("type", "")
-                    if msg_type == "assistant":
-                        # Look for tool uses
-                        message = entry.get("message", {})
-                        content = message.get("content", [])
-                        for block in content:
-                            if isinstance(block, dict):
-                                if block.get("type") == "tool_use":
-                                    tool_name = block.get("name", "")
-                                    lines.append(f"Tool: {tool_name}")
-                                elif block.get("type") == "text":
-                                    text = block.get("text", "")[:200]
-                                    if text:
-                                        lines.append(f"Assistant: {text}...")
-                    elif msg_type == "user":
-                        message = entry.get("message", {})
-                        content = message.get("content", "")
-                        if isinstance(content, str) and content:
-                            lines.append(f"User: {content[:200]}...")
-                except (json.JSONDecodeError, KeyError):
-                    continue
-    except OSError as e:
-        _logger.warning("Failed to read transcript: %s", e)
-        return ""
+    for entry in tail_jsonl(transcript_path, max_lines, match=_SUMMARY_LINE_RE.search).items:
+        if not isinstance(entry, dict):
+            continue
+        # Extract relevant fields for pattern detection
+        msg_type = entry.get("type", "")
+        if msg_type == "assistant":
+            # Look for tool uses
+            message = entry.get("message", {})
+            content = message.get("content", [])
+            for block in content:
+                if isinstance(block, dict):
+                    if block.get("type") == "tool_use":
+                        tool_name = block.get("name", "")
+                        lines.append(f"Tool: {tool_name}")
+                    elif block.get("type") == "text":
+                        text = block.get("text", "")[:200]
+                        if text:
+                            lines.append(f"Assistant: {text}...")
+        elif msg_type == "user":
+            message = entry.get("message", {})
+            content = message.get("content", "")
+            if isinstance(content, str) and content:
+                lines.append(f"User: {content[:200]}...")
 
     return "\n".join(lines[-100:])  # Keep last 100 entries
 
@@ -100,6 +97,7 @@ def _build_propose_prompt(
     transcript_summary: str,
     existing_skills: set[str],
     output_path: Path,
+    now: str | None = None,
 ) -> str:
     """Build the full prompt for skill proposal.
 
@@ -109,20 +107,28 @@ def _build_propose_prompt(
         transcript_summary: Summarized transcript.
         existing_skills: Set of existing skill names to avoid duplicates.
         output_path: Path where proposals JSON should be written.
+        now: ISO timestamp for the prompt metadata (default: now).
 
     Returns:
         Complete prompt string.
     """
     template = _load_prompt_template()
-    now = datetime.now(UTC).isoformat()
+    now = now or datetime.now(UTC).isoformat()
 
-    parts = [template, "", "---", "", "## Context", ""]
+    # Most stable content first and per-session content last, so consecutive
+    # prompts share the longest possible prefix for prompt caching
+    buf = io.StringIO()
+    buf.write(template)
+    buf.write("\n\n---\n\n## Context\n\n")
+
+    # Existing skills to avoid
+    if existing_skills:
+        buf.write("### Existing Skills (do not duplicate)\n\n")
+        buf.write(", ".join(sorted(existing_skills)))
+        buf.write("\n\n")
 
     # Brain state
     if brain.get("project", {}).get("summary"):
-        parts.append("### Brain State")
-        parts.append("")
-        parts.append("```json")
         # Only include relevant parts of brain
         brain_summary = {
             "project": brain.get("project", {}),
@@ -130,15 +136,12 @@ def _build_propose_prompt(
             "decisions": brain.get("decisions", [])[-5:],  # Last 5 decisions
             "progress": {"recent_changes": brain.get("progress", {}).get("recent_changes", [])[-10:]},
         }
-        parts.append(json.dumps(brain_summary, indent=2, ensure_ascii=False))
-        parts.append("```")
-        parts.append("")
+        buf.write("### Brain State\n\n```json\n")
+        buf.write(dumps_indented(brain_summary))
+        buf.write("\n```\n\n")
 
     # Curriculum
     if curriculum.get("tracks"):
-        parts.append("### Curriculum")
-        parts.append("")
-        parts.append("```json")
         # Only include track names and task titles
         curriculum_summary = {
             "goal": curriculum.get("goal", ""),
@@ -153,37 +156,73 @@ def _build_propose_prompt(
                 for t in curriculum.get("tracks", [])
             ],
         }
-        parts.append(json.dumps(curriculum_summary, indent=2, ensure_ascii=False))
-        parts.append("```")
-        parts.append("")
+        buf.write("### Curriculum\n\n```json\n")
+        buf.write(dumps_indented(curriculum_summary))
+        buf.write("\n```\n\n")
 
-    # Transcript summary
+    # Transcript summary (changes every session)
     if transcript_summary:
-        parts.append("### Recent Session Activity")
-        parts.append("")
-        parts.append("```")
-        parts.append(transcript_summary[:4000])  # Limit size
-        parts.append("```")
-        parts.append("")
+        buf.write("### Recent Session Activity\n\n```\n")
+        buf.write(transcript_summary[:4000])  # Limit size
+        buf.write("\n```\n\n")
 
-    # Existing skills to avoid
-    if existing_skills:
-        parts.append("### Existing Skills (do not duplicate)")
-        parts.append("")
-        parts.append(", ".join(sorted(existing_skills)))
-        parts.append("")
+    buf.write(f"## Output\n\nWrite the skill proposals JSON to: `{output_path}`\n\n")
+    buf.write(f"## Metadata\n\n- Current timestamp: {now}\n\n")
+    buf.write("Use the Write tool to save the proposals JSON file directly.")
+
+    return buf.getvalue()
+
+
+def _generate_proposals(
+    brain: dict[str, Any],
+    curriculum: dict[str, Any],
+    transcript_summary: str,
+    existing_skills: set[str],
+    proposals_path: Path,
+    state_dir: Path,
+) -> dict[str, Any]:
+    """Have the LLM agent write skill proposals and load them.
 
-    parts.append("## Output")
-    parts.append("")
-    parts.append(f"Write the skill proposals JSON to: `{output_path}`")
-    parts.append("")
-    parts.append("## Metadata")
-    parts.append("")
-    parts.append(f"- Current timestamp: {now}")
-    parts.append("")
-    parts.append("Use the Write tool to save the proposals JSON file directly.")
+    Args:
+        brain: Current brain state.
+        curriculum: Current curriculum.
+        transcript_summary: Summarized transcript.
+        existing_skills: Set of existing skill names to avoid duplicates.
+        proposals_path: Path where proposals JSON should be written.
+        state_dir: Working directory for the agent.
+
+    Returns:
+        The proposals the agent wrote.
 
-    return "\n".join(parts)
+    Raises:
+        typer.Exit: If the LLM call fails or writes an invalid file.
+    """
+    # Build prompt and call LLM agent
+    prompt = _build_propose_prompt(brain, curriculum, transcript_summary, existing_skills, proposals_path)
+
+    _logger.info("Calling LLM agent to propose skills...")
+    result = call_claude(
+        prompt,
+        cwd=state_dir,
+        timeout_seconds=120,
+    )
+
+    if not (result.success and result.files):
+        # LLM failed
+        _logger.warning("LLM call failed: %s", result.error)
+        save_last_update("propose", "failed", error=result.error)
+        typer.echo(f"Error: {result.error}", err=True)
+        raise typer.Exit(1)
+
+    _logger.info("LLM skill proposal successful")
+    # Load the written proposals to validate and display
+    proposals = read_json(proposals_path)
+    if not proposals:
+        _logger.error("LLM wrote proposals but file is empty/invalid")
+        save_last_update("propose", "failed", error="Invalid proposals file")
+        typer.echo("Error: Invalid proposals file written", err=True)
+        raise typer.Exit(1)
+    return proposals
 
 
 @app.callback(invoke_without_command=True)
@@ -212,6 +251,10 @@ def main(
         bool,
         typer.Option("--skip-llm", help="Skip LLM call, use existing proposals"),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Always call the LLM, even if inputs are unchanged"),
+    ] = False,
 ) -> None:
     """Propose new skills from observed patterns.
 
@@ -226,11 +269,11 @@ def main(
     _logger.info("Starting skill proposal")
 
     # Load brain
-    brain = load_brain(brain_path)
+    brain = load_brain_cached(brain_path)
     _logger.debug("Loaded brain")
 
     # Load curriculum
-    curriculum = load_curriculum(curriculum_path)
+    curriculum = load_curriculum_cached(curriculum_path)
     _logger.debug("Loaded curriculum")
 
     # Summarize transcript if provided
@@ -248,6 +291,8 @@ def main(
     state_dir.mkdir(parents=True, exist_ok=True)
     proposals_path = output or (state_dir / "skill_proposals.json")
 
+    # Set when the LLM produced new proposals; they are cached only if valid
+    new_cache_key: str | None = None
     if skip_llm:
         # Load existing proposals
         proposals = read_json(proposals_path) or {
@@ -261,42 +306,40 @@ def main(
         typer.echo("Dry run not supported with LLM mode", err=True)
         raise typer.Exit(1)
     else:
-        # Build prompt and call LLM agent
-        prompt = _build_propose_prompt(brain, curriculum, transcript_summary, existing_skills, proposals_path)
-
-        _logger.info("Calling LLM agent to propose skills...")
-        result = call_claude(
-            prompt,
-            cwd=state_dir,
-            timeout_seconds=120,
+        cache_key = llm_cache_key(
+            "skill_proposals",
+            {
+                "template": _load_prompt_template(),
+                "brain": brain,
+                "curriculum": curriculum,
+                "transcript": transcript_summary,
+                "existing_skills": sorted(existing_skills),
+                "output": str(proposals_path),
+            },
         )
-
-        if result.success and result.files:
-            _logger.info("LLM skill proposal successful")
-            # Load the written proposals to validate and display
-            proposals = read_json(proposals_path)
-            if not proposals:
-                _logger.error("LLM wrote proposals but file is empty/invalid")
-                save_last_update("propose", "failed", error="Invalid proposals file")
-                typer.echo("Error: Invalid proposals file written", err=True)
-                raise typer.Exit(1)
+        cached = None if no_cache else load_cached_output(cache_key)
+        if cached is not None:
+            _logger.info("Inputs unchanged since a previous run, reusing its proposals")
+            proposals = cached
+            write_json(proposals_path, proposals)
         else:
-            # LLM failed
-            _logger.warning("LLM call failed: %s", result.error)
-            save_last_update("propose", "failed", error=result.error)
-            typer.echo(f"Error: {result.error}", err=True)
-            raise typer.Exit(1)
+            proposals = _generate_proposals(
+                brain, curriculum, transcript_summary, existing_skills, proposals_path, state_dir
+            )
+            new_cache_key = cache_key
 
     # Validate proposals
     is_valid, errors = validate_proposals(proposals)
     if not is_valid:
         _logger.warning("Proposals failed validation: %s", errors)
         # Still continue but warn user
+    elif new_cache_key is not None:
+        store_cached_output(new_cache_key, proposals)
 
     proposal_count = len(proposals.get("proposals", []))
 
     if dry_run:
-        typer.echo(json.dumps(proposals, indent=2, ensure_ascii=False))
+        typer.echo(dumps_indented(proposals))
         raise typer.Exit(0)
 
     # Save last update metadata
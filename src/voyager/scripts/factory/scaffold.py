@@ -6,7 +6,7 @@ SKILL.md and any necessary reference files.
 
 from __future__ import annotations
 
-import json
+import io
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Annotated, Any
@@ -20,7 +20,8 @@ from voyager.factory.store import (
     save_last_update,
     skill_exists,
 )
-from voyager.io import read_file, read_json, write_file
+from voyager.fastjson import dumps_indented
+from voyager.io import read_json, read_static_file, write_file
 from voyager.llm import call_claude, is_internal_call
 from voyager.logging import get_logger
 
@@ -35,7 +36,7 @@ app = typer.Typer(
 def _load_prompt_template() -> str:
     """Load the scaffold_skill prompt template."""
     prompt_path = get_plugin_root() / "skills/skill-factory/prompts/scaffold_skill.prompt.md"
-    content = read_file(prompt_path)
+    content = read_static_file(str(prompt_path))
     if content is None:
         # Fallback minimal prompt
         return """Generate SKILL.md content for the given skill proposal.
@@ -56,36 +57,20 @@ def _build_scaffold_prompt(proposal: dict[str, Any], skill_path: Path) -> str:
     template = _load_prompt_template()
     now = datetime.now(UTC).isoformat()
 
-    parts = [
-        template,
-        "",
-        "---",
-        "",
-        "## Skill Proposal",
-        "",
-        "```json",
-        json.dumps(proposal, indent=2, ensure_ascii=False),
-        "```",
-        "",
-        "## Output Location",
-        "",
-        f"Create the skill at: `{skill_path}`",
-        "",
-        "Write the following files:",
-        f"- `{skill_path}/SKILL.md` - Main skill file with YAML frontmatter",
-        "- Any reference files mentioned in `suggested_references`",
-        "",
-        "## Metadata",
-        "",
-        f"- Current timestamp: {now}",
-        "",
-        "## Instructions",
-        "",
-        "Use the Write tool to create each file.",
-        "Do NOT return JSON - write files directly.",
-    ]
-
-    return "\n".join(parts)
+    buf = io.StringIO()
+    buf.write(template)
+    buf.write("\n\n---\n\n## Skill Proposal\n\n```json\n")
+    buf.write(dumps_indented(proposal))
+    buf.write("\n```\n\n## Output Location\n\n")
+    buf.write(f"Create the skill at: `{skill_path}`\n\n")
+    buf.write("Write the following files:\n")
+    buf.write(f"- `{skill_path}/SKILL.md` - Main skill file with YAML frontmatter\n")
+    buf.write("- Any reference files mentioned in `suggested_references`\n\n")
+    buf.write(f"## Metadata\n\n- Current timestamp: {now}\n\n")
+    buf.write("## Instructions\n\n")
+    buf.write("Use the Write tool to create each file.\n")
+    buf.write("Do NOT return JSON - write files directly.")
+    return buf.getvalue()
 
 
 def _generate_simple_skill_md(proposal: dict[str, Any]) -> str:
@@ -106,10 +91,10 @@ def _generate_simple_skill_md(proposal: dict[str, Any]) -> str:
     rationale = proposal.get("rationale", "")
 
     # Build trigger list for description
-    trigger_lines = "\n".join(f'  - "{t}"' for t in triggers)
+    trigger_lines = "\n".join([f'  - "{t}"' for t in triggers])
 
     # Build tools list
-    tools_lines = "\n".join(f"  - {t}" for t in tools)
+    tools_lines = "\n".join([f"  - {t}" for t in tools])
 
     return f"""---
 name: {name}
@@ -205,11 +190,9 @@ def main(
     proposal: dict[str, Any] | None = None
 
     if proposal_name:
-        # Find by name
-        for p in proposals:
-            if p.get("name") == proposal_name:
-                proposal = p
-                break
+        # Find by name; a single lookup per run, so stop at the first match
+        # rather than indexing every proposal
+        proposal = next((p for p in proposals if p.get("name") == proposal_name), None)
         if not proposal:
             typer.echo(f"Error: Proposal '{proposal_name}' not found", err=True)
             typer.echo("Available proposals:", err=True)
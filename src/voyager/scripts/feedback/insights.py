@@ -7,31 +7,35 @@ Run: voyager feedback insights
 
 from __future__ import annotations
 
-import json
+import heapq
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 import typer
 
 from voyager.config import get_feedback_db_path
+from voyager.fastjson import dumps_indented
 from voyager.logging import get_logger
 
 _logger = get_logger("feedback.insights")
 
+# Overview table rows (name, uses, success, failed); bound once, shared by
+# the header and every row
+_SKILL_ROW = "{:<25} {:>8} {:>10} {:>8}".format
+_TOOL_ROW = "{:<20} {:>8} {:>10} {:>8}".format
+
 
 def format_success_rate(rate: float) -> str:
-    """Format success rate with color-like indicator."""
-    pct = rate * 100
-    if pct >= 90 or pct >= 70:
-        return f"{pct:.1f}%"
-    else:
-        return f"{pct:.1f}%"
+    """Format success rate as a percentage with one decimal."""
+    return f"{rate * 100:.1f}%"
 
 
 def generate_skill_recommendations(
     store: Any,
     skill_id: str,
     stats: dict[str, Any],
+    errors: list[dict[str, Any]] | None = None,
 ) -> list[str]:
     """Generate improvement recommendations for a skill.
 
@@ -39,6 +43,8 @@ def generate_skill_recommendations(
         store: FeedbackStore instance.
         skill_id: Skill identifier.
         stats: Skill statistics.
+        errors: The skill's most common errors, if already fetched
+            (e.g. via get_top_errors_per_skill). Queried from store if None.
 
     Returns:
         List of recommendation strings.
@@ -53,7 +59,8 @@ def generate_skill_recommendations(
         )
 
     # Check common errors
-    errors = store.get_common_errors(skill_id, limit=3)
+    if errors is None:
+        errors = store.get_common_errors(skill_id, limit=3)
     if errors:
         top_error = errors[0]
         if top_error["count"] > 2:
@@ -93,7 +100,15 @@ def main(
 
     from voyager.refinement.store import FeedbackStore
 
+    # Probe read-only first so an empty database is never initialized/migrated
+    if not FeedbackStore.has_executions(db_path):
+        typer.echo("No feedback data yet.")
+        typer.echo("Use Claude Code with skills, then check back!")
+        raise typer.Exit(0)
+
     store = FeedbackStore(db_path)
+    # Rate-limited via a stamp file; the tool-use hook never runs this itself
+    store.maintain()
 
     # Get total counts
     counts = store.get_total_counts()
@@ -111,15 +126,19 @@ def main(
             raise typer.Exit(1)
 
         s = stats[skill]
+        # One query serves both the error listing and the recommendations
+        # (which look at the top 3)
+        skill_errors = store.get_common_errors(skill)
+        recommendations = generate_skill_recommendations(store, skill, s, skill_errors[:3])
 
         if json_output:
             output = {
                 "skill": skill,
                 "stats": s,
-                "errors": store.get_common_errors(skill) if errors else [],
-                "recommendations": generate_skill_recommendations(store, skill, s),
+                "errors": skill_errors if errors else [],
+                "recommendations": recommendations,
             }
-            typer.echo(json.dumps(output, indent=2))
+            typer.echo(dumps_indented(output))
             return
 
         typer.echo(f"\nSkill: {skill}")
@@ -127,24 +146,24 @@ def main(
         typer.echo(f"  Success rate: {format_success_rate(s['success_rate'])}")
         typer.echo(f"  Failed: {s['failed']}")
 
-        if errors:
-            skill_errors = store.get_common_errors(skill)
-            if skill_errors:
-                typer.echo("\n  Common errors:")
-                for e in skill_errors[:5]:
-                    preview = e["error"][:60] if e["error"] else "unknown"
-                    typer.echo(f"    ({e['count']}x) {preview}...")
-
-        recommendations = generate_skill_recommendations(store, skill, s)
+        if errors and skill_errors:
+            typer.echo("\n  Common errors:")
+            for e in skill_errors[:5]:
+                preview = e["error"][:60] if e["error"] else "unknown"
+                typer.echo(f"    ({e['count']}x) {preview}...")
+
         if recommendations:
             typer.echo("\n  Recommendations:")
             for rec in recommendations:
                 typer.echo(f"    - {rec}")
 
     else:
-        # Overview of all skills
-        skill_stats = store.get_skill_stats()
-        tool_stats = store.get_tool_usage_stats()
+        # Overview of all skills (one scan for skills, tools and errors)
+        all_stats = store.get_all_stats(error_limit=5)
+        skill_stats = all_stats["skills"]
+        tool_stats = all_stats["tools"]
+        # Errors for every skill's recommendations, in one query
+        skill_errors_by_id = store.get_top_errors_per_skill(limit_per_skill=3)
 
         if json_output:
             output: dict[str, Any] = {
@@ -156,7 +175,7 @@ def main(
 
             # Generate recommendations for each skill
             for skill_id, s in skill_stats.items():
-                recs = generate_skill_recommendations(store, skill_id, s)
+                recs = generate_skill_recommendations(store, skill_id, s, skill_errors_by_id.get(skill_id, []))
                 if recs:
                     output["recommendations"].append(
                         {
@@ -165,71 +184,72 @@ def main(
                         }
                     )
 
-            typer.echo(json.dumps(output, indent=2))
+            typer.echo(dumps_indented(output))
             return
 
-        typer.echo("\nFeedback Insights")
-        typer.echo("=" * 50)
-        typer.echo(f"\nSummary: {counts['total_executions']} tool calls across {counts['total_sessions']} sessions")
-        typer.echo(f"Skills detected: {counts['total_skills']}")
+        # Collect the report and write it at once; each echo is a write + flush
+        lines: list[str] = []
+        lines.append("\nFeedback Insights")
+        lines.append("=" * 50)
+        lines.append(f"\nSummary: {counts['total_executions']} tool calls across {counts['total_sessions']} sessions")
+        lines.append(f"Skills detected: {counts['total_skills']}")
 
         # Skill performance
         if skill_stats:
-            typer.echo("\nSkill Performance")
-            typer.echo("-" * 50)
-            typer.echo(f"{'Skill':<25} {'Uses':>8} {'Success':>10} {'Failed':>8}")
-            typer.echo("-" * 50)
+            lines.append("\nSkill Performance")
+            lines.append("-" * 50)
+            lines.append(_SKILL_ROW("Skill", "Uses", "Success", "Failed"))
+            lines.append("-" * 50)
 
             for skill_id, s in sorted(
                 skill_stats.items(),
                 key=lambda x: x[1]["total"],
                 reverse=True,
             ):
-                typer.echo(
-                    f"{skill_id:<25} {s['total']:>8} {format_success_rate(s['success_rate']):>10} {s['failed']:>8}"
-                )
+                lines.append(_SKILL_ROW(skill_id, s["total"], format_success_rate(s["success_rate"]), s["failed"]))
 
         # Tool usage
         if tool_stats:
-            typer.echo("\nTool Usage")
-            typer.echo("-" * 50)
-            typer.echo(f"{'Tool':<20} {'Uses':>8} {'Success':>10} {'Failed':>8}")
-            typer.echo("-" * 50)
+            lines.append("\nTool Usage")
+            lines.append("-" * 50)
+            lines.append(_TOOL_ROW("Tool", "Uses", "Success", "Failed"))
+            lines.append("-" * 50)
 
-            for tool_name, s in sorted(
-                tool_stats.items(),
-                key=lambda x: x[1]["total"],
-                reverse=True,
-            )[:10]:  # Top 10 tools
-                typer.echo(
-                    f"{tool_name:<20} {s['total']:>8} {format_success_rate(s['success_rate']):>10} {s['failed']:>8}"
-                )
+            # Top 10 tools
+            for tool_name, s in heapq.nlargest(10, tool_stats.items(), key=lambda x: x[1]["total"]):
+                lines.append(_TOOL_ROW(tool_name, s["total"], format_success_rate(s["success_rate"]), s["failed"]))
 
         # Global errors
         if errors:
-            all_errors = store.get_common_errors(limit=5)
+            all_errors = all_stats["errors"]
             if all_errors:
-                typer.echo("\nTop Errors")
-                typer.echo("-" * 50)
+                lines.append("\nTop Errors")
+                lines.append("-" * 50)
                 for e in all_errors:
                     preview = e["error"][:50] if e["error"] else "unknown"
                     skill_info = f" ({e['skill']})" if e.get("skill") else ""
-                    typer.echo(f"  ({e['count']}x) [{e['tool']}{skill_info}] {preview}...")
-
-        # Recommendations
-        all_recs: list[tuple[str, str]] = []
-        for skill_id, s in skill_stats.items():
-            recs = generate_skill_recommendations(store, skill_id, s)
-            for rec in recs:
-                all_recs.append((skill_id, rec))
+                    lines.append(f"  ({e['count']}x) [{e['tool']}{skill_info}] {preview}...")
+
+        # Recommendations (only the first 5 are shown)
+        all_recs = list(
+            islice(
+                (
+                    (skill_id, rec)
+                    for skill_id, s in skill_stats.items()
+                    for rec in generate_skill_recommendations(store, skill_id, s, skill_errors_by_id.get(skill_id, []))
+                ),
+                5,
+            )
+        )
 
         if all_recs:
-            typer.echo("\nRecommendations")
-            typer.echo("-" * 50)
-            for skill_id, rec in all_recs[:5]:  # Top 5 recommendations
-                typer.echo(f"  [{skill_id}] {rec}")
+            lines.append("\nRecommendations")
+            lines.append("-" * 50)
+            for skill_id, rec in all_recs:
+                lines.append(f"  [{skill_id}] {rec}")
 
-        typer.echo()
+        lines.append("")
+        typer.echo("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -6,12 +6,12 @@ suitable for injection into Session Brain and Curriculum Planner contexts.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Annotated
 
 import typer
 
+from voyager.fastjson import dumps_compact, dumps_indented
 from voyager.io import write_file
 from voyager.repo.snapshot import snapshot_to_json
 
@@ -43,8 +43,7 @@ def main(
     """
     snapshot = snapshot_to_json(path)
 
-    indent = None if compact else 2
-    json_output = json.dumps(snapshot, indent=indent, ensure_ascii=False)
+    json_output = dumps_compact(snapshot) if compact else dumps_indented(snapshot)
 
     if output:
         if not write_file(output, json_output + "\n"):
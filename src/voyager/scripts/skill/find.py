@@ -1,23 +1,67 @@
 """CLI for searching skills.
 
 Usage:
-    voyager skill find "query" [--top-k N] [--index DIR] [--json]
+    voyager skill find "query" [--top-k N] [--index DIR] [--json] [--no-cache]
+    voyager skill find --persist [--top-k N] [--index DIR] [--json]  # one query per stdin line
     find-skill "query" [options]  # shortcut
 """
 
 from __future__ import annotations
 
-import json as json_module
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
+from voyager.fastjson import dumps_indented
+
+if TYPE_CHECKING:
+    from voyager.retrieval.index import SearchResult
+
+
+def _print_results(query: str, results: list[SearchResult], json_output: bool) -> None:
+    """Print search results as JSON or a human-readable list."""
+    if json_output:
+        output = [
+            {
+                "skill_id": r.skill_id,
+                "name": r.name,
+                "purpose": r.purpose,
+                "path": r.path,
+                "score": r.score,
+                "file_types": r.file_types,
+                "capabilities": r.capabilities,
+            }
+            for r in results
+        ]
+        typer.echo(dumps_indented(output))
+        return
+
+    if not results:
+        typer.echo(f'No skills found matching: "{query}"')
+        return
+
+    # Collected and written with one echo rather than one per line
+    lines = [f'\nSkills matching: "{query}"\n']
+    for i, r in enumerate(results, 1):
+        lines.append(f"{i}. {r.name} (score: {r.score:.3f})")
+        if r.purpose:
+            # Truncate purpose to ~80 chars
+            purpose = r.purpose[:80] + "..." if len(r.purpose) > 80 else r.purpose
+            lines.append(f"   {purpose}")
+        lines.append(f"   Path: {r.path}")
+        lines.append("")
+    typer.echo("\n".join(lines))
+
 
 def main(
-    query: str,
+    query: str | None,
     top_k: int = 5,
     index_path: Path | None = None,
     json_output: bool = False,
+    persist: bool = False,
+    no_cache: bool = False,
 ) -> None:
     """Search for relevant skills.
 
@@ -26,42 +70,25 @@ def main(
         top_k: Number of results to return.
         index_path: Path to the skill index (default: ~/.skill-index/).
         json_output: Output results as JSON.
+        persist: Keep the index loaded and answer one query per stdin line
+            (after ``query``, if given) until EOF.
+        no_cache: Skip the on-disk query cache and always search the index.
     """
     from voyager.retrieval.index import SkillIndex
 
-    index = SkillIndex(index_path=index_path)
+    index = SkillIndex(index_path=index_path, disk_cache=not no_cache)
 
+    queries: list[str] = [query] if query else []
     try:
-        results = index.search(query, k=top_k)
-
-        if json_output:
-            output = [
-                {
-                    "skill_id": r.skill_id,
-                    "name": r.name,
-                    "purpose": r.purpose,
-                    "path": r.path,
-                    "score": r.score,
-                    "file_types": r.file_types,
-                    "capabilities": r.capabilities,
-                }
-                for r in results
-            ]
-            typer.echo(json_module.dumps(output, indent=2))
-        else:
-            if not results:
-                typer.echo(f'No skills found matching: "{query}"')
-                return
-
-            typer.echo(f'\nSkills matching: "{query}"\n')
-            for i, r in enumerate(results, 1):
-                typer.echo(f"{i}. {r.name} (score: {r.score:.3f})")
-                if r.purpose:
-                    # Truncate purpose to ~80 chars
-                    purpose = r.purpose[:80] + "..." if len(r.purpose) > 80 else r.purpose
-                    typer.echo(f"   {purpose}")
-                typer.echo(f"   Path: {r.path}")
-                typer.echo()
+        for q in queries:
+            _print_results(q, index.search(q, k=top_k), json_output)
+
+        if persist:
+            for line in sys.stdin:
+                q = line.strip()
+                if q:
+                    _print_results(q, index.search(q, k=top_k), json_output)
+                    sys.stdout.flush()
 
     except RuntimeError as e:
         typer.echo(str(e), err=True)
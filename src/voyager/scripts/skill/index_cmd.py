@@ -1,7 +1,7 @@
 """CLI for building the skill search index.
 
 Usage:
-    voyager skill index [--paths PATH...] [--output DIR] [--rebuild] [-v]
+    voyager skill index [--paths PATH...] [--output DIR] [--rebuild] [--embed-batch-size N] [-v]
     skill-index [options]  # shortcut
 """
 
@@ -18,6 +18,7 @@ def main(
     rebuild: bool = False,
     skip_llm: bool = False,
     verbose: bool = False,
+    embed_batch_size: int | None = None,
 ) -> None:
     """Build or update the skill search index.
 
@@ -33,8 +34,9 @@ def main(
         rebuild: Force rebuild the index from scratch.
         skip_llm: Skip LLM analysis (faster but lower quality).
         verbose: Print progress information.
+        embed_batch_size: Documents per ColBERT encoder batch (default: 32).
     """
-    from voyager.retrieval.index import SkillIndex
+    from voyager.retrieval.index import DEFAULT_EMBED_BATCH_SIZE, SkillIndex
 
     index = SkillIndex(index_path=output)
 
@@ -49,6 +51,7 @@ def main(
             force=rebuild,
             skip_llm=skip_llm,
             verbose=verbose,
+            embed_batch_size=embed_batch_size or DEFAULT_EMBED_BATCH_SIZE,
         )
 
         if count > 0: